@@ -0,0 +1,314 @@
+"""Latency and throughput benchmarks for the Chatterbox TTS integration.
+
+Drives ChatterboxTTSEntity.async_get_tts_audio against the local stand-in
+server in benchmarks/fake_server.py and reports p50/p95/p99 latency,
+throughput, model swaps, server lock wait time and audio size for a few
+workloads:
+
+    single  every request uses the same model
+    mixed   requests alternate between two models
+    burst   bursts of simultaneous requests with a random model mix
+
+Run from the repository root with Home Assistant installed in the venv:
+
+    python -m benchmarks.bench --workload all --requests 60 --swap-delay 0.5
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+import json
+import random
+import tempfile
+import time
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.chatterbox_tts.const import (
+    DOMAIN,
+    CONF_URL,
+    CONF_VOICE_MODE,
+    CONF_REFERENCE_AUDIO,
+    CONF_MODEL_TYPE,
+    CONF_FAIRNESS_WINDOW,
+    CONF_AUDIO_CACHE,
+    CONF_OUTPUT_FORMAT,
+    CONF_CHUNK_SIZE,
+    OUTPUT_FORMATS,
+)
+from custom_components.chatterbox_tts.server import (
+    async_release_server_entry,
+    register_server_entry,
+)
+from custom_components.chatterbox_tts.tts import ChatterboxTTSEntity
+
+from .fake_server import FakeChatterboxServer, FakeServerConfig
+
+MODELS = ("chatterbox", "chatterbox-turbo")
+
+WORDS = (
+    "the front door has been opened and the hallway lights are on while the "
+    "washer finished its cycle and the weather tomorrow looks mostly sunny"
+).split()
+
+
+class TimedLock(asyncio.Lock):
+    """asyncio.Lock that records how long each acquire waited."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.waits: list[float] = []
+
+    async def acquire(self) -> bool:
+        start = time.perf_counter()
+        result = await super().acquire()
+        self.waits.append(time.perf_counter() - start)
+        return result
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Linear-interpolated percentile of ``values`` (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def make_text(rng: random.Random, index: int, min_words: int = 4, max_words: int = 30) -> str:
+    """Build a unique announcement-like sentence."""
+    words = rng.choices(WORDS, k=rng.randint(min_words, max_words))
+    return f"Message {index}: {' '.join(words)}."
+
+
+@dataclass
+class BenchResult:
+    """Measurements from one workload run."""
+
+    workload: str
+    latencies: list[float] = field(default_factory=list)
+    failures: int = 0
+    wall_seconds: float = 0.0
+    swaps: int = 0
+    lock_waits: list[float] = field(default_factory=list)
+    server_busy_seconds: float = 0.0
+    audio_bytes: int = 0
+
+    def summary(self) -> dict[str, float | int | str]:
+        """Aggregate the run into the numbers printed in the report."""
+        done = len(self.latencies)
+        return {
+            "workload": self.workload,
+            "requests": done + self.failures,
+            "failures": self.failures,
+            "p50_ms": round(percentile(self.latencies, 50) * 1000, 1),
+            "p95_ms": round(percentile(self.latencies, 95) * 1000, 1),
+            "p99_ms": round(percentile(self.latencies, 99) * 1000, 1),
+            "throughput_rps": round(done / self.wall_seconds, 2) if self.wall_seconds else 0.0,
+            "swaps": self.swaps,
+            "lock_acquires": len(self.lock_waits),
+            "lock_wait_total_ms": round(sum(self.lock_waits) * 1000, 1),
+            "lock_wait_max_ms": round(max(self.lock_waits, default=0.0) * 1000, 1),
+            "server_utilisation": (
+                round(self.server_busy_seconds / self.wall_seconds, 2) if self.wall_seconds else 0.0
+            ),
+            "audio_kb": round(self.audio_bytes / 1024, 1),
+        }
+
+
+class BenchHarness:
+    """A Home Assistant core, a stand-in server and one entity per model."""
+
+    def __init__(self, server_config: FakeServerConfig, entity_options: dict | None = None) -> None:
+        self.server = FakeChatterboxServer(server_config, seed=0)
+        self.entity_options = entity_options or {}
+        self.hass: HomeAssistant | None = None
+        self.lock = TimedLock()
+        self.entities: dict[str, ChatterboxTTSEntity] = {}
+
+    async def __aenter__(self) -> BenchHarness:
+        url = await self.server.start()
+        self.hass = HomeAssistant(tempfile.mkdtemp(prefix="chatterbox_bench_"))
+        # Pre-seed the per-server lock so every acquire is timed
+        self.hass.data.setdefault(DOMAIN, {}).setdefault("server_locks", {})[url] = self.lock
+        for model in MODELS:
+            entry_id = f"bench_{model}"
+            data = {
+                CONF_URL: url,
+                CONF_VOICE_MODE: "clone",
+                CONF_REFERENCE_AUDIO: self.server.config.voices[0],
+                CONF_MODEL_TYPE: model,
+            }
+            options = {CONF_AUDIO_CACHE: False, **self.entity_options}
+            register_server_entry(self.hass, url, entry_id)
+            self.entities[model] = ChatterboxTTSEntity(
+                self.hass, data, options, entry_id, f"chatterbox_{model.replace('-', '_')}"
+            )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        for model in self.entities:
+            await async_release_server_entry(self.hass, f"bench_{model}")
+        await self.server.stop()
+
+    async def request(self, result: BenchResult, model: str, text: str) -> None:
+        """Issue one TTS request and record its latency or failure."""
+        start = time.perf_counter()
+        _, audio = await self.entities[model].async_get_tts_audio(text, "en")
+        if audio is None:
+            result.failures += 1
+        else:
+            result.latencies.append(time.perf_counter() - start)
+            result.audio_bytes += len(audio)
+
+    def finish(self, result: BenchResult, started: float) -> BenchResult:
+        """Fill in the server-side counters once a workload has drained."""
+        result.wall_seconds = time.perf_counter() - started
+        result.swaps = self.server.stats.swaps
+        result.lock_waits = list(self.lock.waits)
+        result.server_busy_seconds = self.server.stats.busy_seconds
+        return result
+
+
+async def _closed_loop(
+    harness: BenchHarness,
+    result: BenchResult,
+    jobs: list[tuple[str, str]],
+    concurrency: int,
+) -> None:
+    """Run jobs with a fixed number of concurrent callers."""
+    queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue()
+    for job in jobs:
+        queue.put_nowait(job)
+
+    async def _worker() -> None:
+        while not queue.empty():
+            model, text = queue.get_nowait()
+            await harness.request(result, model, text)
+
+    await asyncio.gather(*(_worker() for _ in range(concurrency)))
+
+
+async def run_single(harness: BenchHarness, args: argparse.Namespace) -> BenchResult:
+    """Every request uses the first model."""
+    rng = random.Random(1)
+    result = BenchResult("single")
+    jobs = [(MODELS[0], make_text(rng, i)) for i in range(args.requests)]
+    started = time.perf_counter()
+    await _closed_loop(harness, result, jobs, args.concurrency)
+    return harness.finish(result, started)
+
+
+async def run_mixed(harness: BenchHarness, args: argparse.Namespace) -> BenchResult:
+    """Requests alternate between two models."""
+    rng = random.Random(2)
+    result = BenchResult("mixed")
+    jobs = [(MODELS[i % 2], make_text(rng, i)) for i in range(args.requests)]
+    started = time.perf_counter()
+    await _closed_loop(harness, result, jobs, args.concurrency)
+    return harness.finish(result, started)
+
+
+async def run_burst(harness: BenchHarness, args: argparse.Namespace) -> BenchResult:
+    """Bursts of simultaneous requests with a random model mix."""
+    rng = random.Random(3)
+    result = BenchResult("burst")
+    started = time.perf_counter()
+    index = 0
+    for burst in range(max(1, args.requests // args.burst_size)):
+        if burst:
+            await asyncio.sleep(args.burst_gap)
+        calls = []
+        for _ in range(args.burst_size):
+            calls.append(harness.request(result, rng.choice(MODELS), make_text(rng, index)))
+            index += 1
+        await asyncio.gather(*calls)
+    return harness.finish(result, started)
+
+
+WORKLOADS: dict[str, Callable[[BenchHarness, argparse.Namespace], Awaitable[BenchResult]]] = {
+    "single": run_single,
+    "mixed": run_mixed,
+    "burst": run_burst,
+}
+
+
+def print_report(summaries: list[dict]) -> None:
+    """Print summaries as an aligned table."""
+    columns = list(summaries[0])
+    widths = {c: max(len(c), *(len(str(s[c])) for s in summaries)) for c in columns}
+    print("  ".join(c.rjust(widths[c]) for c in columns))
+    for summary in summaries:
+        print("  ".join(str(summary[c]).rjust(widths[c]) for c in columns))
+
+
+def add_server_arguments(parser: argparse.ArgumentParser) -> None:
+    """Stand-in server options shared by the benchmark entry points."""
+    parser.add_argument("--synth-delay", type=float, default=0.05, help="Base synthesis delay (s)")
+    parser.add_argument("--swap-delay", type=float, default=0.5, help="Hot-swap delay (s)")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--encode-delay", type=float, default=0.0005, help="MP3/Opus encode delay per char (s)"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command-line options for the synthetic workloads."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workload", default="all", choices=["all", *WORKLOADS])
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--burst-size", type=int, default=10)
+    parser.add_argument("--burst-gap", type=float, default=0.5)
+    add_server_arguments(parser)
+    parser.add_argument("--fairness-window", type=float, default=None)
+    parser.add_argument("--output-format", choices=list(OUTPUT_FORMATS), default=None)
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument("--json", metavar="PATH", help="Also write the summaries as JSON")
+    return parser
+
+
+def server_config(args: argparse.Namespace) -> FakeServerConfig:
+    """Stand-in server settings from the command line."""
+    return FakeServerConfig(
+        synth_base_delay=args.synth_delay,
+        encode_delay_per_char=args.encode_delay,
+        swap_delay=args.swap_delay,
+        failure_rate=args.failure_rate,
+        timeout_rate=args.timeout_rate,
+    )
+
+
+async def _main(args: argparse.Namespace) -> list[dict]:
+    names = list(WORKLOADS) if args.workload == "all" else [args.workload]
+    options = {}
+    if args.fairness_window is not None:
+        options[CONF_FAIRNESS_WINDOW] = args.fairness_window
+    if args.output_format is not None:
+        options[CONF_OUTPUT_FORMAT] = args.output_format
+    if args.chunk_size is not None:
+        options[CONF_CHUNK_SIZE] = args.chunk_size
+    summaries = []
+    for name in names:
+        async with BenchHarness(server_config(args), options) as harness:
+            result = await WORKLOADS[name](harness, args)
+        summaries.append(result.summary())
+    return summaries
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    summaries = asyncio.run(_main(args))
+    print_report(summaries)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(summaries, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
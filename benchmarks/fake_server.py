@@ -0,0 +1,217 @@
+"""Local stand-in for Chatterbox-TTS-Server used by the benchmarks.
+
+Implements the endpoints the integration talks to, with configurable
+synthesis delay, encode delay, hot-swap delay and failure rates, and returns
+silent audio sized to the text: well-formed MP3 or WAV, or a placeholder Ogg
+payload for Opus. Runs offline on CPU only.
+
+Run standalone to point a development Home Assistant at it:
+
+    python -m benchmarks.fake_server --port 8004 --swap-delay 5
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import random
+import struct
+
+from aiohttp import web
+
+# Server model type strings keyed by the save_settings repo_id selector
+_SELECTOR_TO_TYPE = {
+    "chatterbox": "original",
+    "chatterbox-turbo": "turbo",
+    "chatterbox-multilingual": "multilingual",
+}
+
+# MPEG-1 Layer III, 128 kbit/s, 44.1 kHz, no padding: 417-byte frames of
+# 1152 samples (~26 ms). All-zero side info and main data decode as silence.
+_MP3_FRAME = b"\xff\xfb\x90\x64" + bytes(413)
+_MP3_FRAME_SECONDS = 1152 / 44100
+_WAV_RATE = 24000
+
+# Rough speaking rate used to size the returned audio
+_SECONDS_PER_CHAR = 0.06
+
+
+@dataclass
+class FakeServerConfig:
+    """Behaviour knobs for the stand-in server."""
+
+    model: str = "original"
+    synth_base_delay: float = 0.05
+    synth_delay_per_char: float = 0.002
+    # Extra time to encode MP3 or Opus; WAV is returned as-is
+    encode_delay_per_char: float = 0.0005
+    swap_delay: float = 1.0
+    failure_rate: float = 0.0
+    timeout_rate: float = 0.0
+    hang_seconds: float = 300.0
+    voices: list[str] = field(default_factory=lambda: ["Gianna.wav", "Rogan.wav"])
+
+
+@dataclass
+class FakeServerStats:
+    """Counters the benchmarks read back after a run."""
+
+    model_info: int = 0
+    swaps: int = 0
+    tts: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    chars: int = 0
+    busy_seconds: float = 0.0
+
+
+def silent_audio(text: str, output_format: str) -> bytes:
+    """Return silent audio roughly as long as ``text`` would take to speak."""
+    seconds = max(0.2, len(text) * _SECONDS_PER_CHAR)
+    if output_format == "wav":
+        frames = int(seconds * _WAV_RATE)
+        data_size = frames * 2
+        header = b"RIFF" + struct.pack("<I", 36 + data_size) + b"WAVE"
+        header += b"fmt " + struct.pack("<IHHIIHH", 16, 1, 1, _WAV_RATE, _WAV_RATE * 2, 2, 16)
+        header += b"data" + struct.pack("<I", data_size)
+        return header + bytes(data_size)
+    if output_format == "opus":
+        # Not decodable, but about the size of 24 kbit/s Opus in Ogg
+        return b"OggS" + bytes(max(1, int(seconds * 3000)))
+    return _MP3_FRAME * max(1, int(seconds / _MP3_FRAME_SECONDS))
+
+
+class FakeChatterboxServer:
+    """aiohttp application emulating the Chatterbox-TTS-Server HTTP API.
+
+    Synthesis is serialised like a single GPU; a hot-swap blocks synthesis
+    for ``swap_delay`` seconds.
+    """
+
+    def __init__(self, config: FakeServerConfig | None = None, seed: int | None = None) -> None:
+        self.config = config or FakeServerConfig()
+        self.stats = FakeServerStats()
+        self.model = self.config.model
+        self._pending_model = self.model
+        self._gpu = asyncio.Lock()
+        self._random = random.Random(seed)
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+        self.app = web.Application()
+        self.app.router.add_get("/api/model-info", self._model_info)
+        self.app.router.add_post("/save_settings", self._save_settings)
+        self.app.router.add_post("/restart_server", self._restart_server)
+        self.app.router.add_post("/tts", self._tts)
+        self.app.router.add_get("/get_reference_files", self._reference_files)
+        self.app.router.add_get("/get_predefined_voices", self._predefined_voices)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the base URL."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://{host}:{port}"
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _maybe_fail(self) -> web.Response | None:
+        """Inject a configured failure or hang."""
+        roll = self._random.random()
+        if roll < self.config.timeout_rate:
+            self.stats.timeouts += 1
+            await asyncio.sleep(self.config.hang_seconds)
+        elif roll < self.config.timeout_rate + self.config.failure_rate:
+            self.stats.failures += 1
+            return web.Response(status=500, text="Injected failure")
+        return None
+
+    async def _model_info(self, request: web.Request) -> web.Response:
+        self.stats.model_info += 1
+        return web.json_response({"type": self.model, "loaded": True})
+
+    async def _save_settings(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        selector = body.get("model", {}).get("repo_id")
+        if selector not in _SELECTOR_TO_TYPE:
+            return web.Response(status=400, text=f"Unknown model {selector!r}")
+        self._pending_model = _SELECTOR_TO_TYPE[selector]
+        return web.json_response({"message": "Settings saved"})
+
+    async def _restart_server(self, request: web.Request) -> web.Response:
+        async with self._gpu:
+            if self._pending_model != self.model:
+                await asyncio.sleep(self.config.swap_delay)
+                self.model = self._pending_model
+                self.stats.swaps += 1
+        return web.json_response({"message": "Engine restarted"})
+
+    async def _tts(self, request: web.Request) -> web.StreamResponse:
+        payload = await request.json()
+        if failure := await self._maybe_fail():
+            return failure
+        text = payload.get("text", "")
+        if not text:
+            return web.Response(status=400, text="Empty text")
+        async with self._gpu:
+            delay = self.config.synth_base_delay + len(text) * self.config.synth_delay_per_char
+            await asyncio.sleep(delay)
+            self.stats.busy_seconds += delay
+        output_format = payload.get("output_format", "mp3")
+        if output_format != "wav":
+            await asyncio.sleep(len(text) * self.config.encode_delay_per_char)
+        self.stats.tts += 1
+        self.stats.chars += len(text)
+        content_type = {"wav": "audio/wav", "opus": "audio/ogg"}.get(output_format, "audio/mpeg")
+        return web.Response(body=silent_audio(text, output_format), content_type=content_type)
+
+    async def _reference_files(self, request: web.Request) -> web.Response:
+        return web.json_response(self.config.voices)
+
+    async def _predefined_voices(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            [{"filename": v, "display_name": v.rsplit(".", 1)[0]} for v in self.config.voices]
+        )
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    server = FakeChatterboxServer(
+        FakeServerConfig(
+            model=args.model,
+            synth_base_delay=args.synth_delay,
+            swap_delay=args.swap_delay,
+            failure_rate=args.failure_rate,
+            timeout_rate=args.timeout_rate,
+        )
+    )
+    url = await server.start(args.host, args.port)
+    print(f"Fake Chatterbox server listening on {url} (model={server.model})")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8004)
+    parser.add_argument("--model", default="original", choices=sorted(_SELECTOR_TO_TYPE.values()))
+    parser.add_argument("--synth-delay", type=float, default=0.05)
+    parser.add_argument("--swap-delay", type=float, default=1.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
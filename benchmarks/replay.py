@@ -0,0 +1,198 @@
+"""Replay a recorded request trace against local stand-in Chatterbox servers.
+
+Reads the JSON Lines trace written when an entity has **Record Request
+Trace** enabled, recreates one entity per traced entity and model, and fires
+each request at its recorded offset, optionally sped up. Messages are
+replaced by synthetic text of the same length; repeated messages stay
+repeated. Prints recorded and replayed latency, failures and swaps side by
+side, so the effect of more servers or different settings on real load can
+be measured before changing hardware.
+
+Run from the repository root with Home Assistant installed in the venv:
+
+    python -m benchmarks.replay chatterbox_tts_trace.jsonl --speed 10 --servers 2
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import json
+import random
+import tempfile
+import time
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.chatterbox_tts.const import (
+    CONF_URL,
+    CONF_ADDITIONAL_URLS,
+    CONF_VOICE_MODE,
+    CONF_REFERENCE_AUDIO,
+    CONF_MODEL_TYPE,
+    CONF_FAIRNESS_WINDOW,
+    CONF_AUDIO_CACHE,
+)
+from custom_components.chatterbox_tts.metrics import get_server_metrics
+from custom_components.chatterbox_tts.server import (
+    async_release_server_entry,
+    register_server_entry,
+)
+from custom_components.chatterbox_tts.tts import ChatterboxTTSEntity
+
+from .bench import WORDS, add_server_arguments, percentile, print_report, server_config
+from .fake_server import FakeChatterboxServer
+
+
+def load_trace(path: str) -> list[dict]:
+    """Read trace records, oldest first, skipping lines that don't parse."""
+    records = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and {"ts", "entity", "model", "chars"} <= record.keys():
+                records.append(record)
+    return sorted(records, key=lambda record: record["ts"])
+
+
+def synthetic_text(chars: int, fingerprint: str) -> str:
+    """Text of about ``chars`` characters; the same fingerprint gives the same text."""
+    rng = random.Random(fingerprint)
+    words: list[str] = []
+    length = 0
+    while length < chars:
+        word = rng.choice(WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)[: max(1, chars)]
+
+
+@dataclass
+class ReplayResult:
+    """Latencies and outcomes of a recorded or replayed trace."""
+
+    label: str
+    latencies: list[float] = field(default_factory=list)
+    failures: int = 0
+    swaps: int = 0
+    wall_seconds: float = 0.0
+
+    def summary(self) -> dict[str, float | int | str]:
+        """Aggregate into the numbers printed in the report."""
+        done = len(self.latencies)
+        return {
+            "run": self.label,
+            "requests": done + self.failures,
+            "failures": self.failures,
+            "p50_ms": round(percentile(self.latencies, 50) * 1000, 1),
+            "p95_ms": round(percentile(self.latencies, 95) * 1000, 1),
+            "p99_ms": round(percentile(self.latencies, 99) * 1000, 1),
+            "max_ms": round(max(self.latencies, default=0.0) * 1000, 1),
+            "swaps": self.swaps,
+            "wall_s": round(self.wall_seconds, 1),
+        }
+
+
+def recorded_result(records: list[dict]) -> ReplayResult:
+    """What the trace itself says happened.
+
+    Recorded swaps count requests that swapped a model themselves; one
+    that swapped several servers of a pool counts once.
+    """
+    result = ReplayResult("recorded")
+    for record in records:
+        if record.get("outcome") == "ok":
+            result.latencies.append(record.get("latency", 0.0))
+        else:
+            result.failures += 1
+        result.swaps += bool(record.get("swapped"))
+    if records:
+        result.wall_seconds = records[-1]["ts"] - records[0]["ts"]
+    return result
+
+
+async def replay(records: list[dict], args: argparse.Namespace) -> ReplayResult:
+    """Fire the trace at stand-in servers and measure what happens."""
+    servers = [FakeChatterboxServer(server_config(args), seed=i) for i in range(args.servers)]
+    urls = [await server.start() for server in servers]
+    hass = HomeAssistant(tempfile.mkdtemp(prefix="chatterbox_replay_"))
+    entities: dict[tuple[str, str], ChatterboxTTSEntity] = {}
+    for entity_id, model in dict.fromkeys((r["entity"], r["model"]) for r in records):
+        entry_id = f"replay_{len(entities)}"
+        data = {
+            CONF_URL: urls[0],
+            CONF_VOICE_MODE: "clone",
+            CONF_REFERENCE_AUDIO: servers[0].config.voices[0],
+            CONF_MODEL_TYPE: model,
+        }
+        options = {CONF_ADDITIONAL_URLS: urls[1:], CONF_AUDIO_CACHE: args.cache}
+        if args.fairness_window is not None:
+            options[CONF_FAIRNESS_WINDOW] = args.fairness_window
+        for url in urls:
+            register_server_entry(hass, url, entry_id)
+        unique_id = f"{str(entity_id).removeprefix('tts.')}_{model.replace('-', '_')}"
+        entities[(entity_id, model)] = ChatterboxTTSEntity(hass, data, options, entry_id, unique_id)
+
+    result = ReplayResult(f"replay x{args.speed:g}, {args.servers} server(s)")
+
+    async def _request(record: dict) -> None:
+        entity = entities[(record["entity"], record["model"])]
+        text = synthetic_text(record["chars"], record.get("text") or str(record["ts"]))
+        start = time.perf_counter()
+        _, audio = await entity.async_get_tts_audio(
+            text, record.get("language") or "en", record.get("options") or {}
+        )
+        if audio is None:
+            result.failures += 1
+        else:
+            result.latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    first = records[0]["ts"]
+    tasks = []
+    for record in records:
+        delay = (record["ts"] - first) / args.speed - (time.perf_counter() - started)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(_request(record)))
+    await asyncio.gather(*tasks)
+    result.wall_seconds = time.perf_counter() - started
+    result.swaps = sum(get_server_metrics(hass, url).swaps for url in urls)
+
+    for index in range(len(entities)):
+        await async_release_server_entry(hass, f"replay_{index}")
+    for server in servers:
+        await server.stop()
+    return result
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command-line options for the replay tool."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("trace", help="Trace file written by Record Request Trace")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed-up factor")
+    parser.add_argument("--servers", type=int, default=1, help="Stand-in servers in the pool")
+    parser.add_argument("--cache", action="store_true", help="Enable the audio cache")
+    parser.add_argument("--fairness-window", type=float, default=None)
+    add_server_arguments(parser)
+    parser.add_argument("--json", metavar="PATH", help="Also write the summaries as JSON")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    records = load_trace(args.trace)
+    if not records:
+        raise SystemExit(f"No trace records in {args.trace}")
+    summaries = [recorded_result(records).summary(), asyncio.run(replay(records, args)).summary()]
+    print_report(summaries)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(summaries, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
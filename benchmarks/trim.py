@@ -0,0 +1,142 @@
+"""CPU cost of trimming leading and trailing silence from returned clips.
+
+Builds MP3 and WAV clips shaped like Chatterbox output, speech with padding
+silence at both ends, and times trim_silence on each. Reports the time per
+clip, the time per second of audio and how much silence was cut, for clip
+lengths from a short announcement to a long read-out. Trimming runs in the
+executor, so this is CPU taken from the executor pool, not the event loop.
+
+Run from the repository root with Home Assistant installed in the venv:
+
+    python -m benchmarks.trim --speech 2 10 60 --repeat 50
+"""
+from __future__ import annotations
+
+import argparse
+from array import array
+import json
+import math
+import random
+import statistics
+import sys
+import time
+
+from custom_components.chatterbox_tts.audio import trim_silence
+
+from .bench import print_report
+
+# MPEG-1 Layer III, 128 kbit/s, 44.1 kHz, mono, no padding: 417-byte frames
+# of 1152 samples
+_MP3_HEADER = b"\xff\xfb\x90\xc4"
+_MP3_FRAME_BYTES = 417
+_MP3_FRAME_SECONDS = 1152 / 44100
+_MP3_SIDE_INFO_BYTES = 17
+_WAV_RATE = 24000
+
+
+def _mp3_frame(rng: random.Random, audible: bool) -> bytes:
+    """One mono frame; audible frames carry spectral values in both granules."""
+    side = 0
+    if audible:
+        # main_data_begin 0, private bits and scfsi, then per granule
+        # part2_3_length and big_values; the rest of each granule stays zero
+        for granule in range(2):
+            position = 18 + granule * 59
+            side |= 2000 << (136 - position - 12)
+            side |= 200 << (136 - position - 21)
+    body = _MP3_FRAME_BYTES - 4 - _MP3_SIDE_INFO_BYTES
+    main_data = rng.randbytes(body) if audible else bytes(body)
+    return _MP3_HEADER + side.to_bytes(_MP3_SIDE_INFO_BYTES, "big") + main_data
+
+
+def mp3_clip(lead: float, speech: float, tail: float, seed: int = 0) -> bytes:
+    """An MP3 clip of silent, audible and silent frames."""
+    rng = random.Random(seed)
+    silent = _mp3_frame(rng, False)
+    frames = [silent] * round(lead / _MP3_FRAME_SECONDS)
+    frames += [_mp3_frame(rng, True) for _ in range(round(speech / _MP3_FRAME_SECONDS))]
+    frames += [silent] * round(tail / _MP3_FRAME_SECONDS)
+    return b"".join(frames)
+
+
+def wav_clip(lead: float, speech: float, tail: float) -> bytes:
+    """A 16-bit mono WAV clip of low noise, a warbling tone and low noise."""
+    rng = random.Random(0)
+    samples = array("h", (rng.randint(-20, 20) for _ in range(int(lead * _WAV_RATE))))
+    samples.extend(
+        int(9000 * math.sin(2 * math.pi * (180 + 40 * math.sin(i / 800)) * i / _WAV_RATE))
+        for i in range(int(speech * _WAV_RATE))
+    )
+    samples.extend(rng.randint(-20, 20) for _ in range(int(tail * _WAV_RATE)))
+    if sys.byteorder == "big":
+        samples.byteswap()
+    pcm = samples.tobytes()
+    fmt = (
+        (1).to_bytes(2, "little") + (1).to_bytes(2, "little")
+        + _WAV_RATE.to_bytes(4, "little") + (_WAV_RATE * 2).to_bytes(4, "little")
+        + (2).to_bytes(2, "little") + (16).to_bytes(2, "little")
+    )
+    return (
+        b"RIFF" + (36 + len(pcm)).to_bytes(4, "little") + b"WAVE"
+        + b"fmt " + len(fmt).to_bytes(4, "little") + fmt
+        + b"data" + len(pcm).to_bytes(4, "little") + pcm
+    )
+
+
+def _seconds(extension: str, audio: bytes) -> float:
+    if extension == "mp3":
+        return len(audio) // _MP3_FRAME_BYTES * _MP3_FRAME_SECONDS
+    return (len(audio) - 44) / 2 / _WAV_RATE
+
+
+def measure(extension: str, audio: bytes, repeat: int) -> dict[str, float | int | str]:
+    """Time trim_silence on one clip."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        trimmed = trim_silence(extension, audio)
+        timings.append(time.perf_counter() - start)
+    seconds = _seconds(extension, audio)
+    median = statistics.median(timings)
+    return {
+        "format": extension,
+        "audio_s": round(seconds, 1),
+        "kb": round(len(audio) / 1024, 1),
+        "p50_ms": round(median * 1000, 3),
+        "max_ms": round(max(timings) * 1000, 3),
+        "us_per_audio_s": round(median * 1e6 / seconds, 1),
+        "trimmed_ms": round((seconds - _seconds(extension, trimmed)) * 1000),
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command-line options for the trimming benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--speech", type=float, nargs="+", default=[2.0, 10.0, 60.0], help="Seconds of speech per clip"
+    )
+    parser.add_argument("--lead", type=float, default=0.4, help="Leading silence (s)")
+    parser.add_argument("--tail", type=float, default=0.6, help="Trailing silence (s)")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per clip")
+    parser.add_argument("--json", metavar="PATH", help="Also write the summaries as JSON")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    summaries = []
+    for speech in args.speech:
+        summaries.append(measure("mp3", mp3_clip(args.lead, speech, args.tail), args.repeat))
+        summaries.append(measure("wav", wav_clip(args.lead, speech, args.tail), args.repeat))
+    # Worst case: nothing audible, so every frame is inspected for nothing
+    silent = max(args.speech) + args.lead + args.tail
+    summaries.append(measure("mp3", mp3_clip(silent, 0, 0), args.repeat))
+    summaries.append(measure("wav", wav_clip(silent, 0, 0), args.repeat))
+    print_report(summaries)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(summaries, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
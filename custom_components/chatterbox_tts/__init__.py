@@ -4,10 +4,25 @@ from __future__ import annotations
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-PLATFORMS = ["tts"]
+from .coordinator import get_server_coordinator
+from .server import (
+    async_release_server_entry,
+    get_entry_urls,
+    register_server_entry,
+)
+from .sensor import async_hand_over_servers
+
+PLATFORMS = ["tts", "sensor"]
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Chatterbox TTS from a config entry."""
+    for url in get_entry_urls({**entry.data, **entry.options}):
+        register_server_entry(hass, url, entry.entry_id)
+        coordinator = get_server_coordinator(hass, url)
+        if coordinator.data is None:
+            # First entry for this server; an unreachable server only makes
+            # the entity unavailable until a later poll succeeds
+            await coordinator.async_check()
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     return True
@@ -18,4 +33,8 @@ async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
\ No newline at end of file
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        orphaned = await async_release_server_entry(hass, entry.entry_id)
+        async_hand_over_servers(hass, entry.entry_id, orphaned)
+    return unload_ok
@@ -0,0 +1,279 @@
+"""MP3 and WAV handling for Chatterbox TTS clips: joining and silence trimming.
+
+Everything works on whole MP3 frames and raw PCM, without decoding or
+re-encoding.
+"""
+from __future__ import annotations
+
+from array import array
+import math
+import sys
+
+# MPEG audio frame header tables: kbit/s by bitrate index for MPEG-1 and
+# MPEG-2/2.5 Layer III, and sample rates by version bits
+_MP3_BITRATES = {
+    True: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    False: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+# Silence kept before the first and after the last audible frame, so soft
+# onsets and decays are not clipped
+TRIM_PADDING_SECONDS = 0.04
+
+# WAV windows whose peak stays below this level (dBFS) count as silence
+_WAV_SILENCE_DBFS = -50
+_WAV_WINDOW_SECONDS = 0.01
+# Only every third sample is looked at; speech loud enough to keep shows up
+# in those just as well, for a third of the CPU time. Being odd, the stride
+# still covers both channels of stereo audio.
+_WAV_PEAK_STRIDE = 3
+# PCM array type codes and full-scale values by (WAV format tag, bits)
+_WAV_SAMPLE_TYPES = {(1, 16): ("h", 32768), (3, 32): ("f", 1.0)}
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# An MP3 granule counts as silence when its quantised spectrum has no value
+# beyond ±1 and takes fewer bits than this; decoding isn't needed to tell
+_MP3_SILENT_GRANULE_BITS = 100
+
+
+def _mp3_frame_length(header: bytes) -> int | None:
+    """Byte length of the MPEG Layer III frame starting with ``header``."""
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version = (header[1] >> 3) & 3
+    layer = (header[1] >> 1) & 3
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 3
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    mpeg1 = version == 3
+    bitrate = _MP3_BITRATES[mpeg1][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    return (144 if mpeg1 else 72) * bitrate // sample_rate + ((header[2] >> 1) & 1)
+
+
+def _mp3_frames(data: bytes) -> bytes:
+    """Strip ID3 tags and the Xing/Info header frame, leaving only audio frames.
+
+    The Xing frame holds the frame count of one piece, which would make some
+    players stop early once pieces are joined.
+    """
+    start, end = 0, len(data)
+    if data[:3] == b"ID3" and len(data) >= 10:
+        size = (data[6] & 0x7F) << 21 | (data[7] & 0x7F) << 14 | (data[8] & 0x7F) << 7 | data[9] & 0x7F
+        start = 10 + size + (10 if data[5] & 0x10 else 0)
+    if end - start >= 128 and data[end - 128:end - 125] == b"TAG":
+        end -= 128
+    length = _mp3_frame_length(data[start:start + 4])
+    if length and any(tag in data[start:start + length] for tag in (b"Xing", b"Info")):
+        start += length
+    return data[start:end]
+
+
+def _wav_chunks(data: bytes) -> dict[bytes, bytes] | None:
+    """Top-level chunks of a RIFF/WAVE file, or None if it isn't one."""
+    if data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return None
+    chunks = {}
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        size = int.from_bytes(data[offset + 4:offset + 8], "little")
+        if chunk_id == b"data":
+            # Streamed WAVs may carry a placeholder size; take what is there
+            size = min(size, len(data) - offset - 8)
+        chunks[chunk_id] = data[offset + 8:offset + 8 + size]
+        offset += 8 + size + (size & 1)
+    return chunks
+
+
+def _wav_file(fmt: bytes, pcm: bytes) -> bytes:
+    """A RIFF/WAVE file with just a ``fmt `` and a ``data`` chunk."""
+    return (
+        b"RIFF" + (4 + 8 + len(fmt) + 8 + len(pcm)).to_bytes(4, "little") + b"WAVE"
+        + b"fmt " + len(fmt).to_bytes(4, "little") + fmt
+        + b"data" + len(pcm).to_bytes(4, "little") + pcm
+    )
+
+
+def _mp3_silence(frames: bytes, seconds: float) -> bytes:
+    """Silent frames in the format of the first frame of ``frames``.
+
+    All-zero side info and main data decode as silence; the copy has CRC
+    protection and padding turned off so it needs no checksum.
+    """
+    if seconds <= 0 or len(frames) < 4:
+        return b""
+    header = bytes((frames[0], frames[1] | 0x01, frames[2] & ~0x02 & 0xFF, frames[3]))
+    if (length := _mp3_frame_length(header)) is None:
+        return b""
+    version = (header[1] >> 3) & 3
+    sample_rate = _MP3_SAMPLE_RATES[version][(header[2] >> 2) & 3]
+    samples = 1152 if version == 3 else 576
+    count = round(seconds * sample_rate / samples)
+    return (header + bytes(length - 4)) * count
+
+
+def _wav_silence(fmt: bytes, seconds: float) -> bytes:
+    """PCM silence for a WAV ``fmt `` chunk."""
+    if seconds <= 0 or len(fmt) < 16:
+        return b""
+    sample_rate = int.from_bytes(fmt[4:8], "little")
+    block_align = int.from_bytes(fmt[12:14], "little")
+    bits = int.from_bytes(fmt[14:16], "little")
+    # 8-bit PCM is unsigned, so its silence is the mid value
+    return (b"\x80" if bits == 8 else b"\x00") * (int(seconds * sample_rate) * block_align)
+
+
+def join_audio(extension: str, clips: list[bytes], gap: float = 0.0) -> bytes | None:
+    """Join clips of one format into a single clip, or None if they can't be.
+
+    ``gap`` seconds of silence go between clips for MP3 and WAV; chained
+    Ogg streams are joined as they are.
+    """
+    if extension == "mp3":
+        frames = [_mp3_frames(clip) for clip in clips]
+        return _mp3_silence(frames[0], gap).join(frames)
+    if extension == "wav":
+        parsed = [_wav_chunks(clip) for clip in clips]
+        if any(c is None or b"fmt " not in c or b"data" not in c for c in parsed):
+            return None
+        if any(c[b"fmt "] != parsed[0][b"fmt "] for c in parsed):
+            return None
+        fmt = parsed[0][b"fmt "]
+        return _wav_file(fmt, _wav_silence(fmt, gap).join(c[b"data"] for c in parsed))
+    # Ogg Opus: consecutive streams form a valid chained Ogg file
+    return b"".join(clips)
+
+
+def _mp3_side_info(frame: bytes) -> tuple[int, int, int, int]:
+    """(bit field, bit length, channels, main_data_begin) of a Layer III frame's side info."""
+    mpeg1 = (frame[1] >> 3) & 3 == 3
+    channels = 1 if frame[3] >> 6 == 3 else 2
+    # A 16-bit CRC follows the header when the protection bit is clear
+    offset = 4 if frame[1] & 1 else 6
+    size = (17 if channels == 1 else 32) if mpeg1 else (9 if channels == 1 else 17)
+    bits = int.from_bytes(frame[offset:offset + size], "big")
+    total = size * 8
+    main_data_begin = bits >> (total - (9 if mpeg1 else 8))
+    return bits, total, channels, main_data_begin
+
+
+def _mp3_frame_silent(frame: bytes) -> bool:
+    """Whether every granule of a Layer III frame is (near) silence."""
+    bits, total, channels, _ = _mp3_side_info(frame)
+    if (frame[1] >> 3) & 3 == 3:
+        # MPEG-1: main_data_begin, private bits and scfsi, then 2 granules
+        # of 59 bits per channel
+        start, step, granules = 9 + (5 if channels == 1 else 3) + 4 * channels, 59, 2
+    else:
+        # MPEG-2/2.5: one granule of 63 bits per channel
+        start, step, granules = 8 + (1 if channels == 1 else 2), 63, 1
+    for index in range(granules * channels):
+        position = start + index * step
+        part2_3_length = (bits >> (total - position - 12)) & 0xFFF
+        big_values = (bits >> (total - position - 21)) & 0x1FF
+        if big_values or part2_3_length >= _MP3_SILENT_GRANULE_BITS:
+            return False
+    return True
+
+
+def _trim_mp3(data: bytes, padding: float) -> bytes | None:
+    frames = _mp3_frames(data)
+    spans: list[tuple[int, int]] = []
+    position = 0
+    while position < len(frames):
+        length = _mp3_frame_length(frames[position:position + 4])
+        if length is None or position + length > len(frames):
+            # Free-format, Layer I/II or damaged audio: leave it alone
+            return None
+        spans.append((position, length))
+        position += length
+    if not spans:
+        return None
+
+    def silent(index: int) -> bool:
+        position, length = spans[index]
+        return _mp3_frame_silent(frames[position:position + length])
+
+    first = next((index for index in range(len(spans)) if not silent(index)), None)
+    if first is None:
+        return None
+    last = next(index for index in reversed(range(len(spans))) if not silent(index))
+    version = (frames[1] >> 3) & 3
+    samples = 1152 if version == 3 else 576
+    keep = math.ceil(padding * _MP3_SAMPLE_RATES[version][(frames[2] >> 2) & 3] / samples)
+    start = max(0, first - keep)
+    # The first audible frame may take its main data from the bit reservoir
+    # in the frames before it, which therefore have to stay. Header and side
+    # info take at most 38 bytes of each of those frames.
+    position, length = spans[first]
+    needed = _mp3_side_info(frames[position:position + length])[3]
+    while start > 0 and sum(spans[i][1] - 38 for i in range(start, first)) < needed:
+        start -= 1
+    end = min(len(spans), last + 1 + keep)
+    if start == 0 and end == len(spans):
+        return None
+    return frames[spans[start][0]:spans[end - 1][0] + spans[end - 1][1]]
+
+
+def _trim_wav(data: bytes, padding: float) -> bytes | None:
+    chunks = _wav_chunks(data)
+    if chunks is None or b"fmt " not in chunks or b"data" not in chunks:
+        return None
+    fmt = chunks[b"fmt "]
+    if len(fmt) < 16:
+        return None
+    format_tag = int.from_bytes(fmt[0:2], "little")
+    if format_tag == _WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+        format_tag = int.from_bytes(fmt[24:26], "little")
+    channels = int.from_bytes(fmt[2:4], "little")
+    sample_rate = int.from_bytes(fmt[4:8], "little")
+    bits = int.from_bytes(fmt[14:16], "little")
+    if (sample_type := _WAV_SAMPLE_TYPES.get((format_tag, bits))) is None or not channels:
+        return None
+    typecode, full_scale = sample_type
+    pcm = chunks[b"data"]
+    width = bits // 8
+    usable = len(pcm) - len(pcm) % (width * channels)
+    if sys.byteorder == "little":
+        samples = memoryview(pcm)[:usable].cast(typecode)
+    else:
+        samples = array(typecode, pcm[:usable])
+        samples.byteswap()
+    threshold = full_scale * 10 ** (_WAV_SILENCE_DBFS / 20)
+    window = max(1, int(sample_rate * _WAV_WINDOW_SECONDS)) * channels
+
+    def loud(index: int) -> bool:
+        chunk = samples[index:index + window:_WAV_PEAK_STRIDE]
+        return max(chunk) > threshold or -min(chunk) > threshold
+
+    windows = range(0, len(samples), window)
+    first = next((index for index in windows if loud(index)), None)
+    if first is None:
+        return None
+    last = next(index for index in reversed(windows) if loud(index))
+    keep = int(padding * sample_rate) * channels
+    start = max(0, first - keep)
+    end = min(len(samples), last + window + keep)
+    if start == 0 and end == len(samples):
+        return None
+    return _wav_file(fmt, pcm[start * width:end * width])
+
+
+def trim_silence(extension: str, audio: bytes, padding: float = TRIM_PADDING_SECONDS) -> bytes:
+    """Cut leading and trailing silence from an MP3 or WAV clip.
+
+    ``padding`` seconds of the silence are kept at each end. MP3 clips lose
+    whole frames, judged from their side info, and their tags; WAV clips
+    lose PCM samples quieter than -50 dBFS. Ogg Opus clips, clips that can't
+    be parsed and clips that are silent throughout come back unchanged.
+    """
+    if extension == "mp3":
+        trimmed = _trim_mp3(audio, padding)
+    elif extension == "wav":
+        trimmed = _trim_wav(audio, padding)
+    else:
+        trimmed = None
+    return audio if trimmed is None else trimmed
@@ -0,0 +1,155 @@
+"""Batch synthesis to media files for Chatterbox TTS."""
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import slugify
+
+from .const import (
+    ATTR_CONCURRENCY,
+    ATTR_FILENAME,
+    ATTR_ITEMS,
+    ATTR_MESSAGE,
+    ATTR_NAME,
+    ATTR_OPTIONS,
+    CONF_CHUNK_SIZE,
+    CONF_EXAGGERATION,
+    CONF_LANGUAGE,
+    CONF_LATENCY_BUDGET,
+    CONF_OUTPUT_FORMAT,
+    CONF_PRIORITY,
+    CONF_SPEED_FACTOR,
+    CONF_SUPERSEDE,
+    CONF_TEMPLATE,
+    DEFAULT_BATCH_CONCURRENCY,
+    EVENT_BATCH_PROGRESS,
+    OUTPUT_FORMATS,
+    PRIORITIES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Batches are written to <media>/chatterbox_tts/<name>/
+_BATCH_DIR = "chatterbox_tts"
+MANIFEST_FILENAME = "manifest.json"
+MAX_BATCH_CONCURRENCY = 8
+
+# Per-item options are checked up front, with the options flow's ranges, so
+# a bad value is rejected before the batch starts instead of mid-render
+_OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_EXAGGERATION): vol.All(vol.Coerce(float), vol.Range(min=0, max=2)),
+        vol.Optional(CONF_SPEED_FACTOR): vol.All(vol.Coerce(float), vol.Range(min=0.25, max=4)),
+        vol.Optional(CONF_CHUNK_SIZE): vol.All(vol.Coerce(int), vol.Range(min=50, max=1000)),
+        vol.Optional(CONF_LATENCY_BUDGET): vol.All(vol.Coerce(float), vol.Range(min=0, max=300)),
+        vol.Optional(CONF_LANGUAGE): cv.string,
+        vol.Optional(CONF_OUTPUT_FORMAT): vol.In(list(OUTPUT_FORMATS)),
+        vol.Optional(CONF_PRIORITY): vol.In(PRIORITIES),
+        vol.Optional(CONF_SUPERSEDE): cv.string,
+        vol.Optional(CONF_TEMPLATE): cv.string,
+    }
+)
+
+_ITEM_SCHEMA = vol.Any(
+    vol.Schema(
+        {
+            vol.Required(ATTR_MESSAGE): cv.string,
+            vol.Optional(ATTR_FILENAME): cv.string,
+            vol.Optional(ATTR_OPTIONS, default={}): _OPTIONS_SCHEMA,
+        }
+    ),
+    # A bare string is a message with default options
+    vol.All(cv.string, lambda message: {ATTR_MESSAGE: message, ATTR_OPTIONS: {}}),
+)
+
+BATCH_SERVICE_SCHEMA = {
+    vol.Required(ATTR_ITEMS): vol.All(cv.ensure_list, [_ITEM_SCHEMA], vol.Length(min=1)),
+    vol.Optional(ATTR_NAME): cv.string,
+    vol.Optional(ATTR_CONCURRENCY, default=DEFAULT_BATCH_CONCURRENCY): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=MAX_BATCH_CONCURRENCY)
+    ),
+}
+
+
+def batch_directory(hass: HomeAssistant, name: str) -> Path:
+    """Folder for a batch under the local media directory."""
+    media = hass.config.media_dirs.get("local") or hass.config.path("media")
+    return Path(media) / _BATCH_DIR / slugify(name)
+
+
+def item_filename(index: int, item: dict[str, Any], extension: str, used: set[str]) -> str:
+    """File name for one clip: the item's own name or its position and text."""
+    if item.get(ATTR_FILENAME):
+        stem = slugify(Path(item[ATTR_FILENAME]).stem)
+    else:
+        stem = f"{index + 1:03d}_{slugify(item[ATTR_MESSAGE])[:40]}".rstrip("_")
+    filename = f"{stem}.{extension}"
+    if filename in used:
+        filename = f"{stem}_{index + 1}.{extension}"
+    used.add(filename)
+    return filename
+
+
+def write_clip(path: Path, audio: bytes) -> None:
+    """Write one clip, creating the batch folder on first use."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(audio)
+
+
+def write_manifest(directory: Path, manifest: dict[str, Any]) -> None:
+    """Write the batch manifest next to its clips."""
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / MANIFEST_FILENAME).write_text(
+        json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8"
+    )
+
+
+class BatchProgress:
+    """Counts finished clips and announces progress on the event bus."""
+
+    def __init__(self, hass: HomeAssistant, entity_id: str, name: str, total: int) -> None:
+        self.hass = hass
+        self.entity_id = entity_id
+        self.name = name
+        self.total = total
+        self.done = 0
+        self.failed = 0
+        self.chars = 0
+        self.bytes = 0
+        self._started = time.monotonic()
+
+    @callback
+    def async_item_done(self, chars: int, size: int | None) -> None:
+        """Count one finished item (``size`` None if it failed) and fire a progress event."""
+        self.done += 1
+        if size is None:
+            self.failed += 1
+        else:
+            self.chars += chars
+            self.bytes += size
+        self.hass.bus.async_fire(EVENT_BATCH_PROGRESS, self.summary)
+        _LOGGER.debug("Batch %s: %d/%d done, %d failed", self.name, self.done, self.total, self.failed)
+
+    @property
+    def summary(self) -> dict[str, Any]:
+        """Progress and throughput so far."""
+        elapsed = time.monotonic() - self._started
+        return {
+            "entity_id": self.entity_id,
+            "name": self.name,
+            "total": self.total,
+            "done": self.done,
+            "failed": self.failed,
+            "bytes": self.bytes,
+            "elapsed_seconds": round(elapsed, 2),
+            "chars_per_second": round(self.chars / elapsed, 1) if elapsed else None,
+            "clips_per_minute": round(self.done * 60 / elapsed, 1) if elapsed else None,
+        }
@@ -0,0 +1,176 @@
+"""Persistent on-disk audio cache for Chatterbox TTS."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, DEFAULT_CACHE_MAX_MB
+
+_LOGGER = logging.getLogger(__name__)
+
+_CACHE_DIR = "chatterbox_tts_cache"
+
+
+def cache_key(model_type: str, payload: dict) -> str:
+    """Build a cache key from the model and the full /tts payload.
+
+    The payload already carries text, voice, voice mode, exaggeration, speed,
+    language and output settings, so any change to them is a different clip.
+    """
+    material = json.dumps({"model": model_type, **payload}, sort_keys=True)
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class AudioCache:
+    """Size-bounded LRU cache of synthesised clips stored under the config dir.
+
+    The index lives in memory and is rebuilt from the directory on load,
+    oldest-modified first. Hits refresh a file's modification time so LRU
+    order survives restarts.
+    """
+
+    def __init__(self, hass: HomeAssistant, directory: Path, max_bytes: int) -> None:
+        self.hass = hass
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._index: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        self._size = 0
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Cache counters for diagnostics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._index),
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+        }
+
+    async def async_load(self) -> None:
+        """Build the in-memory index from files already on disk."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            entries = await self.hass.async_add_executor_job(self._scan)
+            for key, extension, size in entries:
+                self._index[key] = (extension, size)
+                self._size += size
+            self._loaded = True
+            _LOGGER.debug(
+                "Audio cache loaded: %d clip(s), %d bytes in %s",
+                len(self._index), self._size, self.directory,
+            )
+        await self._async_evict()
+
+    def _scan(self) -> list[tuple[str, str, int]]:
+        """List cached clips as (key, extension, size), least recently used first."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        found = []
+        for path in self.directory.iterdir():
+            if not path.is_file() or path.suffix == ".tmp":
+                continue
+            stat = path.stat()
+            found.append((stat.st_mtime, path.stem, path.suffix.lstrip("."), stat.st_size))
+        found.sort()
+        return [(key, extension, size) for _, key, extension, size in found]
+
+    def _path(self, key: str, extension: str) -> Path:
+        return self.directory / f"{key}.{extension}"
+
+    async def async_get(self, key: str) -> tuple[str, bytes] | None:
+        """Return (extension, audio) for a cached clip, or None on a miss."""
+        entry = self._index.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        extension, _ = entry
+        path = self._path(key, extension)
+        try:
+            audio = await self.hass.async_add_executor_job(_read_and_touch, path)
+        except OSError as err:
+            _LOGGER.debug("Cached clip %s unreadable (%s), dropping it", path.name, err)
+            self._drop(key)
+            self.misses += 1
+            return None
+        self._index.move_to_end(key)
+        self.hits += 1
+        return extension, audio
+
+    async def async_put(self, key: str, extension: str, audio: bytes) -> None:
+        """Store a clip and evict least recently used clips over the size cap."""
+        if len(audio) > self.max_bytes:
+            return
+        path = self._path(key, extension)
+        try:
+            await self.hass.async_add_executor_job(_write_atomic, path, audio)
+        except OSError as err:
+            _LOGGER.warning("Could not write audio cache file %s: %s", path, err)
+            return
+        if key in self._index:
+            self._size -= self._index[key][1]
+        self._index[key] = (extension, len(audio))
+        self._index.move_to_end(key)
+        self._size += len(audio)
+        await self._async_evict()
+
+    def _drop(self, key: str) -> tuple[str, int] | None:
+        entry = self._index.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
+        return entry
+
+    async def _async_evict(self) -> None:
+        """Remove least recently used clips until the cache fits its cap."""
+        doomed: list[Path] = []
+        while self._size > self.max_bytes and self._index:
+            key = next(iter(self._index))
+            extension, _ = self._drop(key)
+            doomed.append(self._path(key, extension))
+        if doomed:
+            _LOGGER.debug("Evicting %d clip(s) from audio cache", len(doomed))
+            await self.hass.async_add_executor_job(_unlink_all, doomed)
+
+
+def _read_and_touch(path: Path) -> bytes:
+    data = path.read_bytes()
+    os.utime(path)
+    return data
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _unlink_all(paths: list[Path]) -> None:
+    for path in paths:
+        path.unlink(missing_ok=True)
+
+
+async def async_get_audio_cache(hass: HomeAssistant) -> AudioCache:
+    """Get the shared audio cache, creating and loading it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    cache: AudioCache | None = domain_data.get("audio_cache")
+    if cache is None:
+        cache = AudioCache(
+            hass,
+            Path(hass.config.path(_CACHE_DIR)),
+            DEFAULT_CACHE_MAX_MB * 1024 * 1024,
+        )
+        domain_data["audio_cache"] = cache
+    await cache.async_load()
+    return cache
@@ -1,97 +1,94 @@
 """Config flow for Chatterbox TTS"""
 from __future__ import annotations
 
+import asyncio
+from functools import partial
 import logging
 import re
-import aiohttp
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import selector
 
 from .const import (
     DOMAIN,
     CONF_URL,
+    CONF_ADDITIONAL_URLS,
     CONF_VOICE_MODE,
     CONF_REFERENCE_AUDIO,
     CONF_EXAGGERATION,
     CONF_SPEED_FACTOR,
     CONF_MODEL_TYPE,
     CONF_LANGUAGE,
+    CONF_FAIRNESS_WINDOW,
+    CONF_AUDIO_CACHE,
+    CONF_OUTPUT_FORMAT,
+    CONF_CHUNK_SIZE,
+    CONF_PREPOSITION_IDLE,
+    CONF_PARALLEL_LONG_MESSAGES,
+    CONF_MAX_CONCURRENT,
+    CONF_LATENCY_BUDGET,
+    CONF_QUIET_HOURS_START,
+    CONF_QUIET_HOURS_END,
+    CONF_RECORD_TRACE,
+    CONF_TEMPLATES,
+    CONF_WARM_UP,
+    CONF_TRIM_SILENCE,
     MODEL_TYPES,
+    OUTPUT_FORMATS,
     DEFAULT_MODEL_TYPE,
+    DEFAULT_FAIRNESS_WINDOW,
+    DEFAULT_OUTPUT_FORMAT,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_PREPOSITION_IDLE,
+    DEFAULT_QUIET_HOURS,
+    DEFAULT_MAX_CONCURRENT,
+    PRIORITY_NORMAL,
 )
+from .coordinator import POLL_TIMEOUT_SECONDS
+from .tts import async_load_model
+from .voices import get_voice_catalogue
 
 _LOGGER = logging.getLogger(__name__)
 
-# Timeout for API calls (seconds)
-API_TIMEOUT = aiohttp.ClientTimeout(total=15)
-# Model switching can take a while (loading weights into VRAM)
-MODEL_SWITCH_TIMEOUT = aiohttp.ClientTimeout(total=120)
-
-
-async def _fetch_current_model(url: str) -> str | None:
-    """Fetch the currently loaded model type from the server."""
-    try:
-        async with aiohttp.ClientSession(timeout=API_TIMEOUT) as session:
-            async with session.get(f"{url}/api/model-info") as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    _LOGGER.debug("model-info raw response: %s", data)
-                    model_type = data.get("type")
-                    _LOGGER.debug("model-info type field: %r", model_type)
-                    return model_type  # "original", "turbo", "multilingual"
-                else:
-                    body = await resp.text()
-                    _LOGGER.warning("model-info returned status %s: %s", resp.status, body)
-    except Exception as err:
-        _LOGGER.debug("Could not fetch model info: %s", err)
-    return None
-
-
-def _server_type_to_config(server_type: str | None) -> str:
-    """Map server model type string to config repo_id selector."""
-    mapping = {
-        "original": "chatterbox",
-        "turbo": "chatterbox-turbo",
-        "multilingual": "chatterbox-multilingual",
-    }
-    return mapping.get(server_type, DEFAULT_MODEL_TYPE)
-
-
-async def _switch_model(url: str, model_type: str) -> bool:
-    """Switch the server to a different model via save_settings + restart_server.
-
-    Returns True on success, False on failure.
+# How long a flow shows its progress step before moving on while the model
+# loads in the background. Outlasts the model-info check, so a server that
+# drops packets fails it in time, and catches a rejected setting, short of
+# waiting for the weights to load.
+_SWITCH_PROGRESS_SECONDS = POLL_TIMEOUT_SECONDS + 2
+
+
+def _async_start_model_switch(hass: HomeAssistant, url: str, model_type: str) -> asyncio.Task:
+    """Switch the server's model in the background through the shared scheduler and lock.
+
+    Returns the switch task, which resolves to True once the model is loaded.
+    A switch that isn't needed finishes straight away.
     """
-    save_payload = {"model": {"repo_id": model_type}}
-    _LOGGER.debug("Switching model to %r, save_settings payload: %s", model_type, save_payload)
-    try:
-        async with aiohttp.ClientSession(timeout=MODEL_SWITCH_TIMEOUT) as session:
-            # Step 1: Save the new model selector to config.yaml
-            async with session.post(
-                f"{url}/save_settings",
-                json=save_payload,
-            ) as resp:
-                body = await resp.text()
-                _LOGGER.debug("save_settings status=%s body=%s", resp.status, body)
-                if resp.status != 200:
-                    _LOGGER.error("Failed to save model setting (status %s): %s", resp.status, body)
-                    return False
-
-            # Step 2: Hot-swap the engine
-            async with session.post(f"{url}/restart_server") as resp:
-                body = await resp.text()
-                _LOGGER.debug("restart_server status=%s body=%s", resp.status, body)
-                if resp.status != 200:
-                    _LOGGER.error("Failed to hot-swap model (status %s): %s", resp.status, body)
-                    return False
-
-            _LOGGER.info("Successfully switched server model to %s", model_type)
-            return True
-    except Exception as err:
-        _LOGGER.error("Error switching model: %s", err)
+    task = hass.async_create_background_task(
+        async_load_model(hass, url, model_type, PRIORITY_NORMAL),
+        f"chatterbox_tts model switch {url}",
+    )
+    task.add_done_callback(partial(_log_switch_result, url, model_type))
+    return task
+
+
+def _log_switch_result(url: str, model_type: str, task: asyncio.Task) -> None:
+    if task.cancelled() or task.exception() is not None or not task.result():
+        _LOGGER.error("Failed to switch %s to model %r", url, model_type)
+    else:
+        _LOGGER.info("Server %s is running model %r", url, model_type)
+
+
+def _switch_failed(task: asyncio.Task) -> bool:
+    """Whether a switch has already finished without loading the model."""
+    if not task.done():
         return False
+    return task.cancelled() or task.exception() is not None or not task.result()
+
+
+async def _async_wait_for_switch(task: asyncio.Task) -> None:
+    """Wait for a switch to finish, or for the progress step to time out."""
+    await asyncio.wait({task}, timeout=_SWITCH_PROGRESS_SECONDS)
 
 
 class ChatterboxConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -99,28 +96,26 @@ class ChatterboxConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def __init__(self):
         self.data: dict = {}
+        self._switch_task: asyncio.Task | None = None
+        self._progress_task: asyncio.Task | None = None
 
     async def async_step_user(self, user_input=None):
         errors = {}
+        if self._switch_task is not None and _switch_failed(self._switch_task):
+            errors["base"] = "model_switch_failed"
+            self._switch_task = None
 
         if user_input is not None:
             self.data = user_input
             url = user_input[CONF_URL].rstrip("/")
             model_type = user_input.get(CONF_MODEL_TYPE, DEFAULT_MODEL_TYPE)
 
-            # Check what model the server currently has loaded
-            current_type = await _fetch_current_model(url)
-            current_config = _server_type_to_config(current_type)
-
-            # If the user selected a different model, switch it
-            if current_config != model_type:
-                success = await _switch_model(url, model_type)
-                if not success:
-                    errors["base"] = "model_switch_failed"
-                    # Fall through to show form again with error
-
-            if not errors:
-                return await self.async_step_voice_params()
+            # Load the selected model in the background; the entry doesn't wait for it
+            self._switch_task = _async_start_model_switch(self.hass, url, model_type)
+            self._progress_task = self.hass.async_create_task(
+                _async_wait_for_switch(self._switch_task)
+            )
+            return await self.async_step_switch_model()
 
         # Build model type options from MODEL_TYPES dict
         model_options = [
@@ -153,6 +148,22 @@ class ChatterboxConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
 
+    async def async_step_switch_model(self, user_input=None):
+        """Show progress while the server accepts the switch, then carry on."""
+        if not self._progress_task.done():
+            return self.async_show_progress(
+                step_id="switch_model",
+                progress_action="switch_model",
+                description_placeholders={
+                    "model": self.data.get(CONF_MODEL_TYPE, DEFAULT_MODEL_TYPE),
+                    "url": self.data[CONF_URL].rstrip("/"),
+                },
+                progress_task=self._progress_task,
+            )
+        if _switch_failed(self._switch_task):
+            return self.async_show_progress_done(next_step_id="user")
+        return self.async_show_progress_done(next_step_id="voice_params")
+
     async def async_step_voice_params(self, user_input=None):
         errors = {}
 
@@ -177,28 +188,8 @@ class ChatterboxConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         url = self.data[CONF_URL].rstrip("/")
         model_type = self.data.get(CONF_MODEL_TYPE, DEFAULT_MODEL_TYPE)
 
-        if voice_mode == "predefined":
-            endpoint = "/get_predefined_voices"
-            option_builder = lambda v: {"value": v["filename"], "label": v["display_name"]}
-        else:
-            endpoint = "/get_reference_files"
-            option_builder = lambda f: {"value": f, "label": f}
-
-        options = []
-        try:
-            async with aiohttp.ClientSession(timeout=API_TIMEOUT) as session:
-                async with session.get(f"{url}{endpoint}") as resp:
-                    _LOGGER.debug("Voice list %s status=%s", endpoint, resp.status)
-                    if resp.status == 200:
-                        data = await resp.json()
-                        _LOGGER.debug("Voice list raw response: %s", data)
-                        options = [option_builder(item) for item in data]
-                    else:
-                        body = await resp.text()
-                        _LOGGER.warning("Voice list %s returned status %s: %s", endpoint, resp.status, body)
-                        errors["base"] = "fetch_voices_failed"
-        except Exception:
-            _LOGGER.exception("Failed to fetch voice list from %s%s", url, endpoint)
+        options = await get_voice_catalogue(self.hass, url).async_get(voice_mode)
+        if options is None:
             errors["base"] = "fetch_voices_failed"
 
         if not options:
@@ -248,8 +239,16 @@ class ChatterboxConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
 
 class ChatterboxOptionsFlow(config_entries.OptionsFlow):
+    def __init__(self):
+        self._user_input: dict = {}
+        self._switch_task: asyncio.Task | None = None
+        self._progress_task: asyncio.Task | None = None
+
     async def async_step_init(self, user_input=None):
         errors = {}
+        if self._switch_task is not None and _switch_failed(self._switch_task):
+            errors["base"] = "model_switch_failed"
+            self._switch_task = None
 
         if user_input is not None:
             current = {**self.config_entry.data, **self.config_entry.options}
@@ -257,42 +256,24 @@ class ChatterboxOptionsFlow(config_entries.OptionsFlow):
             new_model = user_input.get(CONF_MODEL_TYPE)
             old_model = current.get(CONF_MODEL_TYPE, DEFAULT_MODEL_TYPE)
 
-            # If model type changed, switch it on the server
+            # If model type changed, switch it on the server in the background
             if new_model and new_model != old_model:
-                success = await _switch_model(url, new_model)
-                if not success:
-                    errors["base"] = "model_switch_failed"
+                self._user_input = user_input
+                self._switch_task = _async_start_model_switch(self.hass, url, new_model)
+                self._progress_task = self.hass.async_create_task(
+                    _async_wait_for_switch(self._switch_task)
+                )
+                return await self.async_step_switch_model()
 
-            if not errors:
-                return self.async_create_entry(title="", data=user_input)
+            return self.async_create_entry(title="", data=user_input)
 
         current = {**self.config_entry.data, **self.config_entry.options}
         voice_mode = current.get(CONF_VOICE_MODE, "clone")
         url = current[CONF_URL].rstrip("/")
         current_model = current.get(CONF_MODEL_TYPE, DEFAULT_MODEL_TYPE)
 
-        if voice_mode == "predefined":
-            endpoint = "/get_predefined_voices"
-            option_builder = lambda v: {"value": v["filename"], "label": v["display_name"]}
-        else:
-            endpoint = "/get_reference_files"
-            option_builder = lambda f: {"value": f, "label": f}
-
-        options = []
-        try:
-            async with aiohttp.ClientSession(timeout=API_TIMEOUT) as session:
-                async with session.get(f"{url}{endpoint}") as resp:
-                    _LOGGER.debug("Options voice list %s status=%s", endpoint, resp.status)
-                    if resp.status == 200:
-                        data = await resp.json()
-                        _LOGGER.debug("Options voice list raw response: %s", data)
-                        options = [option_builder(item) for item in data]
-                    else:
-                        body = await resp.text()
-                        _LOGGER.warning("Options voice list %s returned status %s: %s", endpoint, resp.status, body)
-                        errors["base"] = "fetch_voices_failed"
-        except Exception:
-            _LOGGER.exception("Failed to fetch voice list from %s%s (options flow)", url, endpoint)
+        options = await get_voice_catalogue(self.hass, url).async_get(voice_mode)
+        if options is None:
             errors["base"] = "fetch_voices_failed"
 
         if not options:
@@ -330,6 +311,62 @@ class ChatterboxOptionsFlow(config_entries.OptionsFlow):
             vol.Optional(CONF_SPEED_FACTOR, default=current.get(CONF_SPEED_FACTOR, 1.0)): selector.NumberSelector(
                 selector.NumberSelectorConfig(min=0.25, max=4.0, step=0.05, mode=selector.NumberSelectorMode.BOX)
             ),
+            vol.Optional(
+                CONF_FAIRNESS_WINDOW, default=current.get(CONF_FAIRNESS_WINDOW, DEFAULT_FAIRNESS_WINDOW)
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0, max=600, step=1, unit_of_measurement="s", mode=selector.NumberSelectorMode.BOX
+                )
+            ),
+            vol.Optional(CONF_LATENCY_BUDGET, default=current.get(CONF_LATENCY_BUDGET, 0)): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0, max=300, step=1, unit_of_measurement="s", mode=selector.NumberSelectorMode.BOX
+                )
+            ),
+            vol.Optional(
+                CONF_MAX_CONCURRENT, default=current.get(CONF_MAX_CONCURRENT, DEFAULT_MAX_CONCURRENT)
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(min=0, max=16, step=1, mode=selector.NumberSelectorMode.BOX)
+            ),
+            vol.Optional(
+                CONF_OUTPUT_FORMAT, default=current.get(CONF_OUTPUT_FORMAT, DEFAULT_OUTPUT_FORMAT)
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=[selector.SelectOptionDict(value=k, label=v) for k, v in OUTPUT_FORMATS.items()],
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                )
+            ),
+            vol.Optional(CONF_CHUNK_SIZE, default=current.get(CONF_CHUNK_SIZE, DEFAULT_CHUNK_SIZE)): selector.NumberSelector(
+                selector.NumberSelectorConfig(min=50, max=1000, step=10, mode=selector.NumberSelectorMode.BOX)
+            ),
+            vol.Optional(
+                CONF_PREPOSITION_IDLE, default=current.get(CONF_PREPOSITION_IDLE, DEFAULT_PREPOSITION_IDLE)
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0, max=1440, step=1, unit_of_measurement="min", mode=selector.NumberSelectorMode.BOX
+                )
+            ),
+            vol.Optional(
+                CONF_QUIET_HOURS_START, default=current.get(CONF_QUIET_HOURS_START, DEFAULT_QUIET_HOURS)
+            ): selector.TimeSelector(),
+            vol.Optional(
+                CONF_QUIET_HOURS_END, default=current.get(CONF_QUIET_HOURS_END, DEFAULT_QUIET_HOURS)
+            ): selector.TimeSelector(),
+            vol.Optional(CONF_AUDIO_CACHE, default=current.get(CONF_AUDIO_CACHE, True)): selector.BooleanSelector(),
+            vol.Optional(CONF_ADDITIONAL_URLS, default=current.get(CONF_ADDITIONAL_URLS, [])): selector.TextSelector(
+                selector.TextSelectorConfig(type=selector.TextSelectorType.URL, multiple=True)
+            ),
+            vol.Optional(
+                CONF_PARALLEL_LONG_MESSAGES, default=current.get(CONF_PARALLEL_LONG_MESSAGES, True)
+            ): selector.BooleanSelector(),
+            vol.Optional(CONF_TEMPLATES, default=current.get(CONF_TEMPLATES, [])): selector.TextSelector(
+                selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT, multiple=True)
+            ),
+            vol.Optional(CONF_WARM_UP, default=current.get(CONF_WARM_UP, True)): selector.BooleanSelector(),
+            vol.Optional(
+                CONF_TRIM_SILENCE, default=current.get(CONF_TRIM_SILENCE, False)
+            ): selector.BooleanSelector(),
+            vol.Optional(CONF_RECORD_TRACE, default=current.get(CONF_RECORD_TRACE, False)): selector.BooleanSelector(),
         }
 
         # Add language field for multilingual model
@@ -345,3 +382,24 @@ class ChatterboxOptionsFlow(config_entries.OptionsFlow):
             data_schema=schema,
             errors=errors,
         )
+
+    async def async_step_switch_model(self, user_input=None):
+        """Show progress while the server accepts the switch, then save the options."""
+        if not self._progress_task.done():
+            current = {**self.config_entry.data, **self.config_entry.options}
+            return self.async_show_progress(
+                step_id="switch_model",
+                progress_action="switch_model",
+                description_placeholders={
+                    "model": self._user_input[CONF_MODEL_TYPE],
+                    "url": current[CONF_URL].rstrip("/"),
+                },
+                progress_task=self._progress_task,
+            )
+        if _switch_failed(self._switch_task):
+            return self.async_show_progress_done(next_step_id="init")
+        return self.async_show_progress_done(next_step_id="finish")
+
+    async def async_step_finish(self, user_input=None):
+        """Save the options; a model still loading finishes in the background."""
+        return self.async_create_entry(title="", data=self._user_input)
@@ -2,12 +2,30 @@
 DOMAIN = "chatterbox_tts"
 
 CONF_URL = "url"
+CONF_ADDITIONAL_URLS = "additional_urls"
 CONF_VOICE_MODE = "voice_mode"
 CONF_REFERENCE_AUDIO = "reference_audio_filename"
 CONF_EXAGGERATION = "exaggeration"
 CONF_SPEED_FACTOR = "speed_factor"
 CONF_MODEL_TYPE = "model_type"
 CONF_LANGUAGE = "language"
+CONF_FAIRNESS_WINDOW = "fairness_window"
+CONF_AUDIO_CACHE = "audio_cache"
+CONF_OUTPUT_FORMAT = "output_format"
+CONF_CHUNK_SIZE = "chunk_size"
+CONF_PREPOSITION_IDLE = "preposition_idle"
+CONF_PARALLEL_LONG_MESSAGES = "parallel_long_messages"
+CONF_MAX_CONCURRENT = "max_concurrent"
+CONF_PRIORITY = "priority"
+CONF_SUPERSEDE = "supersede"
+CONF_LATENCY_BUDGET = "latency_budget"
+CONF_QUIET_HOURS_START = "quiet_hours_start"
+CONF_QUIET_HOURS_END = "quiet_hours_end"
+CONF_RECORD_TRACE = "record_trace"
+CONF_TEMPLATES = "templates"
+CONF_TEMPLATE = "template"
+CONF_WARM_UP = "warm_up"
+CONF_TRIM_SILENCE = "trim_silence"
 
 MODEL_TYPES = {
     "chatterbox": "Original (English, emotion control)",
@@ -16,3 +34,52 @@ MODEL_TYPES = {
 }
 
 DEFAULT_MODEL_TYPE = "chatterbox"
+
+# Audio formats the server can return. "auto" picks the cheapest one the
+# target player accepts: WAV skips the server-side encode entirely.
+OUTPUT_FORMAT_AUTO = "auto"
+OUTPUT_FORMATS = {
+    OUTPUT_FORMAT_AUTO: "Automatic (match the player)",
+    "wav": "WAV (no encoding, largest)",
+    "opus": "Opus (small, fast to encode)",
+    "mp3": "MP3 (most compatible)",
+}
+DEFAULT_OUTPUT_FORMAT = OUTPUT_FORMAT_AUTO
+
+# Characters per chunk when the server splits long text
+DEFAULT_CHUNK_SIZE = 240
+
+# Seconds a queued request for another model may wait while the active
+# model's batch keeps running before the scheduler forces a swap.
+DEFAULT_FAIRNESS_WINDOW = 30
+
+# Minutes a server must sit idle before it is swapped to the model usage
+# history predicts will be needed next (0 disables). Equal quiet-hour start
+# and end times mean no quiet hours.
+DEFAULT_PREPOSITION_IDLE = 15
+DEFAULT_QUIET_HOURS = "00:00:00"
+
+# Per-call priority classes, highest first. Urgent requests skip the model
+# batching window; bulk requests (such as prefetch) run last.
+PRIORITY_URGENT = "urgent"
+PRIORITY_NORMAL = "normal"
+PRIORITY_BULK = "bulk"
+PRIORITIES = (PRIORITY_URGENT, PRIORITY_NORMAL, PRIORITY_BULK)
+
+# Requests a server runs at once; the rest wait in the scheduler queue
+DEFAULT_MAX_CONCURRENT = 2
+
+# Upper bound for the on-disk audio cache shared by all entities.
+DEFAULT_CACHE_MAX_MB = 200
+
+SERVICE_PREFETCH = "prefetch"
+SERVICE_REFRESH_VOICES = "refresh_voices"
+SERVICE_SYNTHESIZE_BATCH = "synthesize_batch"
+ATTR_MESSAGE = "message"
+ATTR_ITEMS = "items"
+ATTR_FILENAME = "filename"
+ATTR_OPTIONS = "options"
+ATTR_NAME = "name"
+ATTR_CONCURRENCY = "concurrency"
+DEFAULT_BATCH_CONCURRENCY = 2
+EVENT_BATCH_PROGRESS = f"{DOMAIN}_batch_progress"
@@ -0,0 +1,156 @@
+"""Shared per-server status polling for Chatterbox TTS."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import timedelta
+import logging
+from typing import Any
+
+import aiohttp
+
+from homeassistant.config_entries import current_entry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DOMAIN
+from .server import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    get_circuit_breaker,
+    get_model_state,
+    get_server_lock,
+    get_server_session,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# One model-info poll per server on this interval, however many entities use
+# it. Shorter than MODEL_STATE_TTL so the cached model stays fresh.
+SERVER_POLL_INTERVAL = timedelta(seconds=60)
+
+# Also used for the on-demand checks made before a model switch and to probe
+# a server whose circuit breaker is half-open
+POLL_TIMEOUT_SECONDS = 10
+_POLL_TIMEOUT = aiohttp.ClientTimeout(total=POLL_TIMEOUT_SECONDS)
+
+# Map server model type strings ("original", "turbo", "multilingual") to config
+# selector values used by save_settings
+SERVER_TYPE_TO_SELECTOR = {
+    "original": "chatterbox",
+    "turbo": "chatterbox-turbo",
+    "multilingual": "chatterbox-multilingual",
+}
+
+
+@dataclass(frozen=True)
+class ServerStatus:
+    """What a reachable server reported on its last poll."""
+
+    # False if the server answered but model-info was unusable
+    reported: bool
+    server_type: str | None = None
+
+    @property
+    def model(self) -> str | None:
+        """Config selector of the loaded model, if the server reported a known one."""
+        return SERVER_TYPE_TO_SELECTOR.get(self.server_type)
+
+
+class ServerCoordinator(DataUpdateCoordinator[ServerStatus]):
+    """Polls one Chatterbox server for health and its loaded model.
+
+    Shared by every config entry and entity using the server URL. Each poll
+    feeds the server's circuit breaker and cached model state, and a failed
+    poll marks the entities using the server unavailable.
+    """
+
+    def __init__(self, hass: HomeAssistant, server_url: str) -> None:
+        # Not tied to the config entry being set up: other entries share it,
+        # and it is shut down when the last of them releases the server
+        token = current_entry.set(None)
+        try:
+            super().__init__(
+                hass,
+                _LOGGER,
+                name=f"Chatterbox server {server_url}",
+                update_interval=SERVER_POLL_INTERVAL,
+            )
+        finally:
+            current_entry.reset(token)
+        self.server_url = server_url
+        self._check: asyncio.Task | None = None
+
+    async def _async_update_data(self) -> ServerStatus:
+        session = get_server_session(self.hass, self.server_url, status=True)
+        breaker = get_circuit_breaker(self.hass, self.server_url)
+        lock = get_server_lock(self.hass, self.server_url)
+        # A swap in progress owns the model state; don't overwrite it with a
+        # reply that may predate the swap
+        swapping = lock.locked()
+        try:
+            async with session.get(
+                f"{self.server_url}/api/model-info", timeout=_POLL_TIMEOUT
+            ) as resp:
+                if resp.status >= 500:
+                    breaker.record_failure(poll=True)
+                    raise UpdateFailed(f"model-info returned status {resp.status}")
+                if resp.status != 200:
+                    body = await resp.text()
+                    _LOGGER.warning("model-info status %s: %s", resp.status, body)
+                    status = ServerStatus(reported=False)
+                else:
+                    info = await resp.json()
+                    _LOGGER.debug("model-info response from %s: %s", self.server_url, info)
+                    status = ServerStatus(reported=True, server_type=info.get("type"))
+        except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+            breaker.record_failure(poll=True)
+            raise UpdateFailed(f"Could not reach {self.server_url}: {err}") from err
+        except ValueError as err:
+            _LOGGER.warning("Unreadable model-info from %s: %s", self.server_url, err)
+            status = ServerStatus(reported=False)
+        if breaker.state == STATE_HALF_OPEN:
+            # Only a probe closes the circuit: a server can answer model-info
+            # while its /tts keeps failing
+            breaker.record_success()
+        elif breaker.state == STATE_CLOSED:
+            breaker.record_poll_success()
+        if status.reported and not (swapping or lock.locked()):
+            get_model_state(self.hass, self.server_url).update(status.model)
+        return status
+
+    async def async_check(self) -> ServerStatus | None:
+        """Poll now, joining a check already running.
+
+        Returns None if the server could not be reached.
+        """
+        if self._check is None:
+            self._check = self.hass.async_create_task(self.async_refresh())
+            self._check.add_done_callback(self._clear_check)
+        await asyncio.shield(self._check)
+        return self.data if self.last_update_success else None
+
+    def _clear_check(self, _task: asyncio.Task) -> None:
+        self._check = None
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Last poll result for diagnostics."""
+        return {
+            "available": self.last_update_success,
+            "server_type": self.data.server_type if self.data else None,
+            "last_error": (
+                None if self.last_update_success or self.last_exception is None
+                else str(self.last_exception)
+            ),
+        }
+
+
+def get_server_coordinator(hass: HomeAssistant, server_url: str) -> ServerCoordinator:
+    """Get or create the status coordinator for a server URL."""
+    coordinators: dict[str, ServerCoordinator] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        "server_coordinators", {}
+    )
+    if server_url not in coordinators:
+        coordinators[server_url] = ServerCoordinator(hass, server_url)
+    return coordinators[server_url]
@@ -0,0 +1,55 @@
+"""Diagnostics support for Chatterbox TTS."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import get_server_coordinator
+from .metrics import get_server_metrics
+from .scheduler import get_scheduler
+from .server import get_circuit_breaker, get_entry_urls, get_model_state
+from .voices import get_voice_catalogue
+from .warmup import get_warm_up
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return per-server metrics and state for a config entry."""
+    servers = {}
+    for server_url in get_entry_urls({**entry.data, **entry.options}):
+        model_state = get_model_state(hass, server_url)
+        breaker = get_circuit_breaker(hass, server_url)
+        servers[server_url] = {
+            "model": model_state.selector,
+            "model_age_seconds": (
+                round(time.monotonic() - model_state.checked_at, 1)
+                if model_state.checked_at
+                else None
+            ),
+            "status": get_server_coordinator(hass, server_url).stats,
+            "circuit": breaker.state,
+            "consecutive_failures": breaker.consecutive_failures,
+            "failures": breaker.failures,
+            "scheduler": get_scheduler(hass, server_url).stats,
+            "metrics": get_server_metrics(hass, server_url).as_dict(),
+            "voices": get_voice_catalogue(hass, server_url).stats,
+            "warm_up": get_warm_up(hass, server_url).stats,
+        }
+
+        if prepositioner := hass.data.get(DOMAIN, {}).get("server_prepositioners", {}).get(server_url):
+            servers[server_url]["prepositioning"] = prepositioner.stats
+
+    cache = hass.data.get(DOMAIN, {}).get("audio_cache")
+    return {
+        "entry": {
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "servers": servers,
+        "audio_cache": cache.stats if cache else None,
+    }
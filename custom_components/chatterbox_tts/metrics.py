@@ -0,0 +1,234 @@
+"""Per-server latency and throughput metrics for Chatterbox TTS."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+# Stages timed for every request. queue_wait is time spent in the model
+# scheduler; model_check, lock_wait and swap are the parts of _ensure_model;
+# synthesis is the /tts round trip; trim is silence trimming of the clip;
+# total is end to end.
+STAGES = ("queue_wait", "model_check", "lock_wait", "swap", "synthesis", "trim", "total")
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is open
+HISTOGRAM_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+# Samples kept per stage for percentiles and histograms
+_WINDOW = 500
+# Window (seconds) used for the requests-per-minute rate
+_RATE_WINDOW = 300
+# Weight of the newest sample in the seconds-per-character average
+_THROUGHPUT_ALPHA = 0.2
+# Swap time assumed before a server has swapped at least once
+_ASSUMED_SWAP_SECONDS = 20
+# Latency-budget fallbacks kept for diagnostics
+_FALLBACK_HISTORY = 20
+# First-request-after-cold-start timings kept per kind
+_FIRST_REQUEST_HISTORY = 50
+
+SIGNAL_METRICS_UPDATED = f"{DOMAIN}_metrics_updated_{{}}"
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    """Linear-interpolated percentile of ``values`` (None for an empty list)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class ServerMetrics:
+    """Rolling stage timings and counters for one Chatterbox server."""
+
+    def __init__(self, hass: HomeAssistant, server_url: str) -> None:
+        self.hass = hass
+        self.server_url = server_url
+        self.samples: dict[str, deque[float]] = {
+            stage: deque(maxlen=_WINDOW) for stage in STAGES
+        }
+        self._completions: deque[float] = deque()
+        self.requests = 0
+        self.swaps = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.bytes_returned = 0
+        self.queue_depth = 0
+        self.preposition_swaps = 0
+        self.preposition_hits = 0
+        self.preposition_misses = 0
+        self.budget_fallbacks = 0
+        self.recent_fallbacks: deque[dict[str, Any]] = deque(maxlen=_FALLBACK_HISTORY)
+        self.seconds_per_char: float | None = None
+        self.inflight_chars = 0
+        # Synthesis time of the first request after a start or swap, with and
+        # without a warm-up before it
+        self.first_request: dict[str, deque[float]] = {
+            kind: deque(maxlen=_FIRST_REQUEST_HISTORY) for kind in ("cold", "warm")
+        }
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Add one timing sample for a stage."""
+        self.samples[stage].append(seconds)
+
+    @contextmanager
+    def timed(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block as one sample of ``stage``."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(stage, time.monotonic() - start)
+
+    def record_throughput(self, seconds: float, chars: int) -> None:
+        """Update the moving average of synthesis seconds per character.
+
+        ``chars`` includes text that was already in flight on the server,
+        since the GPU works through it before this request.
+        """
+        if chars <= 0:
+            return
+        rate = seconds / chars
+        if self.seconds_per_char is None:
+            self.seconds_per_char = rate
+        else:
+            self.seconds_per_char += _THROUGHPUT_ALPHA * (rate - self.seconds_per_char)
+
+    @property
+    def expected_swap_seconds(self) -> float:
+        """Median of recent hot-swap times, or a typical value before the first swap."""
+        value = percentile(list(self.samples["swap"]), 50)
+        return _ASSUMED_SWAP_SECONDS if value is None else value
+
+    @callback
+    def record_fallback(self, requested: str, used: str, expected_swap: float) -> None:
+        """Record a request served on the loaded model to stay within its latency budget."""
+        self.budget_fallbacks += 1
+        self.recent_fallbacks.append(
+            {
+                "at": dt_util.utcnow().isoformat(),
+                "requested_model": requested,
+                "used_model": used,
+                "expected_swap_seconds": round(expected_swap, 1),
+            }
+        )
+        self.async_notify()
+
+    @callback
+    def record_first_request(self, seconds: float, warmed: bool) -> None:
+        """Record the first request after a start or swap."""
+        self.first_request["warm" if warmed else "cold"].append(seconds)
+        self.async_notify()
+
+    def first_request_median(self, kind: str) -> float | None:
+        """Median first-request synthesis time for ``kind`` ("cold" or "warm")."""
+        return percentile(list(self.first_request[kind]), 50)
+
+    @callback
+    def record_success(self, seconds: float, size: int) -> None:
+        """Record a completed request and notify listeners."""
+        self.requests += 1
+        self.bytes_returned += size
+        self.record("total", seconds)
+        now = time.monotonic()
+        self._completions.append(now)
+        while self._completions and now - self._completions[0] > _RATE_WINDOW:
+            self._completions.popleft()
+        self.async_notify()
+
+    @callback
+    def record_failure(self, timeout: bool = False) -> None:
+        """Record a failed request and notify listeners."""
+        self.requests += 1
+        self.failures += 1
+        if timeout:
+            self.timeouts += 1
+        self.async_notify()
+
+    @callback
+    def async_set_queue_depth(self, depth: int) -> None:
+        """Update the number of requests waiting on this server."""
+        if depth != self.queue_depth:
+            self.queue_depth = depth
+            self.async_notify()
+
+    @callback
+    def async_notify(self) -> None:
+        """Tell sensor entities that the metrics changed."""
+        async_dispatcher_send(self.hass, SIGNAL_METRICS_UPDATED.format(self.server_url))
+
+    @property
+    def requests_per_minute(self) -> float:
+        """Completed requests per minute over the rate window."""
+        now = time.monotonic()
+        recent = sum(1 for t in self._completions if now - t <= _RATE_WINDOW)
+        return round(recent * 60 / _RATE_WINDOW, 2)
+
+    def percentile(self, stage: str, pct: float) -> float | None:
+        """Percentile of a stage's recent samples, in seconds."""
+        return percentile(list(self.samples[stage]), pct)
+
+    def histogram(self, stage: str) -> dict[str, int]:
+        """Bucket a stage's recent samples by HISTOGRAM_BUCKETS."""
+        counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        for value in self.samples[stage]:
+            counts[bisect_left(HISTOGRAM_BUCKETS, value)] += 1
+        labels = [f"<={bound}s" for bound in HISTOGRAM_BUCKETS] + [f">{HISTOGRAM_BUCKETS[-1]}s"]
+        return dict(zip(labels, counts))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Counters, percentiles and histograms for diagnostics."""
+        stages = {}
+        for stage in STAGES:
+            values = list(self.samples[stage])
+            stages[stage] = {
+                "samples": len(values),
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "p99": percentile(values, 99),
+                "max": max(values, default=None),
+                "histogram": self.histogram(stage),
+            }
+        return {
+            "requests": self.requests,
+            "swaps": self.swaps,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "bytes_returned": self.bytes_returned,
+            "queue_depth": self.queue_depth,
+            "preposition_swaps": self.preposition_swaps,
+            "preposition_hits": self.preposition_hits,
+            "preposition_misses": self.preposition_misses,
+            "budget_fallbacks": self.budget_fallbacks,
+            "recent_fallbacks": list(self.recent_fallbacks),
+            "expected_swap_seconds": self.expected_swap_seconds,
+            "requests_per_minute": self.requests_per_minute,
+            "seconds_per_char": self.seconds_per_char,
+            "first_request": {
+                kind: {"samples": len(values), "p50": percentile(list(values), 50)}
+                for kind, values in self.first_request.items()
+            },
+            "stages": stages,
+        }
+
+
+def get_server_metrics(hass: HomeAssistant, server_url: str) -> ServerMetrics:
+    """Get or create the metrics for a server URL."""
+    metrics: dict[str, ServerMetrics] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        "server_metrics", {}
+    )
+    if server_url not in metrics:
+        metrics[server_url] = ServerMetrics(hass, server_url)
+    return metrics[server_url]
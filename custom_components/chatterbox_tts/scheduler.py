@@ -0,0 +1,295 @@
+"""Model-aware request scheduling for Chatterbox TTS servers."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+import logging
+import time
+from typing import Any, TypeVar
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, PRIORITIES, PRIORITY_NORMAL, PRIORITY_URGENT
+from .metrics import get_server_metrics, percentile
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+_PRIORITY_RANK = {priority: rank for rank, priority in enumerate(PRIORITIES)}
+# Queue wait samples kept per priority for diagnostics
+_WAIT_WINDOW = 200
+
+
+class JobSuperseded(Exception):
+    """A queued job was replaced by a newer job with the same tag."""
+
+
+@dataclass
+class _Job:
+    """A queued TTS job waiting for its model to become active."""
+
+    model: str
+    fairness_window: float
+    grant: asyncio.Future[None]
+    priority: str = PRIORITY_NORMAL
+    tag: str | None = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def order(self) -> tuple[int, float]:
+        """Sort key: higher priority first, then first come first served."""
+        return (_PRIORITY_RANK.get(self.priority, 1), self.enqueued_at)
+
+
+class ModelScheduler:
+    """Group queued TTS jobs by model to minimise server hot-swaps.
+
+    The server holds one model at a time, so jobs are admitted in batches:
+    while a model is active, every queued job for it runs before the server
+    is allowed to swap. A job for another model that has waited longer than
+    its fairness window stops new admissions for the active model, so a
+    minority model is never starved, unless a job of higher priority is
+    waiting for the active model.
+
+    Within a batch, urgent jobs are admitted before normal ones and normal
+    before bulk, and at most ``limit`` jobs run at once. An urgent job for
+    another model doesn't wait out a fairness window at all.
+    """
+
+    def __init__(
+        self, server_url: str, on_queue_change: Callable[[int], None] | None = None
+    ) -> None:
+        self._server_url = server_url
+        self._on_queue_change = on_queue_change
+        self._queue: list[_Job] = []
+        self._active_model: str | None = None
+        self._running = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._last_arrival_model: str | None = None
+        self._limits: dict[str, int] = {}
+        self._waits: dict[str, deque[float]] = {
+            priority: deque(maxlen=_WAIT_WINDOW) for priority in PRIORITIES
+        }
+        self.jobs = 0
+        self.swaps = 0
+        self.fifo_swaps = 0
+        self.cancelled = 0
+        self.superseded = 0
+
+    @property
+    def active_model(self) -> str | None:
+        """Model currently admitted to run."""
+        return self._active_model
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting for their model to become active."""
+        return len(self._queue)
+
+    @property
+    def load(self) -> int:
+        """Jobs running or waiting on this server, used for least-busy routing."""
+        return self._running + len(self._queue)
+
+    @property
+    def limit(self) -> int | None:
+        """Jobs allowed to run at once; the strictest entity setting wins."""
+        return min(self._limits.values(), default=None)
+
+    def set_limit(self, owner: str, limit: int | None) -> None:
+        """Set or remove (``None`` or 0) one entity's concurrency limit."""
+        if limit:
+            self._limits[owner] = limit
+        else:
+            self._limits.pop(owner, None)
+        self._dispatch()
+
+    def supersede(self, tag: str) -> int:
+        """Drop queued jobs carrying ``tag``; their callers get JobSuperseded."""
+        doomed = [job for job in self._queue if job.tag == tag]
+        for job in doomed:
+            self._queue.remove(job)
+            if not job.grant.done():
+                job.grant.set_exception(JobSuperseded(tag))
+        if doomed:
+            self.superseded += len(doomed)
+            _LOGGER.debug("Superseded %d queued job(s) tagged %r on %s", len(doomed), tag, self._server_url)
+            self._dispatch()
+        return len(doomed)
+
+    @property
+    def swaps_avoided(self) -> int:
+        """Swaps a first-come-first-served order would have needed, minus actual swaps."""
+        return max(0, self.fifo_swaps - self.swaps)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Scheduler counters for diagnostics."""
+        return {
+            "active_model": self._active_model,
+            "queue_depth": self.queue_depth,
+            "queued_by_priority": {
+                priority: sum(1 for job in self._queue if job.priority == priority)
+                for priority in PRIORITIES
+            },
+            "running": self._running,
+            "limit": self.limit,
+            "jobs": self.jobs,
+            "swaps": self.swaps,
+            "swaps_avoided": self.swaps_avoided,
+            "cancelled": self.cancelled,
+            "superseded": self.superseded,
+            "queue_wait_p95_by_priority": {
+                priority: percentile(list(waits), 95) for priority, waits in self._waits.items()
+            },
+        }
+
+    async def run(
+        self,
+        model: str,
+        job: Callable[[], Awaitable[_T]],
+        fairness_window: float,
+        priority: str = PRIORITY_NORMAL,
+        tag: str | None = None,
+    ) -> _T:
+        """Wait until ``model`` is the active batch and a slot is free, then run ``job``.
+
+        Raises JobSuperseded if a newer job with the same ``tag`` replaced
+        this one while it was queued.
+        """
+        self.jobs += 1
+        if self._last_arrival_model not in (None, model):
+            self.fifo_swaps += 1
+        self._last_arrival_model = model
+
+        entry = _Job(
+            model,
+            0 if priority == PRIORITY_URGENT else fairness_window,
+            asyncio.get_running_loop().create_future(),
+            priority,
+            tag,
+        )
+        self._queue.append(entry)
+        self._dispatch()
+        try:
+            await entry.grant
+        except asyncio.CancelledError:
+            if entry in self._queue:
+                self._queue.remove(entry)
+                self.cancelled += 1
+                self._dispatch()
+            elif (
+                entry.grant.done()
+                and not entry.grant.cancelled()
+                and entry.grant.exception() is None
+            ):
+                # Granted just as we were cancelled; give the slot back. A
+                # superseded job was never admitted, so it holds no slot
+                self._release()
+            raise
+        self._waits.get(priority, self._waits[PRIORITY_NORMAL]).append(
+            time.monotonic() - entry.enqueued_at
+        )
+
+        try:
+            return await job()
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        """Mark a running job as finished and admit whatever is next."""
+        self._running -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Admit queued jobs according to the active model and fairness."""
+        self._admit()
+        if self._on_queue_change is not None:
+            self._on_queue_change(len(self._queue))
+
+    def _admit(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._queue:
+            return
+
+        now = time.monotonic()
+        starving = min(
+            (
+                job
+                for job in self._queue
+                if job.model != self._active_model
+                and now - job.enqueued_at >= job.fairness_window
+            ),
+            key=lambda job: job.order,
+            default=None,
+        )
+        best_active = min(
+            (job for job in self._queue if job.model == self._active_model),
+            key=lambda job: job.order,
+            default=None,
+        )
+        has_active_work = best_active is not None
+        if (
+            starving is not None
+            and best_active is not None
+            and starving.order[0] > best_active.order[0]
+        ):
+            # A starving job never holds up more important work for the active model
+            starving = None
+
+        if self._running == 0 and (
+            self._active_model is None or starving is not None or not has_active_work
+        ):
+            next_model = (starving or min(self._queue, key=lambda job: job.order)).model
+            if next_model != self._active_model:
+                if self._active_model is not None:
+                    self.swaps += 1
+                    _LOGGER.debug(
+                        "Scheduler for %s switching batch %r -> %r (%d queued)",
+                        self._server_url, self._active_model, next_model, len(self._queue),
+                    )
+                self._active_model = next_model
+            starving = None
+
+        if starving is None:
+            admitted = sorted(
+                (job for job in self._queue if job.model == self._active_model),
+                key=lambda job: job.order,
+            )
+            if (limit := self.limit) is not None:
+                admitted = admitted[: max(0, limit - self._running)]
+            for job in admitted:
+                self._queue.remove(job)
+                if not job.grant.done():
+                    self._running += 1
+                    job.grant.set_result(None)
+
+        # Re-evaluate when the next waiting job for another model hits its
+        # window; jobs already past it are picked up when the batch drains
+        deadlines = [
+            job.enqueued_at + job.fairness_window
+            for job in self._queue
+            if job.model != self._active_model
+            and job.enqueued_at + job.fairness_window > now
+        ]
+        if deadlines:
+            self._timer = asyncio.get_running_loop().call_later(
+                min(deadlines) - now, self._dispatch
+            )
+
+
+def get_scheduler(hass: HomeAssistant, server_url: str) -> ModelScheduler:
+    """Get or create the model scheduler for a server URL."""
+    schedulers: dict[str, ModelScheduler] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        "server_schedulers", {}
+    )
+    if server_url not in schedulers:
+        schedulers[server_url] = ModelScheduler(
+            server_url, get_server_metrics(hass, server_url).async_set_queue_depth
+        )
+    return schedulers[server_url]
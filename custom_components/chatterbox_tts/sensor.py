@@ -0,0 +1,236 @@
+"""Per-server metric sensors for Chatterbox TTS."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+import logging
+import re
+from urllib.parse import urlparse
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
+
+from .const import DOMAIN
+from .metrics import SIGNAL_METRICS_UPDATED, ServerMetrics, get_server_metrics
+from .server import claim_server, get_entry_urls
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _p95_ms(stage: str) -> Callable[[ServerMetrics], StateType]:
+    def _value(metrics: ServerMetrics) -> StateType:
+        value = metrics.percentile(stage, 95)
+        return None if value is None else round(value * 1000)
+
+    return _value
+
+
+def _first_request_ms(kind: str) -> Callable[[ServerMetrics], StateType]:
+    def _value(metrics: ServerMetrics) -> StateType:
+        value = metrics.first_request_median(kind)
+        return None if value is None else round(value * 1000)
+
+    return _value
+
+
+@dataclass(frozen=True, kw_only=True)
+class ChatterboxSensorEntityDescription(SensorEntityDescription):
+    """Describes a Chatterbox server metric sensor."""
+
+    value_fn: Callable[[ServerMetrics], StateType]
+
+
+SENSORS: tuple[ChatterboxSensorEntityDescription, ...] = (
+    ChatterboxSensorEntityDescription(
+        key="requests",
+        name="Requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda m: m.requests,
+    ),
+    ChatterboxSensorEntityDescription(
+        key="requests_per_minute",
+        name="Requests per minute",
+        native_unit_of_measurement="req/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda m: m.requests_per_minute,
+    ),
+    ChatterboxSensorEntityDescription(
+        key="swaps",
+        name="Model swaps",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda m: m.swaps,
+    ),
+    ChatterboxSensorEntityDescription(
+        key="preposition_hits",
+        name="Swaps avoided by pre-positioning",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda m: m.preposition_hits,
+    ),
+    ChatterboxSensorEntityDescription(
+        key="budget_fallbacks",
+        name="Latency budget fallbacks",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda m: m.budget_fallbacks,
+    ),
+    *(
+        ChatterboxSensorEntityDescription(
+            key=f"first_request_{kind}",
+            name=f"First request latency {label}",
+            device_class=SensorDeviceClass.DURATION,
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            state_class=SensorStateClass.MEASUREMENT,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            value_fn=_first_request_ms(kind),
+        )
+        for kind, label in (("cold", "cold"), ("warm", "after warm-up"))
+    ),
+    ChatterboxSensorEntityDescription(
+        key="failures",
+        name="Failures",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda m: m.failures,
+    ),
+    ChatterboxSensorEntityDescription(
+        key="timeouts",
+        name="Timeouts",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda m: m.timeouts,
+    ),
+    ChatterboxSensorEntityDescription(
+        key="bytes_returned",
+        name="Audio returned",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.MEGABYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda m: m.bytes_returned,
+    ),
+    ChatterboxSensorEntityDescription(
+        key="queue_depth",
+        name="Queue depth",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda m: m.queue_depth,
+    ),
+    *(
+        ChatterboxSensorEntityDescription(
+            key=f"{stage}_p95",
+            name=f"{label} latency p95",
+            device_class=SensorDeviceClass.DURATION,
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            state_class=SensorStateClass.MEASUREMENT,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            value_fn=_p95_ms(stage),
+        )
+        for stage, label in (
+            ("total", "Total"),
+            ("queue_wait", "Queue wait"),
+            ("model_check", "Model check"),
+            ("lock_wait", "Lock wait"),
+            ("swap", "Swap"),
+            ("synthesis", "Synthesis"),
+        )
+    ),
+)
+
+
+def server_device_info(server_url: str) -> DeviceInfo:
+    """Device grouping all entities that describe one Chatterbox server."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, server_url)},
+        name=f"Chatterbox server {urlparse(server_url).netloc or server_url}",
+        manufacturer="Chatterbox-TTS-Server",
+        entry_type=DeviceEntryType.SERVICE,
+        configuration_url=server_url,
+    )
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up metric sensors for servers no other entry provides yet.
+
+    The entry also stands by to take over the sensors of its other servers
+    if the entry providing them unloads.
+    """
+    server_urls = get_entry_urls({**entry.data, **entry.options})
+
+    @callback
+    def _async_adopt(server_url: str) -> bool:
+        """Add the sensors of ``server_url`` if this entry can claim them."""
+        if server_url not in server_urls or not claim_server(hass, server_url, entry.entry_id):
+            return False
+        _LOGGER.debug("Entry %s provides sensors for %s", entry.entry_id, server_url)
+        metrics = get_server_metrics(hass, server_url)
+        async_add_entities(ChatterboxServerSensor(metrics, description) for description in SENSORS)
+        return True
+
+    adopters: dict[str, Callable[[str], bool]] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        "sensor_adopters", {}
+    )
+    adopters[entry.entry_id] = _async_adopt
+    entry.async_on_unload(lambda: adopters.pop(entry.entry_id, None))
+    for server_url in server_urls:
+        _async_adopt(server_url)
+
+
+@callback
+def async_hand_over_servers(hass: HomeAssistant, entry_id: str, server_urls: Iterable[str]) -> None:
+    """Move the sensors of servers an unloading entry provided to another loaded entry.
+
+    The other entry adds them on its own platform, so it isn't reloaded.
+    """
+    adopters: dict[str, Callable[[str], bool]] = hass.data.get(DOMAIN, {}).get("sensor_adopters", {})
+    adopters.pop(entry_id, None)
+    for server_url in server_urls:
+        if not any(adopt(server_url) for adopt in list(adopters.values())):
+            _LOGGER.debug("No loaded entry left to provide sensors for %s", server_url)
+
+
+class ChatterboxServerSensor(SensorEntity):
+    """A metric of one Chatterbox server, shared by all entities using it."""
+
+    entity_description: ChatterboxSensorEntityDescription
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self, metrics: ServerMetrics, description: ChatterboxSensorEntityDescription
+    ) -> None:
+        self.entity_description = description
+        self._metrics = metrics
+        slug = re.sub(r"[^a-z0-9]+", "_", metrics.server_url.lower()).strip("_")
+        self._attr_unique_id = f"chatterbox_server_{slug}_{description.key}"
+        self._attr_device_info = server_device_info(metrics.server_url)
+
+    @property
+    def native_value(self) -> StateType:
+        return self.entity_description.value_fn(self._metrics)
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_METRICS_UPDATED.format(self._metrics.server_url),
+                self._handle_update,
+            )
+        )
+
+    @callback
+    def _handle_update(self) -> None:
+        self.async_write_ha_state()
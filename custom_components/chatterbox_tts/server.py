@@ -0,0 +1,278 @@
+"""Shared per-server resources for Chatterbox TTS."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant
+
+from .const import DOMAIN, CONF_URL, CONF_ADDITIONAL_URLS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Connection pool sizing per Chatterbox server. The server synthesises one
+# request at a time on the GPU, so a few keep-alive connections are plenty.
+# Status polls get a connection of their own: queued behind synthesis for a
+# pooled one they would time out and trip the breaker of a busy but healthy
+# server.
+_CONNECTION_LIMIT = 4
+_STATUS_CONNECTION_LIMIT = 1
+_SESSION_STORES = ("server_sessions", "status_sessions")
+_KEEPALIVE_TIMEOUT = 60
+
+# How long a model-info result is trusted before the next TTS request
+# re-checks the server. Swaps made through this integration update the cache
+# immediately; the TTL only covers changes made behind our back.
+MODEL_STATE_TTL = 300
+
+
+# Circuit breaker: this many consecutive timeouts, connection errors or 5xx
+# responses open the circuit. While open, requests to the server fail fast;
+# after the cool-down one cheap model-info probe decides whether to close it
+# again. Each failed probe doubles the cool-down up to the maximum.
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_OPEN_SECONDS = 30
+BREAKER_MAX_OPEN_SECONDS = 300
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+@dataclass
+class ServerModelState:
+    """Last known model loaded on a Chatterbox server."""
+
+    selector: str | None = None
+    checked_at: float = 0.0
+
+    @property
+    def is_known(self) -> bool:
+        """Return True if a model is cached and still fresh."""
+        return (
+            self.selector is not None
+            and time.monotonic() - self.checked_at < MODEL_STATE_TTL
+        )
+
+    def is_current(self, desired_model: str) -> bool:
+        """Return True if the cached model matches and is still fresh."""
+        return self.is_known and self.selector == desired_model
+
+    def update(self, selector: str | None) -> None:
+        """Record the model the server reported or was switched to."""
+        self.selector = selector
+        self.checked_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        """Forget the cached model so the next request re-checks the server."""
+        self.selector = None
+        self.checked_at = 0.0
+
+
+@dataclass
+class CircuitBreaker:
+    """Per-server circuit breaker driven by consecutive failures."""
+
+    consecutive_failures: int = 0
+    # How many of the consecutive failures were status polls
+    failed_polls: int = 0
+    failures: int = 0
+    opened_at: float | None = None
+    open_seconds: float = BREAKER_OPEN_SECONDS
+
+    @property
+    def state(self) -> str:
+        """Closed, open, or half-open once the cool-down has elapsed."""
+        if self.opened_at is None:
+            return STATE_CLOSED
+        if time.monotonic() - self.opened_at >= self.open_seconds:
+            return STATE_HALF_OPEN
+        return STATE_OPEN
+
+    @property
+    def allows_requests(self) -> bool:
+        """Return True if requests may be sent to the server."""
+        return self.opened_at is None
+
+    def record_failure(self, poll: bool = False) -> None:
+        """Record a timeout, connection error or 5xx response."""
+        self.failures += 1
+        self.consecutive_failures += 1
+        if poll:
+            self.failed_polls += 1
+        if self.opened_at is not None:
+            # A failed half-open probe keeps the circuit open for longer
+            if self.state == STATE_HALF_OPEN:
+                self.open_seconds = min(self.open_seconds * 2, BREAKER_MAX_OPEN_SECONDS)
+            self.opened_at = time.monotonic()
+        elif self.consecutive_failures >= BREAKER_FAILURE_THRESHOLD:
+            self.opened_at = time.monotonic()
+
+    def record_success(self) -> None:
+        """Record a successful response, closing the circuit."""
+        self.consecutive_failures = 0
+        self.failed_polls = 0
+        self.opened_at = None
+        self.open_seconds = BREAKER_OPEN_SECONDS
+
+    def record_poll_success(self) -> None:
+        """Record a status poll the server answered while the circuit is closed.
+
+        Failed polls no longer count towards opening the circuit. Failed
+        requests still do: a server can answer model-info while its /tts
+        keeps failing.
+        """
+        self.consecutive_failures -= self.failed_polls
+        self.failed_polls = 0
+
+
+def get_entry_urls(config: Mapping[str, Any]) -> list[str]:
+    """Return the primary server URL followed by any additional pool URLs."""
+    urls = [config[CONF_URL].rstrip("/")]
+    for url in config.get(CONF_ADDITIONAL_URLS) or []:
+        url = url.strip().rstrip("/")
+        if url and url not in urls:
+            urls.append(url)
+    return urls
+
+
+def get_server_lock(hass: HomeAssistant, server_url: str) -> asyncio.Lock:
+    """Get or create a per-server asyncio lock to serialize model switches.
+
+    All entities pointing at the same server URL share one lock so that
+    concurrent TTS calls don't race each other through the check-and-swap
+    sequence.
+    """
+    locks: dict[str, asyncio.Lock] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        "server_locks", {}
+    )
+    if server_url not in locks:
+        locks[server_url] = asyncio.Lock()
+    return locks[server_url]
+
+
+def get_model_state(hass: HomeAssistant, server_url: str) -> ServerModelState:
+    """Get or create the cached model state for a server, kept beside its lock."""
+    states: dict[str, ServerModelState] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        "server_models", {}
+    )
+    if server_url not in states:
+        states[server_url] = ServerModelState()
+    return states[server_url]
+
+
+def get_circuit_breaker(hass: HomeAssistant, server_url: str) -> CircuitBreaker:
+    """Get or create the circuit breaker for a server."""
+    breakers: dict[str, CircuitBreaker] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        "server_breakers", {}
+    )
+    if server_url not in breakers:
+        breakers[server_url] = CircuitBreaker()
+    return breakers[server_url]
+
+
+def get_server_session(
+    hass: HomeAssistant, server_url: str, status: bool = False
+) -> aiohttp.ClientSession:
+    """Get or create the shared aiohttp session for a server URL.
+
+    Every entity and config flow pointing at the same server reuses one
+    pooled, keep-alive session instead of opening a new TCP connection per
+    request. Callers pass their own per-request timeout. With ``status`` the
+    separate session for model-info polls is returned, which synthesis never
+    occupies.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    sessions: dict[str, aiohttp.ClientSession] = domain_data.setdefault(
+        _SESSION_STORES[status], {}
+    )
+    session = sessions.get(server_url)
+    if session is None or session.closed:
+        if not domain_data.get("close_listener"):
+            domain_data["close_listener"] = hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_CLOSE, _async_close_all_sessions(hass)
+            )
+        connector = aiohttp.TCPConnector(
+            limit=_STATUS_CONNECTION_LIMIT if status else _CONNECTION_LIMIT,
+            keepalive_timeout=_KEEPALIVE_TIMEOUT,
+        )
+        session = aiohttp.ClientSession(connector=connector)
+        sessions[server_url] = session
+        _LOGGER.debug("Created shared %ssession for %s", "status " if status else "", server_url)
+    return session
+
+
+def register_server_entry(hass: HomeAssistant, server_url: str, entry_id: str) -> None:
+    """Record that a config entry uses the given server URL."""
+    entries: dict[str, set[str]] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        "server_entries", {}
+    )
+    entries.setdefault(server_url, set()).add(entry_id)
+
+
+def claim_server(hass: HomeAssistant, server_url: str, entry_id: str) -> bool:
+    """Claim a server's shared sensor entities for a config entry.
+
+    Returns True if this entry owns them, i.e. no other loaded entry
+    already provides them.
+    """
+    owners: dict[str, str] = hass.data.setdefault(DOMAIN, {}).setdefault("server_owners", {})
+    return owners.setdefault(server_url, entry_id) == entry_id
+
+
+async def async_release_server_entry(hass: HomeAssistant, entry_id: str) -> dict[str, str]:
+    """Drop a config entry's claim on its servers, closing what is left unused.
+
+    Servers no other entry uses have their status polling stopped and their
+    shared session closed.
+
+    Returns servers this entry owned that are still used by other entries,
+    mapped to one of those entries so it can take over the server sensors.
+    """
+    domain_data = hass.data.get(DOMAIN, {})
+    entries: dict[str, set[str]] = domain_data.get("server_entries", {})
+    owners: dict[str, str] = domain_data.get("server_owners", {})
+    orphaned: dict[str, str] = {}
+    for server_url, users in list(entries.items()):
+        if entry_id not in users:
+            continue
+        users.discard(entry_id)
+        if owners.get(server_url) == entry_id:
+            del owners[server_url]
+            if users:
+                orphaned[server_url] = next(iter(users))
+        if users:
+            continue
+        del entries[server_url]
+        coordinator = domain_data.get("server_coordinators", {}).pop(server_url, None)
+        if coordinator is not None:
+            await coordinator.async_shutdown()
+        for store in _SESSION_STORES:
+            session = domain_data.get(store, {}).pop(server_url, None)
+            if session is not None and not session.closed:
+                _LOGGER.debug("Closing shared session for %s", server_url)
+                await session.close()
+    return orphaned
+
+
+def _async_close_all_sessions(hass: HomeAssistant):
+    """Build the shutdown listener that closes every shared session."""
+
+    async def _close(_event: Event) -> None:
+        domain_data = hass.data.get(DOMAIN, {})
+        domain_data.pop("close_listener", None)
+        for store in _SESSION_STORES:
+            sessions: dict[str, aiohttp.ClientSession] = domain_data.get(store, {})
+            for session in sessions.values():
+                if not session.closed:
+                    await session.close()
+            sessions.clear()
+
+    return _close
@@ -0,0 +1,46 @@
+"""Split templated messages into static phrases and variable parts."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import lru_cache
+import re
+
+# A Jinja expression such as "{{ t }}", or a bare "{}"
+_PLACEHOLDER = re.compile(r"\{\{.*?\}\}|\{\}")
+
+
+@lru_cache(maxsize=64)
+def compile_template(template: str) -> re.Pattern[str] | None:
+    """Regex matching messages rendered from ``template``, one group per placeholder.
+
+    Returns None if the template has no placeholder or no static text.
+    """
+    parts = _PLACEHOLDER.split(template.strip())
+    if len(parts) < 2 or not any(part.strip() for part in parts):
+        return None
+    pattern = "(.+?)".join(r"\s+".join(map(re.escape, part.split(" "))) for part in parts)
+    return re.compile(pattern, re.IGNORECASE | re.DOTALL)
+
+
+def split_message(message: str, templates: Iterable[str]) -> list[tuple[str, bool]] | None:
+    """Split a message by the first matching template.
+
+    Returns (text, is_static) segments in order; static segments use the
+    template's own wording so every render shares them. Returns None if no
+    template matches.
+    """
+    message = " ".join(message.split())
+    for template in templates:
+        if (pattern := compile_template(" ".join(template.split()))) is None:
+            continue
+        if (match := pattern.fullmatch(message)) is None:
+            continue
+        statics = _PLACEHOLDER.split(" ".join(template.split()))
+        segments: list[tuple[str, bool]] = []
+        for index, static in enumerate(statics):
+            if static.strip():
+                segments.append((static.strip(), True))
+            if index < len(match.groups()) and (value := match.group(index + 1).strip()):
+                segments.append((value, False))
+        return segments
+    return None
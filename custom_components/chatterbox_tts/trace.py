@@ -0,0 +1,91 @@
+"""Opt-in request trace recording for Chatterbox TTS.
+
+Each TTS request becomes one JSON line in ``<config>/chatterbox_tts_trace.jsonl``
+with its arrival time, entity, model, text length, options and outcome, but
+not the text itself. benchmarks/replay.py feeds such a trace to a stand-in
+server to study queueing and swapping under real load.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+TRACE_FILENAME = "chatterbox_tts_trace.jsonl"
+# The trace is rotated to a single .1 file once it reaches this size
+_TRACE_MAX_BYTES = 20 * 1024 * 1024
+
+# Request options worth replaying; anything else (such as the player's
+# preferred format hints) is left out
+TRACED_OPTIONS = (
+    "exaggeration",
+    "speed_factor",
+    "language",
+    "output_format",
+    "chunk_size",
+    "priority",
+    "supersede",
+    "latency_budget",
+)
+
+
+def text_fingerprint(text: str) -> str:
+    """Short hash that lets a replay repeat identical messages without storing them."""
+    return hashlib.sha256(text.encode()).hexdigest()[:12]
+
+
+class TraceRecorder:
+    """Buffers trace records and appends them to the trace file in the executor."""
+
+    def __init__(self, hass: HomeAssistant, path: Path) -> None:
+        self.hass = hass
+        self.path = path
+        self._pending: list[str] = []
+        self._flush: asyncio.Task | None = None
+        self.records = 0
+
+    @callback
+    def async_record(self, record: dict[str, Any]) -> None:
+        """Queue one record for writing."""
+        self.records += 1
+        self._pending.append(json.dumps(record, separators=(",", ":")))
+        if self._flush is None:
+            self._flush = self.hass.async_create_background_task(
+                self._async_flush(), "chatterbox_tts trace flush"
+            )
+
+    async def _async_flush(self) -> None:
+        try:
+            while self._pending:
+                lines, self._pending = self._pending, []
+                await self.hass.async_add_executor_job(self._write, lines)
+        except OSError as err:
+            _LOGGER.warning("Could not write request trace to %s: %s", self.path, err)
+        finally:
+            self._flush = None
+
+    def _write(self, lines: list[str]) -> None:
+        if self.path.exists() and self.path.stat().st_size >= _TRACE_MAX_BYTES:
+            os.replace(self.path, self.path.with_suffix(".jsonl.1"))
+        with self.path.open("a", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+
+
+def get_trace_recorder(hass: HomeAssistant) -> TraceRecorder:
+    """Get or create the shared trace recorder."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    recorder: TraceRecorder | None = domain_data.get("trace_recorder")
+    if recorder is None:
+        recorder = TraceRecorder(hass, Path(hass.config.path(TRACE_FILENAME)))
+        domain_data["trace_recorder"] = recorder
+    return recorder
@@ -2,25 +2,114 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterable
+from contextvars import ContextVar
+from functools import partial
 import logging
 import re
+import tempfile
+import time
+from typing import IO
 import aiohttp
+import voluptuous as vol
 
-from homeassistant.components.tts import TextToSpeechEntity
+from homeassistant.components.tts import (
+    ATTR_LANGUAGE,
+    ATTR_PREFERRED_FORMAT,
+    TextToSpeechEntity,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, entity_platform
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
-    CONF_URL,
     CONF_VOICE_MODE,
     CONF_REFERENCE_AUDIO,
     CONF_EXAGGERATION,
     CONF_SPEED_FACTOR,
     CONF_MODEL_TYPE,
     CONF_LANGUAGE,
+    CONF_FAIRNESS_WINDOW,
+    CONF_AUDIO_CACHE,
+    CONF_OUTPUT_FORMAT,
+    CONF_CHUNK_SIZE,
+    CONF_PREPOSITION_IDLE,
+    CONF_PARALLEL_LONG_MESSAGES,
+    CONF_MAX_CONCURRENT,
+    CONF_PRIORITY,
+    CONF_SUPERSEDE,
+    CONF_LATENCY_BUDGET,
+    CONF_QUIET_HOURS_START,
+    CONF_QUIET_HOURS_END,
+    CONF_RECORD_TRACE,
+    CONF_TEMPLATES,
+    CONF_TEMPLATE,
+    CONF_WARM_UP,
+    CONF_TRIM_SILENCE,
     DEFAULT_MODEL_TYPE,
+    DEFAULT_FAIRNESS_WINDOW,
+    DEFAULT_OUTPUT_FORMAT,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_PREPOSITION_IDLE,
+    DEFAULT_QUIET_HOURS,
+    DEFAULT_MAX_CONCURRENT,
+    PRIORITIES,
+    PRIORITY_NORMAL,
+    PRIORITY_BULK,
+    SERVICE_PREFETCH,
+    SERVICE_REFRESH_VOICES,
+    SERVICE_SYNTHESIZE_BATCH,
+    ATTR_MESSAGE,
+    ATTR_OPTIONS,
+)
+from .audio import _mp3_frames, join_audio, trim_silence
+from .batch import (
+    BATCH_SERVICE_SCHEMA,
+    BatchProgress,
+    batch_directory,
+    item_filename,
+    write_clip,
+    write_manifest,
+)
+from .cache import async_get_audio_cache, cache_key
+from .metrics import get_server_metrics
+from .coordinator import get_server_coordinator
+from .scheduler import JobSuperseded, get_scheduler
+from .usage import (
+    ModelPrepositioner,
+    PrepositionSettings,
+    async_get_model_usage,
+    get_prepositioner,
+)
+from .templates import split_message
+from .trace import TRACED_OPTIONS, get_trace_recorder, text_fingerprint
+from .voices import get_voice_catalogue
+from .warmup import (
+    READINESS_COLD,
+    READINESS_READY,
+    READINESS_WARMING,
+    SIGNAL_WARM_UP_UPDATED,
+    WARM_UP_TEXT,
+    get_warm_up,
+)
+
+try:
+    from homeassistant.components.tts import TTSAudioRequest, TTSAudioResponse
+except ImportError:  # Home Assistant without the streaming TTS API
+    TTSAudioRequest = TTSAudioResponse = None
+from .server import (
+    STATE_HALF_OPEN,
+    get_circuit_breaker,
+    get_entry_urls,
+    get_model_state,
+    get_server_lock,
+    get_server_session,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,33 +120,271 @@ SUPPORTED_LANGUAGES = [
     "he", "ms", "sw",
 ]
 
-# Map server model type strings ("original", "turbo", "multilingual") to config
-# selector values used by save_settings
-_SERVER_TYPE_TO_SELECTOR = {
-    "original": "chatterbox",
-    "turbo": "chatterbox-turbo",
-    "multilingual": "chatterbox-multilingual",
-}
+# File extension handed to Home Assistant for each server output format; the
+# server wraps Opus in an Ogg container
+_FORMAT_EXTENSIONS = {"wav": "wav", "opus": "ogg", "mp3": "mp3"}
 
 # Timeouts
 _API_TIMEOUT = aiohttp.ClientTimeout(total=15)
 _MODEL_SWITCH_TIMEOUT = aiohttp.ClientTimeout(total=120)
 _TTS_TIMEOUT = aiohttp.ClientTimeout(total=120)
 
+# Once a server's throughput has been observed, /tts timeouts scale with the
+# text: expected seconds (including text already in flight ahead of it on the
+# same server) times a safety factor plus slack, clamped to a sane range.
+_TTS_TIMEOUT_FACTOR = 3
+_TTS_TIMEOUT_SLACK = 10
+_TTS_TIMEOUT_MIN = 20
+_TTS_TIMEOUT_MAX = 600
+
+# Responses for texts at least this long are streamed to a temporary file in
+# chunks and bounded by an idle timeout (longest gap between reads) rather
+# than a total time limit
+_SPOOL_MIN_CHARS = 1000
+_SPOOL_CHUNK_BYTES = 256 * 1024
+_TTS_IDLE_TIMEOUT = 60
+
+# Streaming: sentences shorter than this are merged into the next one so the
+# server isn't asked to synthesise fragments like "Hi." on their own, and this
+# many sentence requests are kept in flight ahead of the one being played.
+_MIN_SENTENCE_CHARS = 20
+_STREAM_PIPELINE_DEPTH = 2
+# Text streamed in without a sentence end is cut at the last clause or word
+# boundary once it grows this long, so speech doesn't wait for a full stop
+_STREAM_MAX_BUFFER_CHARS = 250
+_CLAUSE_END = re.compile(r"[,;:]\s")
+
+# Pause inserted where the cached static phrases of a templated message meet
+# its variable parts, so the joins sound like phrasing rather than cuts
+_SEGMENT_GAP_SECONDS = 0.08
+
+# Servers a traced request swapped models on. Set per request, and shared
+# with the tasks it starts, so the trace records the swaps this request made
+# rather than one made concurrently for another caller
+_REQUEST_SWAPS: ContextVar[list[str] | None] = ContextVar("chatterbox_request_swaps", default=None)
+
+# Messages at least this long are split across every server that already has
+# the model loaded, and the pieces are synthesised in parallel
+_FAN_OUT_MIN_CHARS = 400
+
+# Models that speak English, and Turbo's paralinguistic tags, which the other
+# models would read out literally
+_ENGLISH_MODELS = ("chatterbox", "chatterbox-turbo")
+_PARALINGUISTIC_TAG = re.compile(
+    r"\s*\[(?:laugh|chuckle|sigh|gasp|cough|clear throat|sniff|groan|shush)\]", re.IGNORECASE
+)
+
+_SENTENCE_END = re.compile(r"(?<=[.!?…。！？])\s+")
 
-def _get_server_lock(hass: HomeAssistant, server_url: str) -> asyncio.Lock:
-    """Get or create a per-server asyncio lock to serialize model switches.
 
-    All entities pointing at the same server URL share one lock so that
-    concurrent TTS calls don't race each other through the check-and-swap
-    sequence.
+def _split_sentences(text: str) -> list[str]:
+    """Split text at sentence boundaries, merging very short fragments."""
+    sentences: list[str] = []
+    buffer = ""
+    for part in _SENTENCE_END.split(text.strip()):
+        buffer = f"{buffer} {part}".strip() if buffer else part.strip()
+        if len(buffer) >= _MIN_SENTENCE_CHARS:
+            sentences.append(buffer)
+            buffer = ""
+    if buffer:
+        if sentences:
+            sentences[-1] = f"{sentences[-1]} {buffer}"
+        else:
+            sentences.append(buffer)
+    return sentences
+
+
+async def _async_split_stream(chunks: AsyncIterable[str]) -> AsyncGenerator[str, None]:
+    """Yield sentences from incrementally arriving text as soon as each one ends.
+
+    A sentence counts as ended once the whitespace after its punctuation
+    arrives, so "3.5" isn't split. Short sentences are merged into the next
+    one like _split_sentences does; an unusually long run without a sentence
+    end is cut at its last clause or word boundary.
     """
-    locks: dict[str, asyncio.Lock] = hass.data.setdefault(DOMAIN, {}).setdefault(
-        "server_locks", {}
+    pending = ""
+    buffer = ""
+    async for chunk in chunks:
+        buffer += chunk
+        *complete, buffer = _SENTENCE_END.split(buffer)
+        if len(buffer) >= _STREAM_MAX_BUFFER_CHARS:
+            clause = None
+            for clause in _CLAUSE_END.finditer(buffer):
+                pass
+            cut = clause.end() if clause else buffer.rfind(" ") + 1
+            if cut > 0:
+                complete.append(buffer[:cut])
+                buffer = buffer[cut:]
+        for sentence in complete:
+            pending = f"{pending} {sentence.strip()}".strip()
+            if len(pending) >= _MIN_SENTENCE_CHARS:
+                yield pending
+                pending = ""
+    if tail := f"{pending} {buffer.strip()}".strip():
+        yield tail
+
+
+async def _async_complete_message(
+    chunks: AsyncIterable[str],
+) -> tuple[str | None, AsyncGenerator[str, None]]:
+    """Tell a complete message from text that is still arriving.
+
+    Home Assistant hands every request to the streaming API, and a message
+    that is already complete, such as one from tts.speak, arrives as a
+    single chunk. Returns the message and an exhausted stream for those, or
+    None and the stream with the chunks read so far put back in front.
+    """
+    iterator = aiter(chunks)
+    head: list[str] = []
+    for _ in range(2):
+        try:
+            head.append(await anext(iterator))
+        except StopAsyncIteration:
+            break
+
+    async def _stream() -> AsyncGenerator[str, None]:
+        for chunk in head:
+            yield chunk
+        async for chunk in iterator:
+            yield chunk
+
+    if len(head) < 2:
+        return "".join(head), _stream()
+    return None, _stream()
+
+
+def _select_output_format(configured: str, preferred: str | None) -> str:
+    """Pick the format the server should return for a request.
+
+    An explicit format the server supports always wins. Otherwise the
+    player's preferred format is used when the server can produce it. If the
+    player wants something else, WAV is cheapest because Home Assistant
+    transcodes anyway. Without a preference, such as a media player fetching
+    a URL, MP3 stays the safe choice.
+    """
+    if configured in _FORMAT_EXTENSIONS:
+        return configured
+    if preferred in ("ogg", "opus"):
+        return "opus"
+    if preferred in _FORMAT_EXTENSIONS:
+        return preferred
+    return "wav" if preferred else "mp3"
+
+
+def _partition_sentences(sentences: list[str], parts: int) -> list[str]:
+    """Group consecutive sentences into at most ``parts`` pieces of similar length."""
+    total = sum(len(sentence) for sentence in sentences)
+    pieces: list[str] = []
+    current: list[str] = []
+    done = 0
+    for sentence in sentences:
+        # Close the piece here if adding this sentence would overshoot the
+        # piece's share by more than stopping short of it
+        boundary = total * (len(pieces) + 1) / parts
+        if current and len(pieces) < parts - 1 and done + len(sentence) - boundary > boundary - done:
+            pieces.append(" ".join(current))
+            current = []
+        current.append(sentence)
+        done += len(sentence)
+    if current:
+        pieces.append(" ".join(current))
+    return pieces
+
+
+def _spool_timeout(first_byte: aiohttp.ClientTimeout) -> aiohttp.ClientTimeout:
+    """Idle-based timeout for spooled responses.
+
+    aiohttp's read timeout covers every wait for data, including the wait for
+    the response headers while the server synthesises, so it is at least the
+    usual length-scaled timeout. There is no total limit.
+    """
+    return aiohttp.ClientTimeout(
+        total=None,
+        sock_connect=_API_TIMEOUT.total,
+        sock_read=max(_TTS_IDLE_TIMEOUT, first_byte.total or 0),
     )
-    if server_url not in locks:
-        locks[server_url] = asyncio.Lock()
-    return locks[server_url]
+
+
+def _read_spool(spool: IO[bytes]) -> bytes:
+    spool.seek(0)
+    return spool.read()
+
+
+def _fallback_payload(payload: dict, requested: str, loaded: str) -> dict | None:
+    """Adapt a /tts payload so ``loaded`` can stand in for ``requested``.
+
+    Returns None when it can't, e.g. a non-English Multilingual request on
+    an English-only model.
+    """
+    mapped = dict(payload)
+    if loaded == "chatterbox-multilingual":
+        mapped["language"] = "en"
+    elif requested == "chatterbox-multilingual":
+        if payload.get("language", "en") != "en":
+            return None
+        mapped.pop("language", None)
+    if requested == "chatterbox-turbo":
+        mapped["text"] = _PARALINGUISTIC_TAG.sub("", mapped["text"]).strip()
+    return mapped
+
+
+class _ServerUnavailable(Exception):
+    """A server timed out or failed, so the request should try the next one."""
+
+
+def _tts_timeout(seconds_per_char: float | None, chars: int) -> aiohttp.ClientTimeout:
+    """Timeout for a /tts request given the server's observed throughput."""
+    if seconds_per_char is None:
+        return _TTS_TIMEOUT
+    expected = seconds_per_char * chars * _TTS_TIMEOUT_FACTOR + _TTS_TIMEOUT_SLACK
+    return aiohttp.ClientTimeout(total=min(_TTS_TIMEOUT_MAX, max(_TTS_TIMEOUT_MIN, expected)))
+
+
+async def _async_route(hass: HomeAssistant, urls: list[str], model_type: str) -> list[str]:
+    """Order a server pool for a request.
+
+    Servers whose circuit breaker is open are left out, so a request fails
+    fast when none is available. Half-open servers get one cheap probe first.
+    Servers that already have the model loaded come first, then the rest;
+    each group is sorted least busy first.
+    """
+    # Probe half-open servers, and in a pool refresh stale model info so
+    # affinity routing has something to go on. The checks go through each
+    # server's shared coordinator, so concurrent requests share one probe.
+    to_probe = []
+    for url in urls:
+        breaker = get_circuit_breaker(hass, url)
+        if breaker.state == STATE_HALF_OPEN or (
+            len(urls) > 1
+            and breaker.allows_requests
+            and not get_model_state(hass, url).is_known
+        ):
+            to_probe.append(url)
+    if to_probe:
+        await asyncio.gather(
+            *(get_server_coordinator(hass, url).async_check() for url in to_probe)
+        )
+
+    available = [url for url in urls if get_circuit_breaker(hass, url).allows_requests]
+    if not available:
+        _LOGGER.warning("Circuit open for every Chatterbox server in %s, failing fast", urls)
+
+    def _rank(url: str) -> tuple[bool, int]:
+        return (
+            not get_model_state(hass, url).is_current(model_type),
+            get_scheduler(hass, url).load,
+        )
+
+    return sorted(available, key=_rank)
+
+
+def _forget_inflight(inflight: dict[str, asyncio.Task], key: str, task: asyncio.Task) -> None:
+    """Drop a finished request from the in-flight table."""
+    if inflight.get(key) is task:
+        del inflight[key]
+    if not task.cancelled():
+        # Mark the exception as retrieved in case every caller went away
+        task.exception()
 
 
 async def _ensure_model(
@@ -67,41 +394,53 @@ async def _ensure_model(
 ) -> bool:
     """Ensure the server is running the desired model, switching if necessary.
 
-    Acquires a per-server lock so only one entity switches at a time.
+    The server's coordinator keeps the last known model fresh, so the common
+    case is an in-memory check that skips both the lock and the model-info
+    round trip. Otherwise acquires a per-server lock so only one entity
+    switches at a time, and asks the coordinator to re-check the server.
     Returns True if the server is (now) running the desired model,
     False if the switch failed.
     """
-    lock = _get_server_lock(hass, server_url)
+    lock = get_server_lock(hass, server_url)
+    state = get_model_state(hass, server_url)
+    if not lock.locked() and state.is_current(desired_model):
+        return True
+
+    session = get_server_session(hass, server_url)
+    metrics = get_server_metrics(hass, server_url)
+    wait_started = time.monotonic()
 
     async with lock:
+        metrics.record("lock_wait", time.monotonic() - wait_started)
+        # Another caller may have confirmed or swapped to this model while we waited
+        if state.is_current(desired_model):
+            _LOGGER.debug("Cached model state matches %r after lock wait", desired_model)
+            return True
+
         # Check what the server is currently running
-        current_type = None
-        current_selector = None
+        check_started = time.monotonic()
         try:
-            async with aiohttp.ClientSession(timeout=_API_TIMEOUT) as session:
-                async with session.get(f"{server_url}/api/model-info") as resp:
-                    if resp.status == 200:
-                        info = await resp.json()
-                        _LOGGER.debug("model-info response: %s", info)
-                        current_type = info.get("type")
-                        current_selector = _SERVER_TYPE_TO_SELECTOR.get(current_type)
-                        _LOGGER.debug(
-                            "model-info: server type=%r → selector=%r, desired=%r",
-                            current_type, current_selector, desired_model,
-                        )
-                        if current_selector == desired_model:
-                            _LOGGER.debug("Model already correct (%r), no switch needed", desired_model)
-                            return True
-                    else:
-                        body = await resp.text()
-                        _LOGGER.warning(
-                            "model-info status %s: %s — proceeding optimistically",
-                            resp.status, body,
-                        )
-                        return True  # Optimistic — don't block TTS on a failed info check
-        except Exception as err:
-            _LOGGER.warning("Could not query model info (%s), proceeding optimistically", err)
-            return True  # Optimistic
+            status = await get_server_coordinator(hass, server_url).async_check()
+        finally:
+            metrics.record("model_check", time.monotonic() - check_started)
+        if status is None:
+            # The server is unreachable; fail instead of walking into a long
+            # /tts timeout. The check already counted against the breaker.
+            _LOGGER.warning("Could not reach %s for model info", server_url)
+            return False
+        if not status.reported:
+            _LOGGER.warning("model-info unavailable — proceeding optimistically")
+            return True  # Optimistic — don't block TTS on a failed info check
+        current_type = status.server_type
+        current_selector = status.model
+        state.update(current_selector)
+        _LOGGER.debug(
+            "model-info: server type=%r → selector=%r, desired=%r",
+            current_type, current_selector, desired_model,
+        )
+        if current_selector == desired_model:
+            _LOGGER.debug("Model already correct (%r), no switch needed", desired_model)
+            return True
 
         # Need to switch
         _LOGGER.info(
@@ -110,35 +449,67 @@ async def _ensure_model(
         )
         save_payload = {"model": {"repo_id": desired_model}}
         _LOGGER.debug("save_settings payload: %s", save_payload)
+        # The server's model is in flux until the swap completes
+        state.invalidate()
 
+        swap_started = time.monotonic()
         try:
-            async with aiohttp.ClientSession(timeout=_MODEL_SWITCH_TIMEOUT) as session:
-                # Step 1: Save the new model selector
-                async with session.post(
-                    f"{server_url}/save_settings",
-                    json=save_payload,
-                ) as resp:
-                    body = await resp.text()
-                    _LOGGER.debug("save_settings status=%s body=%s", resp.status, body)
-                    if resp.status != 200:
-                        _LOGGER.error("Failed to save model setting (status %s): %s", resp.status, body)
-                        return False
-
-                # Step 2: Hot-swap the engine
-                async with session.post(f"{server_url}/restart_server") as resp:
-                    body = await resp.text()
-                    _LOGGER.debug("restart_server status=%s body=%s", resp.status, body)
-                    if resp.status != 200:
-                        _LOGGER.error("Failed to hot-swap model (status %s): %s", resp.status, body)
-                        return False
+            # Step 1: Save the new model selector
+            async with session.post(
+                f"{server_url}/save_settings",
+                json=save_payload,
+                timeout=_MODEL_SWITCH_TIMEOUT,
+            ) as resp:
+                body = await resp.text()
+                _LOGGER.debug("save_settings status=%s body=%s", resp.status, body)
+                if resp.status != 200:
+                    _LOGGER.error("Failed to save model setting (status %s): %s", resp.status, body)
+                    return False
+
+            # Step 2: Hot-swap the engine
+            async with session.post(
+                f"{server_url}/restart_server", timeout=_MODEL_SWITCH_TIMEOUT
+            ) as resp:
+                body = await resp.text()
+                _LOGGER.debug("restart_server status=%s body=%s", resp.status, body)
+                if resp.status != 200:
+                    _LOGGER.error("Failed to hot-swap model (status %s): %s", resp.status, body)
+                    return False
 
             _LOGGER.info("Model hot-swap to '%s' completed successfully", desired_model)
+            # Only completed swaps: a fast rejection would make swaps look
+            # cheap to the latency budget
+            metrics.record("swap", time.monotonic() - swap_started)
+            state.update(desired_model)
+            metrics.swaps += 1
+            if (request_swaps := _REQUEST_SWAPS.get()) is not None:
+                request_swaps.append(server_url)
+            get_warm_up(hass, server_url).async_mark_cold(desired_model)
             return True
         except Exception as err:
             _LOGGER.error("Error during model hot-swap: %s", err)
             return False
 
 
+async def async_load_model(
+    hass: HomeAssistant,
+    server_url: str,
+    model: str,
+    priority: str = PRIORITY_BULK,
+    fairness_window: float = DEFAULT_FAIRNESS_WINDOW,
+) -> bool:
+    """Load ``model`` on a server ahead of its requests, queued as bulk work by default.
+
+    The switch goes through the server's scheduler and lock like any request,
+    so it never races live TTS traffic.
+    """
+    if not get_circuit_breaker(hass, server_url).allows_requests:
+        return False
+    return await get_scheduler(hass, server_url).run(
+        model, partial(_ensure_model, hass, server_url, model), fairness_window, priority
+    )
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -159,14 +530,34 @@ async def async_setup_entry(
     except Exception:
         _LOGGER.exception("Failed to create ChatterboxTTSEntity for entry %s", entry.entry_id)
 
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_PREFETCH,
+        {
+            vol.Required(ATTR_MESSAGE): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_LANGUAGE): cv.string,
+        },
+        "async_prefetch",
+    )
+    platform.async_register_entity_service(SERVICE_REFRESH_VOICES, {}, "async_refresh_voices")
+    platform.async_register_entity_service(
+        SERVICE_SYNTHESIZE_BATCH,
+        {**BATCH_SERVICE_SCHEMA, vol.Optional(ATTR_LANGUAGE): cv.string},
+        "async_synthesize_batch",
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
 
 class ChatterboxTTSEntity(TextToSpeechEntity):
     def __init__(self, hass: HomeAssistant, data: dict, options: dict, entry_id: str, entry_unique_id: str | None = None):
         self.hass = hass
+        self._entry_id = entry_id
         self._data = data  # Fixed setup data
         self._options = options or {}
         self._cfg = {**data, **(options or {})}
-        self._url = data[CONF_URL].rstrip("/")
+        self._urls = get_entry_urls(self._cfg)
+        self._url = self._urls[0]
+        self._prepositioners: dict[str, ModelPrepositioner] = {}
         raw_voice = data.get(CONF_REFERENCE_AUDIO, "default")
         stem = raw_voice.split(".")[0].lower()
         clean_voice = re.sub(r'[^a-z0-9]+', '_', stem).strip("_") or "default"
@@ -183,6 +574,114 @@ class ChatterboxTTSEntity(TextToSpeechEntity):
             self.entity_id = f"tts.chatterbox_{clean_voice}"
             _LOGGER.debug("Legacy entry: unique_id=%s entity_id=%s", self._attr_unique_id, self.entity_id)
 
+    async def async_added_to_hass(self) -> None:
+        """Follow server status, warm the voice list, apply the concurrency limit and join pre-positioning."""
+        voice_mode = self._cfg.get(CONF_VOICE_MODE, "clone")
+        for url in self._urls:
+            self.async_on_remove(
+                get_server_coordinator(self.hass, url).async_add_listener(
+                    self.async_write_ha_state
+                )
+            )
+            get_voice_catalogue(self.hass, url).async_start_fetch(voice_mode)
+
+        settings = PrepositionSettings(
+            idle_seconds=float(self._cfg.get(CONF_PREPOSITION_IDLE, DEFAULT_PREPOSITION_IDLE)) * 60,
+            quiet_start=dt_util.parse_time(self._cfg.get(CONF_QUIET_HOURS_START, DEFAULT_QUIET_HOURS)),
+            quiet_end=dt_util.parse_time(self._cfg.get(CONF_QUIET_HOURS_END, DEFAULT_QUIET_HOURS)),
+        )
+        usage = await async_get_model_usage(self.hass)
+        max_concurrent = int(self._cfg.get(CONF_MAX_CONCURRENT, DEFAULT_MAX_CONCURRENT))
+        for url in self._urls:
+            scheduler = get_scheduler(self.hass, url)
+            scheduler.set_limit(self._entry_id, max_concurrent)
+            prepositioner = get_prepositioner(
+                self.hass,
+                url,
+                usage,
+                partial(async_load_model, self.hass, url),
+                lambda scheduler=scheduler: scheduler.load > 0,
+            )
+            prepositioner.async_configure(self._entry_id, settings)
+            self._prepositioners[url] = prepositioner
+
+        if self._cfg.get(CONF_WARM_UP, True) and (payload := self._warm_up_payload()):
+            model_type = self._cfg.get(CONF_MODEL_TYPE, DEFAULT_MODEL_TYPE)
+            for url in self._urls:
+                get_warm_up(self.hass, url).async_register(self._entry_id, model_type, payload)
+                self.async_on_remove(
+                    async_dispatcher_connect(
+                        self.hass, SIGNAL_WARM_UP_UPDATED.format(url), self.async_write_ha_state
+                    )
+                )
+            self.hass.async_create_background_task(
+                self._async_warm_up(), f"chatterbox_tts warm-up {self.entity_id}"
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Leave idle model pre-positioning and warm-up and drop this entity's concurrency limit."""
+        for prepositioner in self._prepositioners.values():
+            prepositioner.async_configure(self._entry_id, None)
+        self._prepositioners.clear()
+        model_type = self._cfg.get(CONF_MODEL_TYPE, DEFAULT_MODEL_TYPE)
+        for url in self._urls:
+            get_scheduler(self.hass, url).set_limit(self._entry_id, None)
+            get_warm_up(self.hass, url).async_register(self._entry_id, model_type, None)
+
+    def _warm_up_payload(self) -> dict | None:
+        """A short /tts request in this entity's voice, or None without a voice."""
+        voice_filename = self._cfg.get(CONF_REFERENCE_AUDIO)
+        if not voice_filename:
+            return None
+        voice_mode = self._cfg.get(CONF_VOICE_MODE, "clone")
+        payload: dict = {
+            "text": WARM_UP_TEXT,
+            "voice_mode": voice_mode,
+            "output_format": _select_output_format(
+                self._cfg.get(CONF_OUTPUT_FORMAT, DEFAULT_OUTPUT_FORMAT), None
+            ),
+            "split_text": False,
+            "exaggeration": float(self._cfg.get(CONF_EXAGGERATION, 0.5)),
+            "speed_factor": float(self._cfg.get(CONF_SPEED_FACTOR, 1.0)),
+        }
+        if voice_mode == "clone":
+            payload["reference_audio_filename"] = voice_filename
+        else:
+            payload["predefined_voice_id"] = voice_filename
+        if self._cfg.get(CONF_MODEL_TYPE) == "chatterbox-multilingual":
+            payload["language"] = (self._cfg.get(CONF_LANGUAGE) or "en").split("-")[0]
+        return payload
+
+    async def _async_warm_up(self) -> None:
+        """Check each server and voice once, then warm servers already running this model.
+
+        Servers running another model are left alone: the warm-up never
+        swaps, it only follows the swap a real request or pre-positioning
+        makes.
+        """
+        model_type = self._cfg.get(CONF_MODEL_TYPE, DEFAULT_MODEL_TYPE)
+        voice_mode = self._cfg.get(CONF_VOICE_MODE, "clone")
+        voice = self._cfg[CONF_REFERENCE_AUDIO]
+        for url in self._urls:
+            status = await get_server_coordinator(self.hass, url).async_check()
+            if status is None or status.model != model_type:
+                continue
+            if not await get_voice_catalogue(self.hass, url).async_has_voice(voice_mode, voice):
+                _LOGGER.warning("Not warming up %s: voice %r is not available there", url, voice)
+                continue
+            warm_up = get_warm_up(self.hass, url)
+            if warm_up.model is None:
+                warm_up.async_mark_cold(model_type)
+            else:
+                warm_up.async_start(model_type)
+
+    @property
+    def available(self) -> bool:
+        """Return True while at least one of the entity's servers answers its status poll."""
+        return any(
+            get_server_coordinator(self.hass, url).last_update_success for url in self._urls
+        )
+
     @property
     def default_language(self) -> str | None:
         return "en-US"
@@ -193,7 +692,41 @@ class ChatterboxTTSEntity(TextToSpeechEntity):
 
     @property
     def supported_options(self) -> list[str]:
-        return [CONF_EXAGGERATION, CONF_SPEED_FACTOR, CONF_LANGUAGE]
+        return [
+            CONF_EXAGGERATION,
+            CONF_SPEED_FACTOR,
+            CONF_LANGUAGE,
+            CONF_OUTPUT_FORMAT,
+            CONF_CHUNK_SIZE,
+            CONF_PRIORITY,
+            CONF_SUPERSEDE,
+            CONF_LATENCY_BUDGET,
+            CONF_TEMPLATE,
+        ]
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Expose the shared server scheduler and audio cache counters and model readiness."""
+        stats = get_scheduler(self.hass, self._url).stats
+        attrs = {
+            "server_swaps": stats["swaps"],
+            "server_swaps_avoided": stats["swaps_avoided"],
+            "server_queue_depth": stats["queue_depth"],
+        }
+        if cache := self.hass.data.get(DOMAIN, {}).get("audio_cache"):
+            attrs["cache_hits"] = cache.hits
+            attrs["cache_misses"] = cache.misses
+        model_type = self._cfg.get(CONF_MODEL_TYPE, DEFAULT_MODEL_TYPE)
+        readiness = {
+            get_warm_up(self.hass, url).readiness_for(model_type) for url in self._urls
+        }
+        if READINESS_READY in readiness:
+            attrs["readiness"] = READINESS_READY
+        elif READINESS_WARMING in readiness:
+            attrs["readiness"] = READINESS_WARMING
+        else:
+            attrs["readiness"] = READINESS_COLD
+        return attrs
 
     @property
     def default_options(self) -> dict:
@@ -208,28 +741,74 @@ class ChatterboxTTSEntity(TextToSpeechEntity):
         language: str | None = None,
         options: dict | None = None,
     ) -> tuple[str, bytes] | tuple[None, None]:
+        if not self._cfg.get(CONF_RECORD_TRACE, False):
+            return await self._async_get_tts_audio(message, language, options)
+
+        model_type = self._cfg.get(CONF_MODEL_TYPE, DEFAULT_MODEL_TYPE)
+        arrived = time.time()
+        started = time.monotonic()
+        model_loaded = any(
+            get_model_state(self.hass, url).is_current(model_type) for url in self._urls
+        )
+        swaps: list[str] = []
+        token = _REQUEST_SWAPS.set(swaps)
+        outcome = "failed"
+        try:
+            result = await self._async_get_tts_audio(message, language, options)
+            if result[1] is not None:
+                outcome = "ok"
+            return result
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        finally:
+            _REQUEST_SWAPS.reset(token)
+            get_trace_recorder(self.hass).async_record(
+                {
+                    "ts": round(arrived, 3),
+                    "entity": self.entity_id,
+                    "model": model_type,
+                    "chars": len(message),
+                    "text": text_fingerprint(message),
+                    "language": language,
+                    "options": {
+                        key: value
+                        for key, value in (options or {}).items()
+                        if key in TRACED_OPTIONS
+                    },
+                    "latency": round(time.monotonic() - started, 3),
+                    "outcome": outcome,
+                    "model_loaded": model_loaded,
+                    "swapped": bool(swaps),
+                }
+            )
+
+    async def _async_get_tts_audio(
+        self,
+        message: str,
+        language: str | None,
+        options: dict | None,
+        segmented: bool = False,
+    ) -> tuple[str, bytes] | tuple[None, None]:
+        if not segmented and (segments := self._template_segments(message, options)):
+            return await self._async_get_segmented(message, segments, language, options)
+
         model_type = self._cfg.get(CONF_MODEL_TYPE, DEFAULT_MODEL_TYPE)
         _LOGGER.debug(
             "TTS request: entity=%s model_type=%r cfg=%s",
             self.entity_id, model_type, self._cfg,
         )
 
-        # Ensure the server is running the correct model for this entity
-        model_ok = await _ensure_model(self.hass, self._url, model_type)
-        if not model_ok:
-            _LOGGER.error(
-                "Failed to switch server to model '%s' — TTS request aborted",
-                model_type,
-            )
-            return None, None
-
         opts = {**self.default_options, **(options or {})}
+        output_format = _select_output_format(
+            opts.get(CONF_OUTPUT_FORMAT, DEFAULT_OUTPUT_FORMAT), opts.get(ATTR_PREFERRED_FORMAT)
+        )
         payload: dict = {
             "text": message,
             "voice_mode": self._cfg.get(CONF_VOICE_MODE, "clone"),
-            "output_format": "mp3",
+            "output_format": output_format,
             "split_text": True,
-            "chunk_size": 240,
+            "chunk_size": int(opts.get(CONF_CHUNK_SIZE, DEFAULT_CHUNK_SIZE)),
             "exaggeration": float(opts.get("exaggeration", 0.5)),
             "speed_factor": float(opts.get("speed_factor", 1.0)),
         }
@@ -242,6 +821,13 @@ class ChatterboxTTSEntity(TextToSpeechEntity):
         else:
             _LOGGER.error("No voice filename in data - skipping TTS request")
             return None, None
+        if not await get_voice_catalogue(self.hass, self._url).async_has_voice(
+            payload["voice_mode"], voice_filename
+        ):
+            _LOGGER.error(
+                "Voice %r is not available on %s - skipping TTS request", voice_filename, self._url
+            )
+            return None, None
 
         # Pass language for multilingual model
         if model_type == "chatterbox-multilingual":
@@ -252,16 +838,536 @@ class ChatterboxTTSEntity(TextToSpeechEntity):
                 lang = lang.split("-")[0]
             payload["language"] = lang
 
-        _LOGGER.debug("Sending payload to Chatterbox: %s", payload)
+        priority = opts.get(CONF_PRIORITY, PRIORITY_NORMAL)
+        if priority not in PRIORITIES:
+            _LOGGER.warning("Unknown priority %r, using %r", priority, PRIORITY_NORMAL)
+            priority = PRIORITY_NORMAL
+        tag = str(opts[CONF_SUPERSEDE]) if opts.get(CONF_SUPERSEDE) else None
+        budget = float(opts.get(CONF_LATENCY_BUDGET) or 0)
+
+        # Identical concurrent requests share one synthesis: the first caller
+        # leads and the others wait on its result, including its failure.
+        # When every caller has gone away the shared request is cancelled.
+        # Only requests queued the same way share: an urgent caller must not
+        # wait at a bulk prefetch's priority, nor get the None of another
+        # tag's supersede or the fallback audio of another caller's budget.
+        key = cache_key(
+            model_type,
+            # Trimmed clips are cached apart from untrimmed ones
+            {**payload, CONF_TRIM_SILENCE: True} if self._cfg.get(CONF_TRIM_SILENCE) else payload,
+        )
+        request_key = f"{key}:{priority}:{tag or ''}:{budget:g}"
+        domain_data = self.hass.data.setdefault(DOMAIN, {})
+        inflight: dict[str, asyncio.Task] = domain_data.setdefault("inflight_requests", {})
+        waiters: dict[str, int] = domain_data.setdefault("inflight_waiters", {})
+        if (task := inflight.get(request_key)) is None:
+            task = self.hass.async_create_task(
+                self._async_get_audio(model_type, payload, key, priority, tag, budget)
+            )
+            inflight[request_key] = task
+            task.add_done_callback(partial(_forget_inflight, inflight, request_key))
+        else:
+            _LOGGER.debug("Joining in-flight TTS request %s", request_key)
+        waiters[request_key] = waiters.get(request_key, 0) + 1
         try:
-            async with aiohttp.ClientSession(timeout=_TTS_TIMEOUT) as session:
-                async with session.post(f"{self._url}/tts", json=payload) as response:
-                    if response.status != 200:
-                        text = await response.text()
-                        _LOGGER.error("Chatterbox TTS error %s: %s", response.status, text)
-                        return None, None
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if waiters[request_key] == 1 and not task.done():
+                _LOGGER.debug("No callers left for TTS request %s, cancelling it", request_key)
+                task.cancel()
+            raise
+        finally:
+            waiters[request_key] -= 1
+            if not waiters[request_key]:
+                del waiters[request_key]
+
+    def _template_segments(self, message: str, options: dict | None) -> list[str] | None:
+        """Split a message by the call's or the entity's templates, if one matches.
+
+        Without the audio cache every segment would be synthesised on every
+        call, so the message is then left whole.
+        """
+        if not self._cfg.get(CONF_AUDIO_CACHE, True):
+            return None
+        templates = list(self._cfg.get(CONF_TEMPLATES) or [])
+        if template := (options or {}).get(CONF_TEMPLATE):
+            templates.insert(0, template)
+        segments = split_message(message, templates) if templates else None
+        if not segments or len(segments) < 2:
+            return None
+        return [text for text, _static in segments]
+
+    async def _async_get_segmented(
+        self, message: str, segments: list[str], language: str | None, options: dict | None
+    ) -> tuple[str, bytes] | tuple[None, None]:
+        """Synthesise a templated message as its static phrases plus variable parts.
+
+        Every segment is an ordinary request, so static phrases come from the
+        audio cache after their first render and only the variable parts
+        reach the server. Segments are joined with a short pause. If they
+        can't be joined the whole message is synthesised instead.
+        """
+        options = dict(options or {})
+        options.pop(CONF_TEMPLATE, None)
+        if tag := options.pop(CONF_SUPERSEDE, None):
+            # Supersede once for the whole message, not segment by segment,
+            # which would cancel its own earlier segments
+            for url in self._urls:
+                get_scheduler(self.hass, url).supersede(str(tag))
+        _LOGGER.debug("Templated message split into %s", segments)
+        results = await asyncio.gather(
+            *(
+                self._async_get_tts_audio(segment, language, options, segmented=True)
+                for segment in segments
+            )
+        )
+        if any(audio is None for _, audio in results):
+            return None, None
+        extension = results[0][0]
+        if all(ext == extension for ext, _ in results) and (
+            audio := join_audio(extension, [audio for _, audio in results], _SEGMENT_GAP_SECONDS)
+        ):
+            return extension, audio
+        _LOGGER.warning("Could not join templated %s segments, synthesising the whole message", extension)
+        return await self._async_get_tts_audio(message, language, options, segmented=True)
+
+    async def _async_get_audio(
+        self,
+        model_type: str,
+        payload: dict,
+        key: str,
+        priority: str,
+        tag: str | None,
+        budget: float,
+    ) -> tuple[str, bytes] | tuple[None, None]:
+        """Serve a request from the audio cache or synthesise it on a server."""
+        if tag:
+            # A newer announcement replaces older ones with the same tag
+            # that haven't started yet
+            for url in self._urls:
+                get_scheduler(self.hass, url).supersede(tag)
+
+        cache = None
+        if self._cfg.get(CONF_AUDIO_CACHE, True):
+            cache = await async_get_audio_cache(self.hass)
+            if cached := await cache.async_get(key):
+                _LOGGER.debug("Audio cache hit for %s", key)
+                return cached
+
+        servers = await _async_route(self.hass, self._urls, model_type)
+        if budget and (fallback := self._latency_fallback(servers, model_type, payload, budget)):
+            # Not what was asked for, so keep it out of the cache
+            model_type, payload = fallback
+            cache = None
+        extension = audio = None
+        try:
+            if (
+                self._cfg.get(CONF_PARALLEL_LONG_MESSAGES, True)
+                and len(payload["text"]) >= _FAN_OUT_MIN_CHARS
+            ):
+                extension, audio = await self._async_fan_out(
+                    model_type, payload, servers, priority, tag
+                )
+            if audio is None:
+                extension, audio = await self._async_run_on_pool(
+                    model_type, payload, servers, priority, tag
+                )
+        except JobSuperseded:
+            _LOGGER.info("TTS request superseded by a newer %r request", tag)
+            return None, None
+
+        if cache is not None and audio is not None:
+            await cache.async_put(key, extension, audio)
+        return extension, audio
+
+    def _latency_fallback(
+        self, servers: list[str], model_type: str, payload: dict, budget: float
+    ) -> tuple[str, dict] | None:
+        """Pick the loaded model instead of swapping if a swap would blow the budget.
+
+        Only applies when no server in the pool has the model loaded and the
+        first-choice server's model can serve the request.
+        """
+        if not servers or any(
+            get_model_state(self.hass, url).is_current(model_type) for url in servers
+        ):
+            return None
+        server_url = servers[0]
+        loaded = get_model_state(self.hass, server_url).selector
+        if loaded is None or loaded == model_type:
+            return None
+        metrics = get_server_metrics(self.hass, server_url)
+        expected_swap = metrics.expected_swap_seconds
+        if expected_swap <= budget:
+            return None
+        if (mapped := _fallback_payload(payload, model_type, loaded)) is None:
+            return None
+        _LOGGER.info(
+            "Expected swap on %s (%.0f s) exceeds the %.0f s latency budget; "
+            "using the loaded model %r instead of %r",
+            server_url, expected_swap, budget, loaded, model_type,
+        )
+        metrics.record_fallback(model_type, loaded, expected_swap)
+        return loaded, mapped
+
+    async def _async_run_on_pool(
+        self,
+        model_type: str,
+        payload: dict,
+        servers: list[str],
+        priority: str = PRIORITY_NORMAL,
+        tag: str | None = None,
+    ) -> tuple[str, bytes] | tuple[None, None]:
+        """Synthesise on the first server in ``servers`` that is available.
+
+        Queues behind other requests on each server, batched by model and
+        ordered by priority, and fails over to the next server if one is
+        unavailable. JobSuperseded propagates to the caller.
+        """
+        fairness_window = float(self._cfg.get(CONF_FAIRNESS_WINDOW, DEFAULT_FAIRNESS_WINDOW))
+        for server_url in servers:
+            try:
+                return await get_scheduler(self.hass, server_url).run(
+                    model_type,
+                    partial(
+                        self._async_synthesize, server_url, model_type, payload, time.monotonic()
+                    ),
+                    fairness_window,
+                    priority,
+                    tag,
+                )
+            except _ServerUnavailable:
+                _LOGGER.warning("Chatterbox server %s unavailable, trying next server", server_url)
+        _LOGGER.error("No Chatterbox server could handle the TTS request")
+        return None, None
+
+    async def _async_fan_out(
+        self, model_type: str, payload: dict, servers: list[str], priority: str, tag: str | None
+    ) -> tuple[str, bytes] | tuple[None, None]:
+        """Split a long message across every server with the model loaded.
+
+        Each piece starts on its own server (and can still fail over), and
+        the clips are joined in order. Returns (None, None) when fewer than
+        two servers are ready or any piece fails, so the caller falls back to
+        a single request.
+        """
+        ready = [url for url in servers if get_model_state(self.hass, url).is_current(model_type)]
+        if len(ready) < 2:
+            return None, None
+        pieces = _partition_sentences(_split_sentences(payload["text"]), len(ready))
+        if len(pieces) < 2:
+            return None, None
+        _LOGGER.debug(
+            "Fanning out %d chars as %d pieces across %s", len(payload["text"]), len(pieces), ready
+        )
+        results = await asyncio.gather(
+            *(
+                self._async_run_on_pool(
+                    model_type,
+                    {**payload, "text": piece},
+                    [ready[i], *(url for url in servers if url != ready[i])],
+                    priority,
+                    tag,
+                )
+                for i, piece in enumerate(pieces)
+            )
+        )
+        if any(audio is None for _, audio in results):
+            return None, None
+        extension = results[0][0]
+        audio = join_audio(extension, [audio for _, audio in results])
+        if audio is None:
+            _LOGGER.warning("Could not join %s pieces, retrying as a single request", extension)
+            return None, None
+        return extension, audio
+
+    async def async_prefetch(self, message: list[str], language: str | None = None) -> None:
+        """Synthesise messages ahead of time so later calls hit the audio cache."""
+        if not self._cfg.get(CONF_AUDIO_CACHE, True):
+            _LOGGER.warning("Audio cache is disabled for %s; nothing to prefetch", self.entity_id)
+            return
+        for text in message:
+            _, audio = await self.async_get_tts_audio(
+                text, language or self.default_language, {CONF_PRIORITY: PRIORITY_BULK}
+            )
+            if audio is None:
+                _LOGGER.warning("Prefetch failed for %r on %s", text, self.entity_id)
+
+    async def async_synthesize_batch(
+        self,
+        items: list[dict],
+        concurrency: int,
+        name: str | None = None,
+        language: str | None = None,
+    ) -> ServiceResponse:
+        """Render many messages to media files and write a manifest.
+
+        The model is loaded once up front, then up to ``concurrency`` items
+        are kept in flight at bulk priority over the pooled server
+        connection, so the server never waits on the next request.
+        """
+        model_type = self._cfg.get(CONF_MODEL_TYPE, DEFAULT_MODEL_TYPE)
+        name = name or dt_util.now().strftime("%Y%m%d_%H%M%S")
+        directory = batch_directory(self.hass, name)
+        progress = BatchProgress(self.hass, self.entity_id, name, len(items))
+        _LOGGER.info("Batch %s: rendering %d clip(s) to %s", name, len(items), directory)
+
+        if servers := await _async_route(self.hass, self._urls, model_type):
+            await async_load_model(
+                self.hass,
+                servers[0],
+                model_type,
+                fairness_window=float(self._cfg.get(CONF_FAIRNESS_WINDOW, DEFAULT_FAIRNESS_WINDOW)),
+            )
+
+        semaphore = asyncio.Semaphore(concurrency)
+        used: set[str] = set()
+
+        async def _render(index: int, item: dict) -> dict:
+            message = item[ATTR_MESSAGE]
+            options = item.get(ATTR_OPTIONS) or {}
+            entry = {"index": index, "message": message, "options": options}
+            try:
+                async with semaphore:
+                    started = time.monotonic()
+                    extension, audio = await self.async_get_tts_audio(
+                        message,
+                        language or self.default_language,
+                        {CONF_PRIORITY: PRIORITY_BULK, **options},
+                    )
+                if audio is not None:
+                    filename = item_filename(index, item, extension, used)
+                    await self.hass.async_add_executor_job(write_clip, directory / filename, audio)
+            except Exception as err:
+                # One bad item must not cost the rest of the batch its manifest
+                _LOGGER.exception("Batch %s: item %d failed", name, index)
+                progress.async_item_done(len(message), None)
+                return {**entry, "status": "failed", "error": str(err)}
+            if audio is None:
+                progress.async_item_done(len(message), None)
+                return {**entry, "status": "failed"}
+            progress.async_item_done(len(message), len(audio))
+            return {
+                **entry,
+                "status": "ok",
+                "file": filename,
+                "bytes": len(audio),
+                "seconds": round(time.monotonic() - started, 2),
+            }
+
+        results = await asyncio.gather(*(_render(i, item) for i, item in enumerate(items)))
+        manifest = {
+            **progress.summary,
+            "model": model_type,
+            "created": dt_util.utcnow().isoformat(),
+            "directory": str(directory),
+            "items": results,
+        }
+        await self.hass.async_add_executor_job(write_manifest, directory, manifest)
+        _LOGGER.info(
+            "Batch %s: %d/%d clip(s) in %.1f s (%s chars/s), %d failed",
+            name, progress.done - progress.failed, progress.total,
+            manifest["elapsed_seconds"], manifest["chars_per_second"], progress.failed,
+        )
+        return manifest
+
+    async def async_refresh_voices(self) -> None:
+        """Re-fetch the voice list from every server this entity uses."""
+        voice_mode = self._cfg.get(CONF_VOICE_MODE, "clone")
+        await asyncio.gather(
+            *(get_voice_catalogue(self.hass, url).async_refresh(voice_mode) for url in self._urls)
+        )
+
+    async def async_stream_tts_audio(self, request: TTSAudioRequest) -> TTSAudioResponse:
+        """Synthesise text that is still arriving sentence by sentence.
+
+        A complete message takes the whole-message path, with caching,
+        templates, fan-out and the player's format. Text that is still being
+        written, for example by an LLM, is read as it arrives and each
+        sentence is sent to /tts as soon as it ends. Each MP3 or Opus segment
+        is yielded as soon as it is ready, in order.
+        """
+        options = {**self.default_options, **(request.options or {})}
+        output_format = _select_output_format(
+            options.get(CONF_OUTPUT_FORMAT, DEFAULT_OUTPUT_FORMAT), options.get(ATTR_PREFERRED_FORMAT)
+        )
+        message, chunks = await _async_complete_message(request.message_gen)
+        if message is not None:
+            return TTSAudioResponse(
+                extension=_FORMAT_EXTENSIONS[output_format],
+                data_gen=self._async_stream_message(message, request.language, request.options),
+            )
+        if output_format == "wav":
+            # Every WAV segment carries its own header, so they can't simply
+            # be concatenated; MP3 frames and chained Ogg streams can
+            output_format = "mp3"
+        options[CONF_OUTPUT_FORMAT] = output_format
+        return TTSAudioResponse(
+            extension=_FORMAT_EXTENSIONS[output_format],
+            data_gen=self._async_stream_sentences(
+                _async_split_stream(chunks), request.language, options
+            ),
+        )
+
+    async def _async_stream_message(
+        self, message: str, language: str | None, options: dict | None
+    ) -> AsyncGenerator[bytes, None]:
+        """Yield the audio of a complete message, synthesised in one piece."""
+        _, audio = await self.async_get_tts_audio(message, language, options)
+        if audio is None:
+            raise HomeAssistantError("Chatterbox TTS request failed")
+        yield audio
+
+    async def _async_stream_sentences(
+        self, sentences: AsyncIterable[str], language: str | None, options: dict | None
+    ) -> AsyncGenerator[bytes, None]:
+        """Yield audio for each sentence in order, keeping a few requests in flight.
+
+        Sentences are read in the background, so a request starts as soon as
+        its sentence arrives while earlier audio is still being played. MP3
+        segments lose their tags and Xing frame, as in join_audio, so the
+        stream reads as one file rather than stopping after a sentence.
+        """
+        pending: deque[asyncio.Task | None] = deque()
+        ready = asyncio.Event()
+        slots = asyncio.Semaphore(_STREAM_PIPELINE_DEPTH)
+
+        async def _read_sentences() -> None:
+            try:
+                async for sentence in sentences:
+                    await slots.acquire()
+                    _LOGGER.debug("Streaming sentence %r", sentence)
+                    pending.append(
+                        asyncio.create_task(self.async_get_tts_audio(sentence, language, options))
+                    )
+                    ready.set()
+            finally:
+                pending.append(None)
+                ready.set()
+
+        reader = asyncio.create_task(_read_sentences())
+        try:
+            while True:
+                await ready.wait()
+                ready.clear()
+                while pending:
+                    if (task := pending.popleft()) is None:
+                        # Surface errors from the incoming text stream
+                        await reader
+                        return
+                    try:
+                        extension, audio = await task
+                    finally:
+                        slots.release()
+                    if audio is None:
+                        raise HomeAssistantError("Chatterbox TTS request failed")
+                    yield _mp3_frames(audio) if extension == "mp3" else audio
+        finally:
+            reader.cancel()
+            for task in pending:
+                if task is not None:
+                    task.cancel()
+
+    async def _async_synthesize(
+        self, server_url: str, model_type: str, payload: dict, queued_at: float
+    ) -> tuple[str, bytes] | tuple[None, None]:
+        """Switch a server to this entity's model if needed and run /tts.
+
+        Raises _ServerUnavailable on timeouts, connection errors and 5xx
+        responses so the caller can fail over to another server.
+        """
+        breaker = get_circuit_breaker(self.hass, server_url)
+        metrics = get_server_metrics(self.hass, server_url)
+        metrics.record("queue_wait", time.monotonic() - queued_at)
+        if prepositioner := self._prepositioners.get(server_url):
+            prepositioner.async_record_request(model_type)
+        if not breaker.allows_requests:
+            # Tripped by another request while this one was queued
+            raise _ServerUnavailable
+
+        # Ensure the server is running the correct model for this entity
+        model_ok = await _ensure_model(self.hass, server_url, model_type)
+        if not model_ok:
+            _LOGGER.error(
+                "Failed to switch server %s to model '%s' — TTS request aborted",
+                server_url, model_type,
+            )
+            # An unreachable server was already counted by the model check
+            if get_server_coordinator(self.hass, server_url).last_update_success:
+                breaker.record_failure()
+            metrics.record_failure()
+            raise _ServerUnavailable
+
+        _LOGGER.debug("Sending payload to Chatterbox %s: %s", server_url, payload)
+        session = get_server_session(self.hass, server_url)
+        chars = len(payload["text"])
+        ahead = metrics.inflight_chars
+        timeout = _tts_timeout(metrics.seconds_per_char, ahead + chars)
+        spool = chars >= _SPOOL_MIN_CHARS
+        if spool:
+            timeout = _spool_timeout(timeout)
+        metrics.inflight_chars += chars
+        synthesis_started = time.monotonic()
+        try:
+            async with session.post(
+                f"{server_url}/tts", json=payload, timeout=timeout
+            ) as response:
+                if response.status != 200:
+                    text = await response.text()
+                    _LOGGER.error("Chatterbox TTS error %s: %s", response.status, text)
+                    metrics.record_failure()
+                    # The server may have swapped or restarted its model; re-check next time
+                    get_model_state(self.hass, server_url).invalidate()
+                    if response.status >= 500:
+                        breaker.record_failure()
+                        raise _ServerUnavailable
+                    return None, None
+                if spool:
+                    audio = await self._async_read_spooled(response)
+                else:
                     audio = await response.read()
-                    return "mp3", audio
+                breaker.record_success()
+                elapsed = time.monotonic() - synthesis_started
+                metrics.record("synthesis", elapsed)
+                get_warm_up(self.hass, server_url).async_record_request(model_type, elapsed)
+                metrics.record_throughput(elapsed, ahead + chars)
+                extension = _FORMAT_EXTENSIONS[payload["output_format"]]
+                if self._cfg.get(CONF_TRIM_SILENCE) and extension != "ogg":
+                    with metrics.timed("trim"):
+                        audio = await self.hass.async_add_executor_job(
+                            trim_silence, extension, audio
+                        )
+                metrics.record_success(time.monotonic() - queued_at, len(audio))
+                return extension, audio
+        except _ServerUnavailable:
+            raise
+        except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+            _LOGGER.error(
+                "Chatterbox server %s did not respond within %.0f s: %s",
+                server_url, timeout.total or timeout.sock_read, err,
+            )
+            metrics.record_failure(timeout=isinstance(err, asyncio.TimeoutError))
+            get_model_state(self.hass, server_url).invalidate()
+            breaker.record_failure()
+            raise _ServerUnavailable from err
         except Exception as err:
             _LOGGER.exception("Unexpected error in Chatterbox TTS: %s", err)
+            metrics.record_failure()
+            get_model_state(self.hass, server_url).invalidate()
             return None, None
+        finally:
+            metrics.inflight_chars -= chars
+
+    async def _async_read_spooled(self, response: aiohttp.ClientResponse) -> bytes:
+        """Stream a response body to a temporary file, then read it back whole.
+
+        Callers need the whole clip, so peak memory is about the same as
+        reading the response directly.
+        """
+        spool = await self.hass.async_add_executor_job(tempfile.TemporaryFile)
+        try:
+            async for chunk in response.content.iter_chunked(_SPOOL_CHUNK_BYTES):
+                await self.hass.async_add_executor_job(spool.write, chunk)
+            return await self.hass.async_add_executor_job(_read_spool, spool)
+        finally:
+            await self.hass.async_add_executor_job(spool.close)
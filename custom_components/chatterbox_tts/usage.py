@@ -0,0 +1,239 @@
+"""Usage-driven idle model pre-positioning for Chatterbox TTS servers."""
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import time as dt_time
+import logging
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .metrics import get_server_metrics
+from .server import get_model_state
+
+_LOGGER = logging.getLogger(__name__)
+
+_STORAGE_KEY = f"{DOMAIN}.model_usage"
+_STORAGE_VERSION = 1
+_SAVE_DELAY = 60
+
+# Each new request scales its hour's counts by this factor first, so the
+# histogram follows changing habits instead of averaging over all time
+_DECAY = 0.98
+# A prediction needs at least this much (decayed) history and this share of it
+_MIN_SAMPLES = 5
+_MIN_SHARE = 0.5
+
+
+@dataclass(frozen=True)
+class PrepositionSettings:
+    """One entity's pre-positioning options."""
+
+    idle_seconds: float
+    quiet_start: dt_time
+    quiet_end: dt_time
+
+    def is_quiet(self, now: dt_time) -> bool:
+        """Return True if ``now`` falls within the quiet hours."""
+        if self.quiet_start == self.quiet_end:
+            return False
+        if self.quiet_start < self.quiet_end:
+            return self.quiet_start <= now < self.quiet_end
+        return now >= self.quiet_start or now < self.quiet_end
+
+
+class ModelUsage:
+    """Decayed counts of requested models per server and hour of day.
+
+    Stored in .storage so predictions survive restarts.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(hass, _STORAGE_VERSION, _STORAGE_KEY)
+        self._servers: dict[str, list[dict[str, float]]] = {}
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        """Load saved histograms once."""
+        if self._loaded:
+            return
+        self._loaded = True
+        data = await self._store.async_load() or {}
+        for server_url, hours in data.get("servers", {}).items():
+            if isinstance(hours, list) and len(hours) == 24:
+                self._servers.setdefault(server_url, hours)
+
+    def _hours(self, server_url: str) -> list[dict[str, float]]:
+        if server_url not in self._servers:
+            self._servers[server_url] = [{} for _ in range(24)]
+        return self._servers[server_url]
+
+    @callback
+    def async_record(self, server_url: str, model: str, hour: int) -> None:
+        """Count one request for ``model`` in ``hour``."""
+        bucket = self._hours(server_url)[hour]
+        for key in bucket:
+            bucket[key] *= _DECAY
+        bucket[model] = bucket.get(model, 0.0) + 1
+        self._store.async_delay_save(lambda: {"servers": self._servers}, _SAVE_DELAY)
+
+    def predict(self, server_url: str, hour: int) -> str | None:
+        """Model most likely needed in the current or next hour, if clear enough.
+
+        Falls back to the whole day when those hours have too little history.
+        """
+        hours = self._hours(server_url)
+        for buckets in ((hours[hour], hours[(hour + 1) % 24]), hours):
+            totals: dict[str, float] = {}
+            for bucket in buckets:
+                for model, count in bucket.items():
+                    totals[model] = totals.get(model, 0.0) + count
+            total = sum(totals.values())
+            if total >= _MIN_SAMPLES:
+                model = max(totals, key=totals.__getitem__)
+                return model if totals[model] / total >= _MIN_SHARE else None
+        return None
+
+    def histogram(self, server_url: str) -> list[dict[str, float]]:
+        """Rounded per-hour counts for diagnostics."""
+        return [
+            {model: round(count, 2) for model, count in bucket.items()}
+            for bucket in self._hours(server_url)
+        ]
+
+
+async def async_get_model_usage(hass: HomeAssistant) -> ModelUsage:
+    """Get the shared model usage histograms, loading them on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    usage: ModelUsage | None = domain_data.get("model_usage")
+    if usage is None:
+        usage = ModelUsage(hass)
+        domain_data["model_usage"] = usage
+    await usage.async_load()
+    return usage
+
+
+class ModelPrepositioner:
+    """Swap an idle server to the model its usage history predicts.
+
+    Every request on the server restarts the idle timer. When it fires
+    outside quiet hours with nothing queued, the predicted model is loaded
+    through ``swap_model`` (the normal model-switch path, queued on the
+    server's scheduler), so the next request finds it already loaded.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        server_url: str,
+        usage: ModelUsage,
+        swap_model: Callable[[str], Awaitable[bool]],
+        is_busy: Callable[[], bool],
+    ) -> None:
+        self.hass = hass
+        self.server_url = server_url
+        self._usage = usage
+        self._swap_model = swap_model
+        self._is_busy = is_busy
+        self._settings: dict[str, PrepositionSettings] = {}
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        # Model the last pre-positioning swap loaded, until the next request
+        self._positioned: str | None = None
+
+    @callback
+    def async_configure(self, entry_id: str, settings: PrepositionSettings | None) -> None:
+        """Set or remove (``None``) an entity's settings for this server."""
+        if settings is None:
+            self._settings.pop(entry_id, None)
+        else:
+            self._settings[entry_id] = settings
+        self._async_schedule()
+
+    @property
+    def idle_seconds(self) -> float | None:
+        """Idle time before pre-positioning, or None if every entity disabled it.
+
+        With several entities on one server the most patient setting wins.
+        """
+        enabled = [s.idle_seconds for s in self._settings.values() if s.idle_seconds > 0]
+        return max(enabled) if enabled else None
+
+    def _is_quiet(self) -> bool:
+        now = dt_util.now().time()
+        return any(settings.is_quiet(now) for settings in self._settings.values())
+
+    @callback
+    def async_record_request(self, model: str) -> None:
+        """Count a request, score the last pre-positioning and restart the idle timer."""
+        self._usage.async_record(self.server_url, model, dt_util.now().hour)
+        if self._positioned is not None:
+            metrics = get_server_metrics(self.hass, self.server_url)
+            if model == self._positioned:
+                metrics.preposition_hits += 1
+            else:
+                metrics.preposition_misses += 1
+            self._positioned = None
+        self._async_schedule()
+
+    @callback
+    def _async_schedule(self) -> None:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if (idle := self.idle_seconds) is not None:
+            self._unsub_timer = async_call_later(self.hass, idle, self._async_idle)
+
+    async def _async_idle(self, _now: Any) -> None:
+        """Load the predicted model if the server is still idle."""
+        self._unsub_timer = None
+        try:
+            if self._is_busy() or self._is_quiet():
+                return
+            model = self._usage.predict(self.server_url, dt_util.now().hour)
+            if model is None or get_model_state(self.hass, self.server_url).selector == model:
+                return
+            _LOGGER.debug("Server %s idle, pre-positioning model %r", self.server_url, model)
+            metrics = get_server_metrics(self.hass, self.server_url)
+            swaps = metrics.swaps
+            if await self._swap_model(model) and metrics.swaps > swaps:
+                metrics.preposition_swaps += 1
+                metrics.async_notify()
+                self._positioned = model
+        finally:
+            # Keep checking while idle: the likely model changes with the hour
+            if self._unsub_timer is None:
+                self._async_schedule()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Settings and history for diagnostics."""
+        return {
+            "idle_seconds": self.idle_seconds,
+            "quiet_now": self._is_quiet(),
+            "prediction": self._usage.predict(self.server_url, dt_util.now().hour),
+            "histogram": self._usage.histogram(self.server_url),
+        }
+
+
+def get_prepositioner(
+    hass: HomeAssistant,
+    server_url: str,
+    usage: ModelUsage,
+    swap_model: Callable[[str], Awaitable[bool]],
+    is_busy: Callable[[], bool],
+) -> ModelPrepositioner:
+    """Get or create the pre-positioner for a server URL."""
+    prepositioners: dict[str, ModelPrepositioner] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault("server_prepositioners", {})
+    if server_url not in prepositioners:
+        prepositioners[server_url] = ModelPrepositioner(
+            hass, server_url, usage, swap_model, is_busy
+        )
+    return prepositioners[server_url]
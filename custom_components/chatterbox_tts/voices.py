@@ -0,0 +1,145 @@
+"""Shared voice catalogue for Chatterbox TTS servers."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .server import get_server_session
+
+_LOGGER = logging.getLogger(__name__)
+
+# Voice lists are served from memory for this long; after that the cached
+# list is still returned at once while a background fetch refreshes it.
+VOICE_CATALOGUE_TTL = 600
+# A voice missing from the catalogue triggers at most one re-fetch this often,
+# in case it was uploaded to the server since the last fetch.
+_MISSING_RECHECK_SECONDS = 60
+
+_FETCH_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+# Server endpoint and option builder for each voice mode
+_ENDPOINTS = {
+    "clone": ("/get_reference_files", lambda f: {"value": f, "label": f}),
+    "predefined": (
+        "/get_predefined_voices",
+        lambda v: {"value": v["filename"], "label": v["display_name"]},
+    ),
+}
+
+
+class VoiceCatalogue:
+    """Cached reference-audio and predefined voice lists for one server.
+
+    Concurrent lookups share a single fetch, so many entities or flows asking
+    at once hit the server once.
+    """
+
+    def __init__(self, hass: HomeAssistant, server_url: str) -> None:
+        self.hass = hass
+        self.server_url = server_url
+        self._voices: dict[str, list[dict[str, str]]] = {}
+        self._fetched_at: dict[str, float] = {}
+        self._fetches: dict[str, asyncio.Task] = {}
+        self.fetches = 0
+
+    def is_stale(self, voice_mode: str) -> bool:
+        """Return True if the list for a mode is missing or older than the TTL."""
+        fetched_at = self._fetched_at.get(voice_mode)
+        return fetched_at is None or time.monotonic() - fetched_at >= VOICE_CATALOGUE_TTL
+
+    async def async_get(self, voice_mode: str) -> list[dict[str, str]] | None:
+        """Return voice options as value/label dicts, or None if unavailable.
+
+        A stale list is returned immediately and refreshed in the background;
+        only the very first lookup waits for the server.
+        """
+        if voice_mode in self._voices:
+            if self.is_stale(voice_mode):
+                self.async_start_fetch(voice_mode)
+            return self._voices[voice_mode]
+        return await self.async_refresh(voice_mode)
+
+    async def async_refresh(self, voice_mode: str) -> list[dict[str, str]] | None:
+        """Fetch the list for a mode now, joining a fetch already running."""
+        return await asyncio.shield(self.async_start_fetch(voice_mode))
+
+    async def async_has_voice(self, voice_mode: str, voice: str) -> bool:
+        """Return False only if the server is known not to have ``voice``.
+
+        Never waits for a first fetch: until a list is cached the voice
+        counts as present, so a slow or unreachable server doesn't hold up
+        synthesis on this check.
+        """
+        voices = self._voices.get(voice_mode)
+        if voices is None or self.is_stale(voice_mode):
+            self.async_start_fetch(voice_mode)
+        if voices is None or any(v["value"] == voice for v in voices):
+            return True
+        if time.monotonic() - self._fetched_at.get(voice_mode, 0) >= _MISSING_RECHECK_SECONDS:
+            voices = await self.async_refresh(voice_mode) or []
+            return any(v["value"] == voice for v in voices)
+        return False
+
+    def async_start_fetch(self, voice_mode: str) -> asyncio.Task:
+        """Start fetching the list for a mode unless a fetch is already running."""
+        if (task := self._fetches.get(voice_mode)) is None:
+            task = self.hass.async_create_background_task(
+                self._async_fetch(voice_mode), f"chatterbox_tts voice list {self.server_url}"
+            )
+            self._fetches[voice_mode] = task
+            task.add_done_callback(lambda _task: self._fetches.pop(voice_mode, None))
+        return task
+
+    async def _async_fetch(self, voice_mode: str) -> list[dict[str, str]] | None:
+        """Fetch one voice list, keeping the previous list on failure."""
+        endpoint, option_builder = _ENDPOINTS.get(voice_mode, _ENDPOINTS["clone"])
+        session = get_server_session(self.hass, self.server_url)
+        self.fetches += 1
+        try:
+            async with session.get(f"{self.server_url}{endpoint}", timeout=_FETCH_TIMEOUT) as resp:
+                _LOGGER.debug("Voice list %s status=%s", endpoint, resp.status)
+                if resp.status != 200:
+                    body = await resp.text()
+                    _LOGGER.warning("Voice list %s returned status %s: %s", endpoint, resp.status, body)
+                    return self._voices.get(voice_mode)
+                data = await resp.json()
+                _LOGGER.debug("Voice list raw response: %s", data)
+                voices = [option_builder(item) for item in data]
+        except Exception:
+            _LOGGER.exception("Failed to fetch voice list from %s%s", self.server_url, endpoint)
+            return self._voices.get(voice_mode)
+        self._voices[voice_mode] = voices
+        self._fetched_at[voice_mode] = time.monotonic()
+        return voices
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Cached list sizes and ages for diagnostics."""
+        now = time.monotonic()
+        return {
+            "fetches": self.fetches,
+            "modes": {
+                mode: {
+                    "voices": len(voices),
+                    "age_seconds": round(now - self._fetched_at[mode]),
+                }
+                for mode, voices in self._voices.items()
+            },
+        }
+
+
+def get_voice_catalogue(hass: HomeAssistant, server_url: str) -> VoiceCatalogue:
+    """Get or create the voice catalogue for a server URL."""
+    catalogues: dict[str, VoiceCatalogue] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        "voice_catalogues", {}
+    )
+    if server_url not in catalogues:
+        catalogues[server_url] = VoiceCatalogue(hass, server_url)
+    return catalogues[server_url]
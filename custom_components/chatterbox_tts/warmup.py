@@ -0,0 +1,175 @@
+"""Server warm-up and cold-start tracking for Chatterbox TTS."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import DEFAULT_FAIRNESS_WINDOW, DOMAIN, PRIORITY_BULK
+from .metrics import get_server_metrics
+from .scheduler import get_scheduler
+from .server import get_circuit_breaker, get_model_state, get_server_session
+
+_LOGGER = logging.getLogger(__name__)
+
+# Throwaway text synthesised to warm a freshly loaded model
+WARM_UP_TEXT = "Ready."
+_WARM_UP_TIMEOUT = aiohttp.ClientTimeout(total=60)
+
+READINESS_COLD = "cold"
+READINESS_WARMING = "warming"
+READINESS_READY = "ready"
+
+SIGNAL_WARM_UP_UPDATED = f"{DOMAIN}_warm_up_updated_{{}}"
+
+
+class ServerWarmUp:
+    """Tracks whether a server's loaded model has synthesised since it was loaded.
+
+    The server is cold after a Home Assistant start and after every swap. A
+    warm-up runs one short synthesis at bulk priority, and only while the
+    server is otherwise idle, since real traffic warms it just as well. The
+    first real request after each cold start is timed, split by whether a
+    warm-up ran before it.
+    """
+
+    def __init__(self, hass: HomeAssistant, server_url: str) -> None:
+        self.hass = hass
+        self.server_url = server_url
+        # Model the readiness applies to; None until known
+        self.model: str | None = None
+        self.readiness = READINESS_COLD
+        self.warm_ups = 0
+        self.last_warm_up_seconds: float | None = None
+        self._warmed_by_warm_up = False
+        self._awaiting_first_request = True
+        # Warm-up payloads per model and config entry, registered by entities
+        # that enable warm-up
+        self._payloads: dict[str, dict[str, dict[str, Any]]] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def readiness_for(self, model: str) -> str:
+        """Readiness of ``model`` on this server."""
+        return self.readiness if self.model == model else READINESS_COLD
+
+    @callback
+    def async_register(self, entry_id: str, model: str, payload: dict[str, Any] | None) -> None:
+        """Set or remove (``None``) an entity's payload for warming ``model``."""
+        payloads = self._payloads.setdefault(model, {})
+        if payload is None:
+            payloads.pop(entry_id, None)
+            if not payloads:
+                del self._payloads[model]
+        else:
+            payloads[entry_id] = payload
+
+    @callback
+    def async_mark_cold(self, model: str | None) -> None:
+        """Record that ``model`` was just loaded, and warm it if registered."""
+        self.model = model
+        self._warmed_by_warm_up = False
+        self._awaiting_first_request = True
+        self._set_readiness(READINESS_COLD)
+        if model is not None:
+            self.async_start(model)
+
+    @callback
+    def async_record_request(self, model: str, seconds: float) -> None:
+        """Record a completed real request, timing it if it was the first since a cold start."""
+        if self._awaiting_first_request:
+            warmed = self._warmed_by_warm_up and self.model == model
+            get_server_metrics(self.hass, self.server_url).record_first_request(seconds, warmed)
+            self._awaiting_first_request = False
+        self.model = model
+        self._set_readiness(READINESS_READY)
+
+    @callback
+    def async_start(self, model: str) -> asyncio.Task | None:
+        """Warm ``model`` in the background unless it is ready or already warming."""
+        if model not in self._payloads or self.readiness_for(model) == READINESS_READY:
+            return None
+        if (task := self._tasks.get(model)) is None:
+            task = self.hass.async_create_background_task(
+                self._async_warm_up(model), f"chatterbox_tts warm-up {self.server_url}"
+            )
+            self._tasks[model] = task
+            task.add_done_callback(lambda _task: self._tasks.pop(model, None))
+        return task
+
+    async def _async_warm_up(self, model: str) -> None:
+        if not get_circuit_breaker(self.hass, self.server_url).allows_requests:
+            return
+        scheduler = get_scheduler(self.hass, self.server_url)
+        await scheduler.run(
+            model, lambda: self._async_run(model), DEFAULT_FAIRNESS_WINDOW, PRIORITY_BULK
+        )
+
+    async def _async_run(self, model: str) -> None:
+        """Synthesise the warm-up text if the model is loaded and the server idle."""
+        scheduler = get_scheduler(self.hass, self.server_url)
+        if scheduler.load > 1 or self.readiness_for(model) == READINESS_READY:
+            return
+        if not get_model_state(self.hass, self.server_url).is_current(model):
+            _LOGGER.debug("Not warming %s: %r is not loaded", self.server_url, model)
+            return
+        if not (payloads := self._payloads.get(model)):
+            return
+        payload = next(iter(payloads.values()))
+        self.model = model
+        self._set_readiness(READINESS_WARMING)
+        session = get_server_session(self.hass, self.server_url)
+        started = time.monotonic()
+        try:
+            async with session.post(
+                f"{self.server_url}/tts", json=payload, timeout=_WARM_UP_TIMEOUT
+            ) as resp:
+                await resp.read()
+                status = resp.status
+        except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+            _LOGGER.debug("Warm-up of %r on %s failed: %s", model, self.server_url, err)
+            status = None
+        if status != 200:
+            if status is not None:
+                _LOGGER.debug("Warm-up of %r on %s returned status %s", model, self.server_url, status)
+            self._set_readiness(READINESS_COLD)
+            return
+        self.warm_ups += 1
+        self.last_warm_up_seconds = round(time.monotonic() - started, 3)
+        self._warmed_by_warm_up = True
+        _LOGGER.debug(
+            "Warmed %r on %s in %.2f s", model, self.server_url, self.last_warm_up_seconds
+        )
+        self._set_readiness(READINESS_READY)
+
+    @callback
+    def _set_readiness(self, readiness: str) -> None:
+        if readiness != self.readiness:
+            self.readiness = readiness
+            async_dispatcher_send(self.hass, SIGNAL_WARM_UP_UPDATED.format(self.server_url))
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Readiness and warm-up counters for diagnostics."""
+        return {
+            "model": self.model,
+            "readiness": self.readiness,
+            "warm_ups": self.warm_ups,
+            "last_warm_up_seconds": self.last_warm_up_seconds,
+            "registered_models": sorted(self._payloads),
+        }
+
+
+def get_warm_up(hass: HomeAssistant, server_url: str) -> ServerWarmUp:
+    """Get or create the warm-up state for a server URL."""
+    warm_ups: dict[str, ServerWarmUp] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        "server_warm_ups", {}
+    )
+    if server_url not in warm_ups:
+        warm_ups[server_url] = ServerWarmUp(hass, server_url)
+    return warm_ups[server_url]
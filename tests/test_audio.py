@@ -0,0 +1,147 @@
+"""Tests for MP3 and WAV joining and silence trimming."""
+from __future__ import annotations
+
+from array import array
+import math
+import sys
+
+from custom_components.chatterbox_tts.audio import (
+    _mp3_frame_length,
+    _mp3_frame_silent,
+    _mp3_side_info,
+    _wav_chunks,
+    _wav_file,
+    join_audio,
+    trim_silence,
+)
+
+# MPEG-1 Layer III, 128 kbit/s, 44.1 kHz, mono, no CRC: 417-byte frames
+_HEADER = b"\xff\xfb\x90\xc4"
+_FRAME_BYTES = 417
+_SIDE_INFO_BYTES = 17
+_ID3 = b"ID3\x04\x00\x00\x00\x00\x00\x05title"
+_RATE = 24000
+
+
+def _frame(audible_granules: int = 0, main_data_begin: int = 0) -> bytes:
+    """A mono frame with the first ``audible_granules`` granules carrying spectrum."""
+    side = main_data_begin << (_SIDE_INFO_BYTES * 8 - 9)
+    for granule in range(audible_granules):
+        # part2_3_length and big_values of each 59-bit granule after the
+        # 18 bits of main_data_begin, private bits and scfsi
+        position = 18 + granule * 59
+        side |= 2000 << (_SIDE_INFO_BYTES * 8 - position - 12)
+        side |= 200 << (_SIDE_INFO_BYTES * 8 - position - 21)
+    body = bytes(_FRAME_BYTES - 4 - _SIDE_INFO_BYTES)
+    return _HEADER + side.to_bytes(_SIDE_INFO_BYTES, "big") + body
+
+
+def _xing_frame() -> bytes:
+    frame = bytearray(_frame())
+    frame[4 + _SIDE_INFO_BYTES:4 + _SIDE_INFO_BYTES + 4] = b"Xing"
+    return bytes(frame)
+
+
+def _frames(data: bytes) -> list[bytes]:
+    """Split MP3 data into frames, failing on anything that isn't one."""
+    frames = []
+    position = 0
+    while position < len(data):
+        length = _mp3_frame_length(data[position:position + 4])
+        assert length is not None, f"no frame at byte {position}"
+        frames.append(data[position:position + length])
+        position += length
+    return frames
+
+
+def _wav(left: list[int], right: list[int]) -> bytes:
+    """A 16-bit stereo WAV clip from per-channel samples."""
+    samples = array("h", (value for pair in zip(left, right) for value in pair))
+    if sys.byteorder == "big":
+        samples.byteswap()
+    fmt = (
+        (1).to_bytes(2, "little") + (2).to_bytes(2, "little")
+        + _RATE.to_bytes(4, "little") + (_RATE * 4).to_bytes(4, "little")
+        + (4).to_bytes(2, "little") + (16).to_bytes(2, "little")
+    )
+    return _wav_file(fmt, samples.tobytes())
+
+
+def test_mp3_frame_silence_follows_side_info() -> None:
+    assert _mp3_frame_silent(_frame())
+    assert not _mp3_frame_silent(_frame(audible_granules=2))
+    # One audible granule is enough to keep the frame
+    assert not _mp3_frame_silent(_frame(audible_granules=1))
+    assert _mp3_side_info(_frame(main_data_begin=300))[3] == 300
+
+
+def test_mp3_trim_keeps_padding_frames() -> None:
+    frames = [_frame()] * 20 + [_frame(2)] * 10 + [_frame()] * 20
+    trimmed = trim_silence("mp3", b"".join(frames))
+    # 40 ms of padding is two 26 ms frames at each end
+    assert trimmed == b"".join(frames[18:32])
+
+
+def test_mp3_trim_keeps_bit_reservoir_of_first_audible_frame() -> None:
+    audible = [_frame(2)] * 10
+    frames = [_frame()] * 20 + audible + [_frame()] * 20
+    assert trim_silence("mp3", b"".join(frames), padding=0) == b"".join(audible)
+    # Main data starting 300 bytes back reaches into the frame before, so
+    # that frame stays even without padding
+    frames[20] = _frame(2, main_data_begin=300)
+    assert trim_silence("mp3", b"".join(frames), padding=0) == b"".join(frames[19:30])
+
+
+def test_mp3_trim_drops_tags_and_leaves_silent_clip_alone() -> None:
+    frames = [_frame()] * 20 + [_frame(2)] * 10 + [_frame()] * 20
+    trimmed = trim_silence("mp3", _ID3 + _xing_frame() + b"".join(frames))
+    assert trimmed == b"".join(frames[18:32])
+    silent = _ID3 + b"".join([_frame()] * 20)
+    assert trim_silence("mp3", silent) == silent
+
+
+def test_wav_trim_lands_on_block_boundaries() -> None:
+    lead, speech, tail = int(0.3 * _RATE) + 7, int(0.5 * _RATE), int(0.3 * _RATE) + 3
+    # Only the left channel carries the tone, so a cut between the samples
+    # of one block would swap the channels of everything after it
+    left = [0] * lead + [
+        int(9000 * math.sin(2 * math.pi * 220 * i / _RATE)) for i in range(speech)
+    ] + [0] * tail
+    right = [0] * len(left)
+    clip = _wav(left, right)
+    trimmed = trim_silence("wav", clip)
+    assert trimmed != clip
+    original = _wav_chunks(clip)[b"data"]
+    chunks = _wav_chunks(trimmed)
+    assert chunks[b"fmt "] == _wav_chunks(clip)[b"fmt "]
+    pcm = chunks[b"data"]
+    assert len(pcm) % 4 == 0
+    assert original.find(pcm) % 4 == 0
+    # The right channel of the kept audio is still silent
+    samples = array("h", pcm)
+    if sys.byteorder == "big":
+        samples.byteswap()
+    assert not any(samples[1::2])
+    assert any(samples[0::2])
+    # Padding and whole 10 ms windows are kept around the tone
+    assert len(samples) // 2 >= speech + 2 * int(0.04 * _RATE)
+
+
+def test_join_mp3_keeps_one_stream_without_inner_xing_frames() -> None:
+    clip = _ID3 + _xing_frame() + b"".join([_frame(2)] * 5)
+    joined = join_audio("mp3", [clip, clip, clip], gap=0.08)
+    assert b"ID3" not in joined
+    assert b"Xing" not in joined and b"Info" not in joined
+    frames = _frames(joined)
+    # Three clips of five frames with two three-frame gaps between them
+    assert len(frames) == 3 * 5 + 2 * 3
+    assert all(frame[:3] == _HEADER[:3] for frame in frames)
+
+
+def test_join_wav_writes_a_single_header() -> None:
+    clip = _wav([1000] * 100, [1000] * 100)
+    joined = join_audio("wav", [clip, clip], gap=0.01)
+    assert joined.count(b"RIFF") == 1
+    assert joined.count(b"fmt ") == 1
+    pcm = _wav_chunks(joined)[b"data"]
+    assert len(pcm) == 2 * 100 * 4 + int(0.01 * _RATE) * 4
@@ -0,0 +1,269 @@
+"""Tests for the model-aware request scheduler."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.chatterbox_tts.const import (
+    PRIORITY_BULK,
+    PRIORITY_NORMAL,
+    PRIORITY_URGENT,
+)
+from custom_components.chatterbox_tts.scheduler import JobSuperseded, ModelScheduler
+
+
+class _Server:
+    """Runs labelled jobs through a scheduler and records their start order."""
+
+    def __init__(self, scheduler: ModelScheduler) -> None:
+        self.scheduler = scheduler
+        self.started: list[str] = []
+        self.running = 0
+        self.max_running = 0
+        self._gates: dict[str, asyncio.Event] = {}
+
+    def submit(
+        self,
+        label: str,
+        model: str,
+        priority: str = PRIORITY_NORMAL,
+        window: float = 30.0,
+        tag: str | None = None,
+    ) -> asyncio.Task:
+        gate = self._gates[label] = asyncio.Event()
+
+        async def job() -> str:
+            self.started.append(label)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            try:
+                await gate.wait()
+            finally:
+                self.running -= 1
+            return label
+
+        return asyncio.create_task(self.scheduler.run(model, job, window, priority, tag))
+
+    def finish(self, label: str) -> None:
+        self._gates[label].set()
+
+    def finish_all(self) -> None:
+        for gate in self._gates.values():
+            gate.set()
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_batches_queued_jobs_by_active_model() -> None:
+    async def scenario() -> None:
+        server = _Server(ModelScheduler("http://test"))
+        server.scheduler.set_limit("entity", 1)
+        tasks = [server.submit("A1", "a")]
+        await _settle()
+        tasks += [server.submit("B1", "b"), server.submit("A2", "a")]
+        await _settle()
+        server.finish_all()
+        await asyncio.gather(*tasks)
+        assert server.started == ["A1", "A2", "B1"]
+        assert server.scheduler.swaps == 1
+        assert server.scheduler.swaps_avoided == 1
+
+    asyncio.run(scenario())
+
+
+def test_starving_bulk_job_does_not_jump_urgent_active_job() -> None:
+    async def scenario() -> None:
+        server = _Server(ModelScheduler("http://test"))
+        server.scheduler.set_limit("entity", 1)
+        tasks = [server.submit("A1", "a")]
+        await _settle()
+        tasks.append(server.submit("Bbulk", "b", PRIORITY_BULK, window=0))
+        await _settle()
+        tasks.append(server.submit("Aurgent", "a", PRIORITY_URGENT))
+        await _settle()
+        server.finish_all()
+        await asyncio.gather(*tasks)
+        assert server.started == ["A1", "Aurgent", "Bbulk"]
+        assert server.scheduler.swaps == 1
+
+    asyncio.run(scenario())
+
+
+def test_fairness_window_stops_active_model_admissions() -> None:
+    async def scenario() -> None:
+        server = _Server(ModelScheduler("http://test"))
+        server.scheduler.set_limit("entity", 1)
+        tasks = [server.submit("A1", "a")]
+        await _settle()
+        tasks.append(server.submit("B1", "b", window=0.05))
+        tasks.append(server.submit("A2", "a"))
+        await _settle()
+        # Within B1's window the active model keeps the server
+        server.finish("A1")
+        await _settle()
+        assert server.started == ["A1", "A2"]
+        await asyncio.sleep(0.1)
+        tasks.append(server.submit("A3", "a"))
+        server.finish("A2")
+        await _settle()
+        assert server.started == ["A1", "A2", "B1"]
+        server.finish_all()
+        await asyncio.gather(*tasks)
+        assert server.started == ["A1", "A2", "B1", "A3"]
+
+    asyncio.run(scenario())
+
+
+def test_urgent_job_for_other_model_skips_fairness_window() -> None:
+    async def scenario() -> None:
+        server = _Server(ModelScheduler("http://test"))
+        server.scheduler.set_limit("entity", 1)
+        tasks = [server.submit("A1", "a")]
+        await _settle()
+        tasks.append(server.submit("A2", "a"))
+        tasks.append(server.submit("Burgent", "b", PRIORITY_URGENT))
+        await _settle()
+        server.finish_all()
+        await asyncio.gather(*tasks)
+        assert server.started == ["A1", "Burgent", "A2"]
+
+    asyncio.run(scenario())
+
+
+def test_priority_order_within_batch() -> None:
+    async def scenario() -> None:
+        server = _Server(ModelScheduler("http://test"))
+        server.scheduler.set_limit("entity", 1)
+        tasks = [server.submit("first", "a")]
+        await _settle()
+        tasks.append(server.submit("bulk", "a", PRIORITY_BULK))
+        tasks.append(server.submit("normal", "a"))
+        tasks.append(server.submit("urgent", "a", PRIORITY_URGENT))
+        await _settle()
+        server.finish_all()
+        await asyncio.gather(*tasks)
+        assert server.started == ["first", "urgent", "normal", "bulk"]
+
+    asyncio.run(scenario())
+
+
+def test_concurrency_limit_strictest_entity_wins() -> None:
+    async def scenario() -> None:
+        server = _Server(ModelScheduler("http://test"))
+        server.scheduler.set_limit("loose", 4)
+        server.scheduler.set_limit("strict", 2)
+        assert server.scheduler.limit == 2
+        tasks = [server.submit(f"A{i}", "a") for i in range(5)]
+        await _settle()
+        assert server.running == 2
+        assert server.scheduler.queue_depth == 3
+        server.finish_all()
+        await asyncio.gather(*tasks)
+        assert server.max_running == 2
+        server.scheduler.set_limit("strict", None)
+        assert server.scheduler.limit == 4
+
+    asyncio.run(scenario())
+
+
+def test_no_limit_admits_whole_batch() -> None:
+    async def scenario() -> None:
+        server = _Server(ModelScheduler("http://test"))
+        tasks = [server.submit(f"A{i}", "a") for i in range(4)]
+        await _settle()
+        assert server.running == 4
+        server.finish_all()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(scenario())
+
+
+def test_supersede_drops_queued_jobs_with_tag() -> None:
+    async def scenario() -> None:
+        server = _Server(ModelScheduler("http://test"))
+        server.scheduler.set_limit("entity", 1)
+        running = server.submit("A1", "a", tag="doorbell")
+        await _settle()
+        queued = server.submit("A2", "a", tag="doorbell")
+        other = server.submit("A3", "a", tag="weather")
+        await _settle()
+        assert server.scheduler.supersede("doorbell") == 1
+        with pytest.raises(JobSuperseded):
+            await queued
+        server.finish_all()
+        assert await running == "A1"
+        assert await other == "A3"
+        assert server.started == ["A1", "A3"]
+        assert server.scheduler.superseded == 1
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_queued_job_leaves_queue() -> None:
+    async def scenario() -> None:
+        server = _Server(ModelScheduler("http://test"))
+        server.scheduler.set_limit("entity", 1)
+        running = server.submit("A1", "a")
+        await _settle()
+        queued = server.submit("A2", "a")
+        await _settle()
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        assert server.scheduler.queue_depth == 0
+        assert server.scheduler.cancelled == 1
+        server.finish("A1")
+        await running
+        # The slot is free again
+        later = server.submit("A3", "a")
+        await _settle()
+        assert server.started == ["A1", "A3"]
+        server.finish_all()
+        await later
+        assert server.scheduler.load == 0
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_running_job_releases_slot() -> None:
+    async def scenario() -> None:
+        server = _Server(ModelScheduler("http://test"))
+        server.scheduler.set_limit("entity", 1)
+        running = server.submit("A1", "a")
+        await _settle()
+        queued = server.submit("A2", "a")
+        await _settle()
+        running.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await running
+        await _settle()
+        assert server.started == ["A1", "A2"]
+        server.finish_all()
+        await queued
+
+    asyncio.run(scenario())
+
+
+def test_superseded_then_cancelled_job_holds_no_slot() -> None:
+    async def scenario() -> None:
+        server = _Server(ModelScheduler("http://test"))
+        server.scheduler.set_limit("entity", 1)
+        running = server.submit("A1", "a")
+        await _settle()
+        queued = server.submit("A2", "a", tag="doorbell")
+        await _settle()
+        server.scheduler.supersede("doorbell")
+        # Cancelled before it wakes up to see JobSuperseded
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        assert server.scheduler.load == 1
+        server.finish("A1")
+        await running
+        assert server.scheduler.load == 0
+
+    asyncio.run(scenario())